@@ -0,0 +1,58 @@
+"""Memory per entity and construction time of the domain entities.
+
+    python -m benchmarks.bench_entities --count 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime
+from src.domain.entities.event import Event
+from src.domain.entities.participant import Participant
+from src.domain.entities.attendance import Attendance
+
+
+def _measure(build, count: int):
+    gc.collect()
+    start = time.perf_counter()
+    items = [build(i) for i in range(count)]
+    elapsed = time.perf_counter() - start
+    del items
+    
+    gc.collect()
+    tracemalloc.start()
+    items = [build(i) for i in range(count)]
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Subtract the list holding the items
+    per_item = (current - items.__sizeof__()) / count
+    del items
+    return elapsed, per_item
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000000)
+    args = parser.parse_args()
+    
+    stamp = datetime(2030, 1, 1)
+    cases = (
+        ("Event()", lambda i: Event("Name", "Description", stamp, "Hall", 100, event_id=i)),
+        ("Event.rehydrate", lambda i: Event.rehydrate(i, "Name", "Description", stamp, "Hall", 100, stamp, stamp)),
+        ("Participant()", lambda i: Participant("Name", "name@example.com", "123", participant_id=i)),
+        ("Participant.rehydrate", lambda i: Participant.rehydrate(i, "Name", "name@example.com", "123", stamp, stamp)),
+        ("Attendance()", lambda i: Attendance(1, 1, attendance_id=i)),
+        ("Attendance.rehydrate", lambda i: Attendance.rehydrate(i, 1, 1, stamp, stamp)),
+    )
+    
+    print(f"{'constructor':<24}{'ns/object':>12}{'bytes/object':>14}{'MiB per 1M':>12}")
+    for name, build in cases:
+        elapsed, per_item = _measure(build, args.count)
+        print(
+            f"{name:<24}{elapsed / args.count * 1e9:>12.0f}{per_item:>14.0f}"
+            f"{per_item * 1_000_000 / 1024 / 1024:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
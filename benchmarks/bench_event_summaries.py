@@ -0,0 +1,87 @@
+"""Compare full event listings against summary projections.
+
+Reports bytes read from the database, cached payload size and response size
+for ``GET /events/`` with and without ``?detail=true``.
+
+    python -m benchmarks.bench_event_summaries --events 5000 --description-size 2000
+"""
+import argparse
+import json
+import os
+from datetime import datetime, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models.event_model import EventModel
+from src.infrastructure.database.models.participant_model import ParticipantModel  # noqa: F401
+from src.infrastructure.database.models.attendance_model import AttendanceModel  # noqa: F401
+from src.infrastructure.database.repositories.event_repository_impl import EventRepositoryImpl
+from src.application.dtos.event_dto import EventResponseDTO, EventSummaryDTO
+
+
+def _row_bytes(values) -> int:
+    return sum(len(str(v).encode()) for v in values if v is not None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--description-size", type=int, default=2000)
+    args = parser.parse_args()
+    
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    
+    date = datetime.utcnow() + timedelta(days=30)
+    session.bulk_insert_mappings(EventModel, [
+        {
+            "name": f"Event {i}",
+            "description": "x" * args.description_size,
+            "date": date,
+            "location": f"Hall {i % 50}",
+            "capacity": 100
+        }
+        for i in range(args.events)
+    ])
+    session.commit()
+    
+    repo = EventRepositoryImpl(session)
+    full = repo.get_all()
+    summaries = repo.get_all_summaries()
+    
+    full_db = sum(
+        _row_bytes((e.id, e.name, e.description, e.date, e.location, e.capacity, e.created_at, e.updated_at))
+        for e in full
+    )
+    summary_db = sum(_row_bytes((e.id, e.name, e.date, e.location, e.capacity)) for e in summaries)
+    
+    full_cache = len(json.dumps([
+        {"id": e.id, "name": e.name, "description": e.description, "date": e.date.isoformat(),
+         "location": e.location, "capacity": e.capacity}
+        for e in full
+    ]))
+    summary_cache = len(json.dumps([
+        {"id": e.id, "name": e.name, "date": e.date.isoformat(), "location": e.location, "capacity": e.capacity}
+        for e in summaries
+    ]))
+    
+    full_response = sum(len(EventResponseDTO.model_validate(e).model_dump_json()) for e in full)
+    summary_response = sum(len(EventSummaryDTO.model_validate(e).model_dump_json()) for e in summaries)
+    
+    print(f"{'metric':<16}{'full':>14}{'summary':>14}{'ratio':>8}")
+    for name, before, after in (
+        ("db bytes", full_db, summary_db),
+        ("cache bytes", full_cache, summary_cache),
+        ("response bytes", full_response, summary_response),
+    ):
+        print(f"{name:<16}{before:>14,}{after:>14,}{after / before:>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""List serialization throughput: validated DTOs + response_model vs model_construct + orjson.
+
+    python -m benchmarks.bench_list_serialization --items 10000 --repeat 5
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from typing import List
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from src.application.dtos.event_dto import EventResponseDTO
+from src.application.dtos.participant_dto import ParticipantResponseDTO
+from src.application.responses import list_response
+from src.domain.entities.event import Event
+from src.domain.entities.participant import Participant
+
+
+def _validated_path(dto_cls, field, build_kwargs, entities) -> bytes:
+    """Previous behaviour: validated DTOs, re-validated and encoded by FastAPI"""
+    dtos = [dto_cls(**build_kwargs(e)) for e in entities]
+    content = asyncio.run(serialize_response(field=field, response_content=dtos))
+    return JSONResponse(content).body
+
+
+def _fast_path(dto_cls, build_kwargs, entities) -> bytes:
+    return list_response(dto_cls.model_construct(**build_kwargs(e)) for e in entities).body
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    stamp = datetime(2030, 1, 1, 10, 0, 0)
+    events = [Event.rehydrate(i, f"Event {i}", "Description " * 20, stamp, "Hall", 100, stamp, stamp) for i in range(args.items)]
+    participants = [Participant.rehydrate(i, f"P {i}", f"p{i}@example.com", "123", stamp, stamp) for i in range(args.items)]
+    
+    def event_kwargs(e):
+        return dict(id=e.id, name=e.name, description=e.description, date=e.date, location=e.location,
+                    capacity=e.capacity, created_at=e.created_at, updated_at=e.updated_at)
+    
+    def participant_kwargs(p):
+        return dict(id=p.id, name=p.name, email=p.email, phone=p.phone, created_at=p.created_at, updated_at=p.updated_at)
+    
+    print(f"{'endpoint':<22}{'validated items/s':>20}{'orjson items/s':>18}{'speedup':>9}")
+    for name, dto_cls, kwargs, entities in (
+        ("get_all_events", EventResponseDTO, event_kwargs, events),
+        ("get_all_participants", ParticipantResponseDTO, participant_kwargs, participants),
+    ):
+        field = create_response_field(name="response", type_=List[dto_cls])
+        assert _validated_path(dto_cls, field, kwargs, entities) == _fast_path(dto_cls, kwargs, entities)
+        slow = _best(lambda: _validated_path(dto_cls, field, kwargs, entities), args.repeat)
+        fast = _best(lambda: _fast_path(dto_cls, kwargs, entities), args.repeat)
+        print(f"{name:<22}{args.items / slow:>20,.0f}{args.items / fast:>18,.0f}{slow / fast:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Per-request overhead of the rate limiting middleware and of one limiter hit.
+
+    python -m benchmarks.bench_rate_limit --requests 20000 --clients 1000
+
+Uses the in-process fallback unless Redis is reachable with the configured
+settings (then the Redis pipeline round trip dominates the numbers).
+"""
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi import FastAPI
+from src.api.rate_limit import RateLimitMiddleware
+from src.infrastructure.cache.cache_client import CacheClient
+from src.infrastructure.cache.rate_limiter import SlidingWindowRateLimiter
+
+
+def _app(with_limiter: bool, limiter: SlidingWindowRateLimiter):
+    app = FastAPI()
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    if with_limiter:
+        app.add_middleware(RateLimitMiddleware, limiter=limiter, default="1000000/60", routes={})
+    return app
+
+
+async def _drive(app, requests: int, clients: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for i in range(requests):
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "path": "/ping", "raw_path": b"/ping", "root_path": "", "query_string": b"",
+            "headers": [], "client": (f"10.0.{i % clients // 256}.{i % 256}", 1234), "server": ("bench", 80)
+        }
+        await app(scope, receive, send)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=1000)
+    args = parser.parse_args()
+
+    cache = CacheClient()
+    limiter = SlidingWindowRateLimiter(cache)
+    backend = "redis" if cache.use_redis else "in-process"
+
+    start = time.perf_counter()
+    for i in range(args.requests):
+        limiter.hit(f"default:client-{i % args.clients}", 1000000, 60)
+    hit_us = (time.perf_counter() - start) / args.requests * 1e6
+
+    for with_limiter in (False, True):
+        # Warm up routing and the limiter's first windows
+        asyncio.run(_drive(_app(with_limiter, limiter), 500, args.clients))
+    baseline = asyncio.run(_drive(_app(False, limiter), args.requests, args.clients))
+    limited = asyncio.run(_drive(_app(True, limiter), args.requests, args.clients))
+
+    print(f"backend: {backend}")
+    print(f"limiter.hit                 {hit_us:8.1f} us")
+    print(f"request without middleware  {baseline / args.requests * 1e6:8.1f} us")
+    print(f"request with middleware     {limited / args.requests * 1e6:8.1f} us")
+    print(f"middleware overhead         {(limited - baseline) / args.requests * 1e6:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
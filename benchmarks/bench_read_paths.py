@@ -0,0 +1,88 @@
+"""Rows-per-second of the ORM read path against the Core fast path.
+
+    python -m benchmarks.bench_read_paths --rows 50000 --repeat 5
+"""
+import argparse
+import os
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models.event_model import EventModel
+from src.infrastructure.database.models.participant_model import ParticipantModel
+from src.infrastructure.database.models.attendance_model import AttendanceModel
+from src.infrastructure.database.repositories.event_repository_impl import EventRepositoryImpl
+from src.infrastructure.database.repositories.attendance_repository_impl import AttendanceRepositoryImpl
+
+
+def _best_rate(fn, rows: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return rows / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    
+    session = SessionLocal()
+    date = datetime.utcnow() + timedelta(days=30)
+    session.bulk_insert_mappings(EventModel, [
+        {"name": f"Event {i}", "description": "Description", "date": date, "location": "Hall", "capacity": 100}
+        for i in range(args.rows)
+    ])
+    session.bulk_insert_mappings(ParticipantModel, [
+        {"name": f"P {i}", "email": f"p{i}@example.com", "phone": "123"}
+        for i in range(args.rows)
+    ])
+    session.bulk_insert_mappings(AttendanceModel, [
+        {"event_id": 1, "participant_id": i + 1} for i in range(args.rows)
+    ])
+    session.commit()
+    session.close()
+    
+    def orm_events():
+        with SessionLocal() as db:
+            repo = EventRepositoryImpl(db)
+            [repo._to_entity(m) for m in db.query(EventModel).all()]
+    
+    def core_events():
+        with SessionLocal() as db:
+            EventRepositoryImpl(db).get_all()
+    
+    def orm_attendances():
+        with SessionLocal() as db:
+            repo = AttendanceRepositoryImpl(db)
+            [repo._to_entity(m) for m in db.query(AttendanceModel).filter(AttendanceModel.event_id == 1).all()]
+    
+    def core_attendances():
+        with SessionLocal() as db:
+            AttendanceRepositoryImpl(db).get_by_event(1)
+    
+    print(f"{'path':<36}{'orm rows/s':>14}{'core rows/s':>14}{'speedup':>9}")
+    for name, orm, core in (
+        ("EventRepository.get_all", orm_events, core_events),
+        ("AttendanceRepository.get_by_event", orm_attendances, core_attendances),
+    ):
+        orm_rate = _best_rate(orm, args.rows, args.repeat)
+        core_rate = _best_rate(core, args.rows, args.repeat)
+        print(f"{name:<36}{orm_rate:>14,.0f}{core_rate:>14,.0f}{core_rate / orm_rate:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Payload size and encode/decode time of JSON vs MessagePack vs columnar MessagePack.
+
+    python -m benchmarks.bench_response_formats --items 10000 --repeat 5
+"""
+import argparse
+import gzip
+import json
+import time
+from datetime import datetime
+import msgpack
+from src.application.dtos.attendance_dto import RosterEntryDTO
+from src.application.dtos.event_dto import EventResponseDTO
+from src.application.responses import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    COLUMNAR_MEDIA_TYPE,
+    list_response
+)
+
+FORMATS = (
+    ("json", JSON_MEDIA_TYPE, json.loads),
+    ("msgpack", MSGPACK_MEDIA_TYPE, msgpack.unpackb),
+    ("columnar", COLUMNAR_MEDIA_TYPE, msgpack.unpackb),
+)
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    stamp = datetime(2030, 1, 1, 10, 0, 0)
+    events = [
+        EventResponseDTO.model_construct(
+            id=i, name=f"Event {i}", description="Description " * 20, date=stamp,
+            location="Hall", capacity=100, created_at=stamp, updated_at=stamp
+        )
+        for i in range(args.items)
+    ]
+    roster = [
+        RosterEntryDTO.model_construct(
+            attendance_id=i, event_id=1, participant_id=i, registration_date=stamp,
+            participant_name=f"P {i}", participant_email=f"p{i}@example.com", participant_phone="123"
+        )
+        for i in range(args.items)
+    ]
+
+    print(f"{'payload':<10}{'format':<10}{'bytes':>12}{'gzip bytes':>12}{'encode ms':>11}{'decode ms':>11}")
+    for name, dtos in (("events", events), ("roster", roster)):
+        for label, media_type, decode in FORMATS:
+            body = list_response(dtos, media_type).body
+            encode = _best(lambda: list_response(dtos, media_type), args.repeat)
+            decode_time = _best(lambda: decode(body), args.repeat)
+            print(
+                f"{name:<10}{label:<10}{len(body):>12,}{len(gzip.compress(body, 6)):>12,}"
+                f"{encode * 1000:>11.1f}{decode_time * 1000:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Full event rows vs ?fields=id,name,date: query + serialization time and payload size.
+
+    python -m benchmarks.bench_sparse_fields --rows 20000 --description-bytes 2000 --repeat 5
+"""
+import argparse
+import os
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.application.dtos.event_dto import EventResponseDTO
+from src.application.responses import list_response, rows_response
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models.event_model import EventModel
+from src.infrastructure.database.models.participant_model import ParticipantModel  # noqa: F401 (FK target)
+from src.infrastructure.database.repositories.event_repository_impl import EventRepositoryImpl
+
+FIELDS = ["id", "name", "date"]
+
+
+def _best(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--description-bytes", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    session = SessionLocal()
+    date = datetime.utcnow() + timedelta(days=30)
+    session.bulk_insert_mappings(EventModel, [
+        {"name": f"Event {i}", "description": "x" * args.description_bytes, "date": date,
+         "location": "Hall", "capacity": 100}
+        for i in range(args.rows)
+    ])
+    session.commit()
+    session.close()
+
+    def full():
+        with SessionLocal() as db:
+            events = EventRepositoryImpl(db).get_all()
+            return list_response([
+                EventResponseDTO.model_construct(
+                    id=e.id, name=e.name, description=e.description, date=e.date, location=e.location,
+                    capacity=e.capacity, created_at=e.created_at, updated_at=e.updated_at
+                )
+                for e in events
+            ]).body
+
+    def sparse():
+        with SessionLocal() as db:
+            return rows_response(EventRepositoryImpl(db).get_all_fields(FIELDS)).body
+
+    print(f"{'path':<26}{'ms':>10}{'payload bytes':>16}")
+    full_time, full_body = _best(full, args.repeat)
+    sparse_time, sparse_body = _best(sparse, args.repeat)
+    print(f"{'full rows':<26}{full_time * 1000:>10.1f}{len(full_body):>16,}")
+    print(f"{'fields=' + ','.join(FIELDS):<26}{sparse_time * 1000:>10.1f}{len(sparse_body):>16,}")
+    print(f"speedup {full_time / sparse_time:.2f}x, payload {len(full_body) / len(sparse_body):.1f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
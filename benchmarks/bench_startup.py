@@ -0,0 +1,58 @@
+"""Time to import src.api.main and to reach readiness (startup handlers done).
+
+Each sample runs in a fresh interpreter against a file-backed SQLite database
+so the schema check sees an already-initialized schema, as on a rolling restart.
+
+    python -m benchmarks.bench_startup --samples 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROBE = """
+import json, time
+start = time.perf_counter()
+import src.api.main as main
+imported = time.perf_counter()
+main.on_startup()
+ready = time.perf_counter()
+print("RESULT " + json.dumps({"import": imported - start, "ready": ready - start}))
+"""
+
+
+def _sample(env: dict) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    line = next(line for line in output.splitlines() if line.startswith("RESULT "))
+    return json.loads(line[len("RESULT "):])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{tmp}/startup.db",
+            SECRET_KEY="benchmark",
+            DEBUG="false"
+        )
+        _sample(dict(env, SCHEMA_CHECK="create"))  # warm up and create the schema
+        
+        print(f"{'schema_check':<14}{'import ms':>12}{'ready ms':>12}")
+        for mode in ("create", "fingerprint", "skip"):
+            samples = [_sample(dict(env, SCHEMA_CHECK=mode)) for _ in range(args.samples)]
+            imported = statistics.median(s["import"] for s in samples) * 1000
+            ready = statistics.median(s["ready"] for s in samples) * 1000
+            print(f"{mode:<14}{imported:>12.1f}{ready:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""End-to-end load test: scenario mixes against the app in-process or over HTTP.
+
+    python -m benchmarks.load_test --scenario mixed --duration 30 --concurrency 16 --output run.json
+    python -m benchmarks.load_test --target http://127.0.0.1:8000 --scenario rush
+    python -m benchmarks.load_test --compare before.json after.json
+
+In-process runs drive the ASGI app through httpx (sync routes still run in
+the thread pool) on a throwaway SQLite file, or on --database-url (e.g. a
+local Postgres), with the in-process cache standing in for Redis and rate
+limiting off. Against --target, start the server with RATE_LIMIT_ENABLED=false
+and DEBUG=false. Every run seeds its own events, participants and
+registrations through the API, so it never depends on existing data.
+
+Reports p50/p95/p99 latency and throughput per endpoint; --output saves
+them as JSON and --compare prints the change between two saved runs.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+Operation = Callable[[httpx.AsyncClient, random.Random, "Dataset"], Awaitable[Tuple[str, httpx.Response]]]
+
+
+class Dataset:
+    """IDs of the rows seeded for this run"""
+
+    def __init__(self, event_ids: List[int], participant_ids: List[int], popular_event_ids: List[int]):
+        self.event_ids = event_ids
+        self.participant_ids = participant_ids
+        self.popular_event_ids = popular_event_ids
+
+
+async def browse_events(client, rng, data):
+    choice = rng.random()
+    if choice < 0.4:
+        return "GET /events/", await client.get("/events/")
+    if choice < 0.6:
+        return "GET /events/?fields=", await client.get("/events/", params={"fields": "id,name,date"})
+    return "GET /events/{id}", await client.get(f"/events/{rng.choice(data.event_ids)}")
+
+
+async def view_stats(client, rng, data):
+    return "GET /events/{id}/statistics", await client.get(f"/events/{rng.choice(data.event_ids)}/statistics")
+
+
+async def register(client, rng, data):
+    # Most registrations go to a few popular events, which fill up
+    event_id = rng.choice(data.popular_event_ids) if rng.random() < 0.8 else rng.choice(data.event_ids)
+    payload = {"event_id": event_id, "participant_id": rng.choice(data.participant_ids)}
+    return "POST /attendances/", await client.post("/attendances/", json=payload)
+
+
+async def export_roster(client, rng, data):
+    event_id = rng.choice(data.popular_event_ids)
+    return "GET /attendances/event/{id}/export", await client.get(f"/attendances/event/{event_id}/export")
+
+
+async def view_roster(client, rng, data):
+    event_id = rng.choice(data.popular_event_ids)
+    return "GET /attendances/event/{id}/roster", await client.get(f"/attendances/event/{event_id}/roster")
+
+
+# Scenario name -> weighted operations
+SCENARIOS: Dict[str, List[Tuple[Operation, int]]] = {
+    "browse": [(browse_events, 1)],
+    "stats": [(view_stats, 1)],
+    "rush": [(register, 9), (view_stats, 1)],
+    "export": [(export_roster, 3), (view_roster, 1)],
+    "mixed": [(browse_events, 60), (view_stats, 15), (register, 15), (view_roster, 7), (export_roster, 3)]
+}
+
+
+async def seed(client: httpx.AsyncClient, events: int, participants: int, rng: random.Random) -> Dataset:
+    """Create this run's events, participants and some registrations through the API"""
+    run_tag = f"{int(time.time())}{rng.randrange(1000):03d}"
+    date = (datetime.utcnow() + timedelta(days=90)).isoformat()
+    event_ids = []
+    for i in range(events):
+        response = await client.post("/events/", json={
+            "name": f"Load {run_tag} #{i}", "description": "Load test event", "date": date,
+            "location": "Hall", "capacity": 50 if i < 10 else 500
+        })
+        response.raise_for_status()
+        event_ids.append(response.json()["id"])
+
+    csv = "name,email,phone\n" + "".join(
+        f"Load {i},load-{run_tag}-{i}@example.com,555{i:07d}\n" for i in range(participants)
+    )
+    response = await client.post("/participants/import", content=csv, headers={"Content-Type": "text/csv"})
+    response.raise_for_status()
+    import_id = response.json()["import_id"]
+    while True:
+        status = (await client.get(f"/participants/import/{import_id}")).json()
+        if status["status"] in ("completed", "failed"):
+            break
+        await asyncio.sleep(0.2)
+    if status["status"] == "failed":
+        raise RuntimeError(f"Participant import {import_id} failed: {status['errors'][:3]}")
+    listed = (await client.get("/participants/", params={"fields": "id,email"})).json()
+    participant_ids = [row["id"] for row in listed if f"-{run_tag}-" in row["email"]]
+    if not participant_ids:
+        raise RuntimeError(f"Participant import {import_id} left no participants to register: {status['errors'][:3]}")
+
+    # Half-full rosters on the popular events, so exports have rows
+    popular_event_ids = event_ids[:10]
+    for event_id in popular_event_ids:
+        for participant_id in rng.sample(participant_ids, min(25, len(participant_ids))):
+            await client.post("/attendances/", json={"event_id": event_id, "participant_id": participant_id})
+    return Dataset(event_ids, participant_ids, popular_event_ids)
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    data: Dataset,
+    scenario: str,
+    concurrency: int,
+    duration: float,
+    seed_value: int
+) -> Tuple[Dict[str, dict], float]:
+    """Run the scenario's operation mix with concurrent workers; returns raw samples per endpoint"""
+    operations, weights = zip(*SCENARIOS[scenario])
+    samples: Dict[str, dict] = {}
+    deadline = time.perf_counter() + duration
+
+    async def worker(worker_id: int):
+        rng = random.Random(seed_value * 1000 + worker_id)
+        while time.perf_counter() < deadline:
+            operation = rng.choices(operations, weights)[0]
+            start = time.perf_counter()
+            try:
+                endpoint, response = await operation(client, rng, data)
+                status = response.status_code
+            except httpx.HTTPError:
+                endpoint, status = operation.__name__, 599
+            elapsed = time.perf_counter() - start
+            entry = samples.setdefault(endpoint, {"latencies": [], "statuses": {}})
+            entry["latencies"].append(elapsed)
+            entry["statuses"][str(status)] = entry["statuses"].get(str(status), 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return samples, time.perf_counter() - start
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples: Dict[str, dict], elapsed: float) -> Dict[str, dict]:
+    """Latency percentiles (ms), throughput and status counts per endpoint, plus a total"""
+    summary = {}
+    everything = []
+    for endpoint, entry in sorted(samples.items()):
+        latencies = sorted(entry["latencies"])
+        everything.extend(latencies)
+        summary[endpoint] = _stats(latencies, elapsed, entry["statuses"])
+    statuses: Dict[str, int] = {}
+    for entry in samples.values():
+        for status, count in entry["statuses"].items():
+            statuses[status] = statuses.get(status, 0) + count
+    summary["total"] = _stats(sorted(everything), elapsed, statuses)
+    return summary
+
+
+def _stats(latencies: List[float], elapsed: float, statuses: Dict[str, int]) -> dict:
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        "server_errors": sum(count for status, count in statuses.items() if status.startswith("5")),
+        "statuses": dict(sorted(statuses.items()))
+    }
+
+
+def print_summary(summary: Dict[str, dict]) -> None:
+    print(f"{'endpoint':<38}{'reqs':>8}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'5xx':>6}")
+    for endpoint, stats in summary.items():
+        print(
+            f"{endpoint:<38}{stats['requests']:>8}{stats['throughput_rps']:>9.1f}{stats['p50_ms']:>9.2f}"
+            f"{stats['p95_ms']:>9.2f}{stats['p99_ms']:>9.2f}{stats['server_errors']:>6}"
+        )
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Print the per-endpoint change between two saved runs"""
+    with open(before_path) as before_file, open(after_path) as after_file:
+        before, after = json.load(before_file)["endpoints"], json.load(after_file)["endpoints"]
+    print(f"{'endpoint':<38}{'p50':>10}{'p95':>10}{'p99':>10}{'req/s':>10}")
+    for endpoint in after:
+        if endpoint not in before:
+            continue
+        changes = [
+            _change(before[endpoint][key], after[endpoint][key])
+            for key in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps")
+        ]
+        print(f"{endpoint:<38}" + "".join(f"{change:>10}" for change in changes))
+
+
+def _change(old: float, new: float) -> str:
+    return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _in_process_client(database_url: Optional[str]) -> httpx.AsyncClient:
+    # Configure before the app (and its settings) are imported
+    os.environ["DATABASE_URL"] = database_url or f"sqlite:///{tempfile.mkdtemp(prefix='eventia-load-')}/load.db"
+    os.environ.setdefault("SECRET_KEY", "load-test")
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+    os.environ["DEBUG"] = "false"
+
+    from src.api.main import app
+    from src.infrastructure.cache.cache_client import cache_client
+    from src.infrastructure.database.connection import init_db
+
+    # The in-process cache stands in for Redis
+    cache_client._connected = True
+    init_db(mode="create")
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://load-test")
+
+
+async def _main(args) -> dict:
+    rng = random.Random(args.seed)
+    if args.target:
+        client = httpx.AsyncClient(base_url=args.target, timeout=30)
+    else:
+        client = _in_process_client(args.database_url)
+    async with client:
+        print(f"Seeding {args.events} events and {args.participants} participants...")
+        data = await seed(client, args.events, args.participants, rng)
+        print(f"Running '{args.scenario}' for {args.duration}s with {args.concurrency} workers...")
+        samples, elapsed = await run_scenario(
+            client, data, args.scenario, args.concurrency, args.duration, args.seed
+        )
+    return {
+        "scenario": args.scenario,
+        "target": args.target or "in-process",
+        "database": None if args.target else os.environ["DATABASE_URL"].split(":", 1)[0],
+        "concurrency": args.concurrency,
+        "duration_seconds": round(elapsed, 2),
+        "seed": args.seed,
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "started_at": datetime.utcnow().isoformat(),
+        "endpoints": summarize(samples, elapsed)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="mixed")
+    parser.add_argument("--target", help="Base URL of a running server (default: in-process)")
+    parser.add_argument("--database-url", help="In-process database (default: a temporary SQLite file)")
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--participants", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Save the results as JSON")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Compare two saved runs and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = asyncio.run(_main(args))
+    print_summary(results["endpoints"])
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+        print(f"Saved {args.output}")
+    if results["endpoints"]["total"]["server_errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
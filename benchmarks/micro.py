@@ -0,0 +1,298 @@
+"""Microbenchmarks of the service-layer hot paths, compared against stored baselines.
+
+    python -m benchmarks.micro                      # run and show the change against the baseline
+    python -m benchmarks.micro --check              # exit 1 if anything regressed past its threshold
+    python -m benchmarks.micro --save               # record a new baseline
+    python -m benchmarks.micro --filter get_event   # only matching benchmarks
+
+Runs offline: in-memory SQLite and the in-process cache, no Redis. Each
+benchmark reports the best per-call time over --repeat rounds, the figure
+least disturbed by other load on the box. Baselines are machine-specific;
+re-record them (--save) on the machine that runs --check.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timedelta
+from itertools import count
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.application.dtos.event_dto import EventResponseDTO
+from src.application.responses import list_response
+from src.domain.entities.attendance import Attendance
+from src.domain.services.attendance_service import AttendanceService
+from src.domain.services.event_service import EventService
+from src.infrastructure.cache.cache_client import cache_client
+from src.infrastructure.cache.codec import decode_row, encode_row
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models.attendance_model import AttendanceModel
+from src.infrastructure.database.models.event_model import EventModel
+from src.infrastructure.database.models.participant_model import ParticipantModel
+from src.infrastructure.database.repositories.attendance_repository_impl import AttendanceRepositoryImpl
+from src.infrastructure.database.repositories.event_repository_impl import EventRepositoryImpl
+from src.infrastructure.database.repositories.participant_repository_impl import ParticipantRepositoryImpl
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "micro.json")
+
+# Allowed slowdown against the baseline before --check fails, in percent
+DEFAULT_THRESHOLD_PCT = 25.0
+
+LIST_SIZE = 10000
+PARTICIPANTS = 5000
+
+
+class Benchmark:
+    """One timed function: setup() builds the callable so only the call itself is timed"""
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[["Fixture"], Callable[[], object]],
+        number: Optional[int] = None,
+        threshold_pct: Optional[float] = None
+    ):
+        self.name = name
+        self.setup = setup
+        # Calls per round; calibrated to ~0.1s when None
+        self.number = number
+        self.threshold_pct = threshold_pct
+
+
+class Fixture:
+    """Seeded in-memory database shared by the benchmarks"""
+
+    def __init__(self):
+        self.engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False)
+        date = datetime.utcnow() + timedelta(days=60)
+        with self.SessionLocal() as session:
+            session.bulk_insert_mappings(EventModel, [
+                {"name": f"Event {i}", "description": "Description " * 10, "date": date,
+                 "location": "Hall", "capacity": 1000000}
+                for i in range(LIST_SIZE)
+            ])
+            session.bulk_insert_mappings(ParticipantModel, [
+                {"name": f"P {i}", "email": f"p{i}@example.com", "phone": "123"}
+                for i in range(PARTICIPANTS)
+            ])
+            session.commit()
+        # The cache is a module singleton; never try to reach Redis
+        cache_client._connected = True
+        self._next_participant = count(1)
+
+    def event_service(self) -> EventService:
+        session = self.SessionLocal()
+        return EventService(EventRepositoryImpl(session), SqlAlchemyUnitOfWork(session))
+
+    def attendance_service(self) -> AttendanceService:
+        session = self.SessionLocal()
+        return AttendanceService(
+            AttendanceRepositoryImpl(session), EventRepositoryImpl(session),
+            ParticipantRepositoryImpl(session), SqlAlchemyUnitOfWork(session)
+        )
+
+    def next_participant_id(self) -> int:
+        return next(self._next_participant)
+
+
+def _get_event_hit(fixture: Fixture):
+    service = fixture.event_service()
+    service.get_event_by_id(1)
+    return lambda: service.get_event_by_id(1)
+
+
+def _get_event_miss(fixture: Fixture):
+    def call():
+        # A new request: fresh session, nothing cached
+        cache_client.delete("event:2")
+        service = fixture.event_service()
+        service.get_event_by_id(2)
+        service.event_repository.db.close()
+    return call
+
+
+def _get_all_events_cached(fixture: Fixture):
+    service = fixture.event_service()
+    service.get_all_events()
+    return service.get_all_events
+
+
+def _register_attendance(fixture: Fixture):
+    def call():
+        service = fixture.attendance_service()
+        service.register_attendance(Attendance(event_id=1, participant_id=fixture.next_participant_id()))
+        service.attendance_repository.db.close()
+    return call
+
+
+def _event_to_entity(fixture: Fixture):
+    session = fixture.SessionLocal()
+    repository = EventRepositoryImpl(session)
+    models = session.query(EventModel).limit(1000).all()
+    return lambda: [repository._to_entity(model) for model in models]
+
+
+def _participant_to_entity(fixture: Fixture):
+    session = fixture.SessionLocal()
+    repository = ParticipantRepositoryImpl(session)
+    models = session.query(ParticipantModel).limit(1000).all()
+    return lambda: [repository._to_entity(model) for model in models]
+
+
+def _attendance_to_entity(fixture: Fixture):
+    stamp = datetime.utcnow()
+    repository = AttendanceRepositoryImpl(fixture.SessionLocal())
+    models = [
+        AttendanceModel(id=i, event_id=1, participant_id=i, registration_date=stamp, created_at=stamp)
+        for i in range(1, 1001)
+    ]
+    return lambda: [repository._to_entity(model) for model in models]
+
+
+def _codec_rows(fixture: Fixture) -> List[dict]:
+    stamp = datetime.utcnow()
+    return [
+        {"id": i, "event_id": 1, "participant_id": i, "registration_date": stamp, "created_at": stamp}
+        for i in range(1000)
+    ]
+
+
+def _codec_encode(fixture: Fixture):
+    rows = _codec_rows(fixture)
+    return lambda: [encode_row(row) for row in rows]
+
+
+def _codec_decode(fixture: Fixture):
+    encoded = [encode_row(row) for row in _codec_rows(fixture)]
+    # decode_row works in place, so every call decodes fresh copies
+    return lambda: [decode_row(dict(row), ("registration_date", "created_at")) for row in encoded]
+
+
+def _dto_list_response(fixture: Fixture):
+    events = fixture.event_service().get_all_events()[:1000]
+
+    def call():
+        return list_response([
+            EventResponseDTO.model_construct(
+                id=e.id, name=e.name, description=e.description, date=e.date, location=e.location,
+                capacity=e.capacity, created_at=e.created_at, updated_at=e.updated_at
+            )
+            for e in events
+        ]).body
+    return call
+
+
+def _dto_validate(fixture: Fixture):
+    events = fixture.event_service().get_all_events()[:1000]
+    return lambda: [EventResponseDTO.model_validate(e, from_attributes=True).model_dump_json() for e in events]
+
+
+BENCHMARKS = [
+    Benchmark("EventService.get_event_by_id[cache hit]", _get_event_hit),
+    Benchmark("EventService.get_event_by_id[cache miss]", _get_event_miss, threshold_pct=40.0),
+    Benchmark(f"EventService.get_all_events[cached {LIST_SIZE}]", _get_all_events_cached, number=5),
+    Benchmark("AttendanceService.register_attendance", _register_attendance, number=200, threshold_pct=40.0),
+    Benchmark("EventRepositoryImpl._to_entity[x1000]", _event_to_entity),
+    Benchmark("ParticipantRepositoryImpl._to_entity[x1000]", _participant_to_entity),
+    Benchmark("AttendanceRepositoryImpl._to_entity[x1000]", _attendance_to_entity),
+    Benchmark("codec.encode_row[x1000]", _codec_encode),
+    Benchmark("codec.decode_row[x1000]", _codec_decode),
+    Benchmark("list_response[1000 EventResponseDTO]", _dto_list_response),
+    Benchmark("EventResponseDTO.model_validate+dump[x1000]", _dto_validate),
+]
+
+
+def _calibrate(fn: Callable[[], object], target_seconds: float = 0.1) -> int:
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - start >= target_seconds or number >= 1000000:
+            return number
+        number *= 2
+
+
+def run(benchmark: Benchmark, fixture: Fixture, repeat: int) -> float:
+    """Best per-call time in microseconds"""
+    fn = benchmark.setup(fixture)
+    fn()  # warm up
+    number = benchmark.number or _calibrate(fn)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1e6
+
+
+def _load_baseline(path: str) -> Dict[str, dict]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as baseline_file:
+        return json.load(baseline_file)["benchmarks"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="Exit 1 when a benchmark regressed past its threshold")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PCT,
+                        help="Allowed slowdown in percent for benchmarks without their own threshold")
+    args = parser.parse_args()
+
+    baseline = _load_baseline(args.baseline)
+    selected = [b for b in BENCHMARKS if not args.filter or args.filter in b.name]
+    fixture = Fixture()
+
+    results, regressions = {}, []
+    print(f"{'benchmark':<48}{'us/call':>12}{'baseline':>12}{'change':>9}")
+    for benchmark in selected:
+        us = run(benchmark, fixture, args.repeat)
+        results[benchmark.name] = {"us_per_call": round(us, 3)}
+        line = f"{benchmark.name:<48}{us:>12.2f}"
+        previous = baseline.get(benchmark.name)
+        if previous:
+            change = (us - previous["us_per_call"]) / previous["us_per_call"] * 100
+            threshold = benchmark.threshold_pct if benchmark.threshold_pct is not None else args.threshold
+            line += f"{previous['us_per_call']:>12.2f}{change:>+8.1f}%"
+            if change > threshold:
+                regressions.append(f"{benchmark.name}: {change:+.1f}% (threshold {threshold:.0f}%)")
+                line += "  REGRESSED"
+        print(line)
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as baseline_file:
+            json.dump({
+                "recorded_at": datetime.utcnow().isoformat(),
+                "python": platform.python_version(),
+                "machine": f"{platform.system()} {platform.machine()}",
+                "benchmarks": {**baseline, **results}
+            }, baseline_file, indent=2)
+            baseline_file.write("\n")
+        print(f"Saved baseline to {args.baseline}")
+
+    if regressions:
+        print("\nRegressions:\n  " + "\n  ".join(regressions))
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
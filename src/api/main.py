@@ -1,8 +1,18 @@
-from fastapi import FastAPI
+import os
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from src.application.routes import event_routes, participant_routes, attendance_routes
-from src.infrastructure.database.connection import init_db
+from fastapi.middleware.gzip import GZipMiddleware
+from src.api.metrics import MetricsMiddleware
+from src.api.profiling import RequestProfilerMiddleware
+from src.api.rate_limit import RateLimitMiddleware
+from src.api.server_timing import ServerTimingMiddleware
+from src.application.responses import TimedJSONResponse
+from src.application.routes import admin_routes, event_routes, participant_routes, attendance_routes
+from src.infrastructure.database.connection import engine, init_db
 from src.infrastructure.cache.cache_client import cache_client
+from src.infrastructure.config.settings import settings
+from src.infrastructure.telemetry.metrics import instrument_pool, mark_process_dead, render_metrics
+from src.infrastructure.telemetry.slow_queries import slow_query_log
 
 # Create FastAPI application
 app = FastAPI(
@@ -10,9 +20,13 @@ app = FastAPI(
     description="Event management system with participants and attendance tracking",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=TimedJSONResponse
 )
 
+# Per-client rate limits (inside CORS so 429 responses still carry CORS headers)
+app.add_middleware(RateLimitMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -22,10 +36,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses above the size threshold for clients sending Accept-Encoding: gzip
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.gzip_minimum_size,
+    compresslevel=settings.gzip_compress_level
+)
+
+# Single-request profiling (X-Profile: 1 with the admin token); not installed unless enabled
+if settings.request_profiling_enabled:
+    app.add_middleware(RequestProfilerMiddleware)
+
+# Request counts, latency and in-flight requests per route (429s included)
+app.add_middleware(MetricsMiddleware)
+
+# Outermost, so sampled timings cover every other middleware too
+app.add_middleware(ServerTimingMiddleware)
+
+# Database pool usage for /metrics
+instrument_pool(engine)
+
+# Opt-in slow query log (see /admin/slow-queries)
+if settings.slow_query_log_enabled:
+    slow_query_log.install(engine)
+
 # Include routers
 app.include_router(event_routes.router)
 app.include_router(participant_routes.router)
 app.include_router(attendance_routes.router)
+app.include_router(admin_routes.router)
 
 
 @app.on_event("startup")
@@ -35,17 +74,14 @@ def on_startup():
     print("🚀 Starting Eventia Core API...")
     print("=" * 50)
     
-    print("\n📊 Initializing database...")
-    init_db()
-    print("✅ Database initialized successfully!")
-    
-    # Check cache connection
-    print("\n💾 Checking cache system...")
-    if cache_client.ping():
-        print("✅ Redis cache connected successfully!")
+    print("\n📊 Checking database schema...")
+    if init_db():
+        print("✅ Database schema applied!")
     else:
-        print("⚠️  Redis not available - Using in-memory cache")
-        print("   (This is fine for development)")
+        print("✅ Database schema up to date (skipped create_all)")
+    
+    # Redis is connected lazily on first use, so startup never blocks on it
+    print("\n💾 Cache connects on first use (see /health)")
     
     print("\n" + "=" * 50)
     print("✅ Application ready!")
@@ -71,4 +107,27 @@ def health_check():
         "status": "healthy",
         "database": "connected",
         "cache": redis_status
-    }
\ No newline at end of file
+    }
+
+@app.on_event("shutdown")
+def on_shutdown():
+    """Drop this worker's live gauges from the merged metrics"""
+    mark_process_dead(os.getpid())
+
+
+def metrics():
+    """Prometheus metrics (merged across workers in multiprocess mode)"""
+    # Connects the cache on first use so the Redis gauge is set
+    cache_client.ping()
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
+
+
+def mount_metrics(target: FastAPI, enabled: bool = settings.metrics_enabled) -> None:
+    """Serve /metrics (unauthenticated, so only while metrics are enabled)"""
+    if enabled:
+        target.add_api_route("/metrics", metrics, include_in_schema=False)
+
+
+mount_metrics(app)
+
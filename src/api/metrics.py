@@ -0,0 +1,44 @@
+from time import perf_counter
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.infrastructure.config.settings import settings
+from src.infrastructure.telemetry.metrics import http_request_duration, http_requests, http_requests_in_progress
+
+# Label for requests no route matched, so unknown paths can't blow up cardinality
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request counts, latency and in-flight requests per route template.
+
+    Routes are labelled by their template (/events/{event_id}), read from
+    the scope after routing, never by the raw path.
+    """
+
+    def __init__(self, app: ASGIApp, enabled: bool = settings.metrics_enabled):
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.enabled:
+            return await self.app(scope, receive, send)
+
+        status_code = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - start
+            http_requests_in_progress.dec()
+            route = scope.get("route")
+            template = getattr(route, "path", UNMATCHED_ROUTE)
+            method = scope["method"]
+            http_request_duration.labels(method, template).observe(elapsed)
+            http_requests.labels(method, template, str(status_code)).inc()
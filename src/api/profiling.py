@@ -0,0 +1,45 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.application.admin import ADMIN_TOKEN_HEADER, is_admin_token
+from src.infrastructure.config.settings import settings
+from src.infrastructure.telemetry.profiler import ProfileStore, profile_store, request_profiler
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+class RequestProfilerMiddleware:
+    """ASGI middleware profiling single requests sent with X-Profile: 1 and a valid X-Admin-Token.
+
+    The response gets an X-Profile-Id header; the collapsed stacks are read
+    from GET /admin/profiles/{id}. Only added to the app when
+    settings.request_profiling_enabled is set, so it costs nothing otherwise.
+    """
+
+    def __init__(self, app: ASGIApp, store: ProfileStore = profile_store):
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        headers = Headers(scope=scope)
+        if headers.get(PROFILE_HEADER) != "1" or not is_admin_token(headers.get(ADMIN_TOKEN_HEADER)):
+            return await self.app(scope, receive, send)
+
+        profiler = request_profiler(settings.profile_interval_ms / 1000).start()
+        profile_id = None
+
+        async def send_with_profile(message: Message):
+            nonlocal profile_id
+            if message["type"] == "http.response.start":
+                # Bodies are rendered before the response starts
+                profile_id = self.store.add(profiler.stop())
+                MutableHeaders(scope=message).append(PROFILE_ID_HEADER, profile_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            if profile_id is None:
+                profiler.stop()
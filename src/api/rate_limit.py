@@ -0,0 +1,78 @@
+import re
+from fnmatch import translate
+from typing import Dict, List, Optional, Pattern, Tuple
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
+from src.infrastructure.cache.rate_limiter import SlidingWindowRateLimiter
+from src.infrastructure.config.settings import settings
+
+Rate = Optional[Tuple[int, int]]
+
+
+def parse_rate(rate: str) -> Rate:
+    """Parse "<requests>/<seconds>" (or "unlimited" -> None)"""
+    if rate.strip().lower() == "unlimited":
+        return None
+    requests, _, seconds = rate.partition("/")
+    return int(requests), int(seconds)
+
+
+class RateLimitMiddleware:
+    """ASGI middleware answering 429 with Retry-After to clients over their per-route rate.
+
+    Plain ASGI rather than BaseHTTPMiddleware so allowed requests only pay
+    for one rule lookup and one counter round trip.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Optional[SlidingWindowRateLimiter] = None,
+        default: str = settings.rate_limit_default,
+        routes: Dict[str, str] = settings.rate_limit_routes,
+        enabled: bool = settings.rate_limit_enabled
+    ):
+        self.app = app
+        self.limiter = limiter or SlidingWindowRateLimiter()
+        self.enabled = enabled
+        self.default = parse_rate(default)
+        self.rules: List[Tuple[str, Pattern, Rate]] = [
+            (pattern, re.compile(translate(pattern)), parse_rate(rate))
+            for pattern, rate in routes.items()
+        ]
+
+    def rule_for(self, method: str, path: str) -> Tuple[str, Rate]:
+        """Bucket name and rate of the first matching route rule (or the default)"""
+        route = f"{method} {path}"
+        for pattern, regex, rate in self.rules:
+            if regex.match(route):
+                return pattern, rate
+        return "default", self.default
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.enabled:
+            return await self.app(scope, receive, send)
+
+        bucket, rate = self.rule_for(scope["method"], scope["path"])
+        if rate is None:
+            return await self.app(scope, receive, send)
+
+        limit, window_seconds = rate
+        client = scope["client"][0] if scope.get("client") else "unknown"
+        key = f"{bucket}:{client}"
+        if self.limiter.cache.use_redis:
+            # Keep blocking Redis I/O off the event loop
+            allowed, retry_after = await run_in_threadpool(self.limiter.hit, key, limit, window_seconds)
+        else:
+            allowed, retry_after = self.limiter.hit(key, limit, window_seconds)
+
+        if allowed:
+            return await self.app(scope, receive, send)
+
+        response = JSONResponse(
+            {"detail": f"Rate limit exceeded, retry in {retry_after} seconds"},
+            status_code=429,
+            headers={"Retry-After": str(retry_after), "X-RateLimit-Limit": f"{limit}/{window_seconds}s"}
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,85 @@
+import json
+import logging
+import random
+from typing import List
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.infrastructure.config.settings import settings
+from src.infrastructure.telemetry.request_timings import RequestTimings, collect_timings
+
+logger = logging.getLogger("eventia.timing")
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+def server_timing_header(timings: RequestTimings, total_seconds: float) -> str:
+    """Format the timings as a Server-Timing header value"""
+    metrics: List[str] = []
+    if timings.queue_seconds is not None:
+        metrics.append(f"queue;dur={_ms(timings.queue_seconds)}")
+    metrics.append(f'db;dur={_ms(timings.sql_seconds)};desc="{timings.sql_count} queries"')
+    metrics.append(
+        f'cache;dur={_ms(timings.cache_seconds)};desc="{timings.cache_calls} calls, {timings.cache_hits} hits"'
+    )
+    metrics.append(f"serialize;dur={_ms(timings.serialize_seconds)}")
+    metrics.append(f"total;dur={_ms(total_seconds)}")
+    return ", ".join(metrics)
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware breaking a sampled share of requests down into DB, cache and serialization time.
+
+    Sampled responses carry a Server-Timing header (shown by browser dev
+    tools) and are logged as one JSON line on the "eventia.timing" logger.
+    Unsampled requests only pay for one random() call; the SQL and cache
+    hooks return right away when no request is being timed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = settings.server_timing_sample_rate,
+        enabled: bool = settings.server_timing_enabled
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.enabled or random.random() >= self.sample_rate:
+            return await self.app(scope, receive, send)
+
+        status_code = None
+        with collect_timings() as timings:
+            async def send_with_timing(message: Message):
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    # Bodies are rendered before the response starts, so this covers them
+                    status_code = message["status"]
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", server_timing_header(timings, timings.elapsed()))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log(scope, status_code, timings)
+
+    def _log(self, scope: Scope, status_code: int, timings: RequestTimings):
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(json.dumps({
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status_code,
+            "total_ms": _ms(timings.elapsed()),
+            "queue_ms": None if timings.queue_seconds is None else _ms(timings.queue_seconds),
+            "db_ms": _ms(timings.sql_seconds),
+            "db_queries": timings.sql_count,
+            "cache_ms": _ms(timings.cache_seconds),
+            "cache_calls": timings.cache_calls,
+            "cache_hits": timings.cache_hits,
+            "serialize_ms": _ms(timings.serialize_seconds)
+        }))
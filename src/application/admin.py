@@ -0,0 +1,20 @@
+import secrets
+from typing import Optional
+from fastapi import Header, HTTPException
+from src.infrastructure.config.settings import settings
+
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """Whether the token matches settings.admin_token (never true while it is unset)"""
+    return bool(settings.admin_token and token and secrets.compare_digest(token, settings.admin_token))
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Dependency guarding /admin routes with settings.admin_token"""
+    if not settings.admin_token:
+        # Admin endpoints are off unless a token is configured
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
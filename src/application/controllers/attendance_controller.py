@@ -1,18 +1,79 @@
-from typing import List
-from fastapi import HTTPException
+import csv
+import io
+import json
+from typing import Iterable, Iterator, Optional
+from fastapi import HTTPException, Response
+from fastapi.responses import StreamingResponse
 from src.domain.services.attendance_service import AttendanceService
 from src.domain.entities.attendance import Attendance
+from src.domain.entities.roster_entry import RosterEntry
+from src.application.responses import JSON_MEDIA_TYPE, list_response, parse_fields, rows_response
 from src.application.dtos.attendance_dto import (
     AttendanceCreateDTO,
-    AttendanceResponseDTO
+    AttendanceResponseDTO,
+    RosterEntryDTO,
+    ScheduleEntryDTO
 )
 
 
+ROSTER_EXPORT_FIELDS = [
+    "attendance_id",
+    "event_id",
+    "participant_id",
+    "registration_date",
+    "participant_name",
+    "participant_email",
+    "participant_phone"
+]
+EXPORT_CHUNK_ROWS = 1000
+
+
+def _roster_rows(roster: Iterable[RosterEntry]) -> Iterator[list]:
+    """Flatten roster entries into export rows"""
+    for r in roster:
+        yield [
+            r.attendance_id,
+            r.event_id,
+            r.participant_id,
+            r.registration_date.isoformat(),
+            r.participant_name,
+            r.participant_email,
+            r.participant_phone
+        ]
+
+
+def _csv_chunks(roster: Iterable[RosterEntry]) -> Iterator[str]:
+    """Encode a roster as CSV, EXPORT_CHUNK_ROWS rows per chunk"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(ROSTER_EXPORT_FIELDS)
+    for i, row in enumerate(_roster_rows(roster), start=1):
+        writer.writerow(row)
+        if i % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson_chunks(roster: Iterable[RosterEntry]) -> Iterator[str]:
+    """Encode a roster as newline-delimited JSON, EXPORT_CHUNK_ROWS rows per chunk"""
+    lines = []
+    for row in _roster_rows(roster):
+        lines.append(json.dumps(dict(zip(ROSTER_EXPORT_FIELDS, row))))
+        if len(lines) == EXPORT_CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
 class AttendanceController:
     """Controller for handling attendance-related HTTP requests"""
     
-    def __init__(self, attendance_service: AttendanceService):
+    def __init__(self, attendance_service: AttendanceService, media_type: str = JSON_MEDIA_TYPE):
         self.attendance_service = attendance_service
+        self.media_type = media_type
     
     def register_attendance(self, attendance_dto: AttendanceCreateDTO) -> AttendanceResponseDTO:
         """Register a participant to an event"""
@@ -58,37 +119,125 @@ class AttendanceController:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     
-    def get_attendances_by_event(self, event_id: int) -> List[AttendanceResponseDTO]:
-        """Get all attendances for a specific event"""
+    def get_attendances_by_event(self, event_id: int, fields: Optional[str] = None) -> Response:
+        """Get all attendances for a specific event, optionally only the requested fields"""
+        field_names = parse_fields(fields, AttendanceResponseDTO)
         try:
-            attendances = self.attendance_service.get_attendances_by_event(event_id)
-            return [
-                AttendanceResponseDTO(
-                    id=a.id,
-                    event_id=a.event_id,
-                    participant_id=a.participant_id,
-                    registration_date=a.registration_date,
-                    created_at=a.created_at
+            if field_names:
+                return rows_response(
+                    self.attendance_service.get_attendance_fields_by_event(event_id, field_names),
+                    self.media_type
                 )
-                for a in attendances
-            ]
+            
+            attendances = self.attendance_service.get_attendances_by_event(event_id)
+            return list_response(
+                [
+                    AttendanceResponseDTO.model_construct(
+                        id=a.id,
+                        event_id=a.event_id,
+                        participant_id=a.participant_id,
+                        registration_date=a.registration_date,
+                        created_at=a.created_at
+                    )
+                    for a in attendances
+                ],
+                self.media_type
+            )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     
-    def get_attendances_by_participant(self, participant_id: int) -> List[AttendanceResponseDTO]:
-        """Get all attendances for a specific participant"""
+    def get_attendances_by_participant(self, participant_id: int, fields: Optional[str] = None) -> Response:
+        """Get all attendances for a specific participant, optionally only the requested fields"""
+        field_names = parse_fields(fields, AttendanceResponseDTO)
         try:
-            attendances = self.attendance_service.get_attendances_by_participant(participant_id)
-            return [
-                AttendanceResponseDTO(
-                    id=a.id,
-                    event_id=a.event_id,
-                    participant_id=a.participant_id,
-                    registration_date=a.registration_date,
-                    created_at=a.created_at
+            if field_names:
+                return rows_response(
+                    self.attendance_service.get_attendance_fields_by_participant(participant_id, field_names),
+                    self.media_type
                 )
-                for a in attendances
-            ]
+            
+            attendances = self.attendance_service.get_attendances_by_participant(participant_id)
+            return list_response(
+                [
+                    AttendanceResponseDTO.model_construct(
+                        id=a.id,
+                        event_id=a.event_id,
+                        participant_id=a.participant_id,
+                        registration_date=a.registration_date,
+                        created_at=a.created_at
+                    )
+                    for a in attendances
+                ],
+                self.media_type
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    
+    def get_event_roster(self, event_id: int, skip: int, limit: int) -> Response:
+        """Get a page of an event's attendees with participant details"""
+        try:
+            roster = self.attendance_service.get_event_roster(event_id, skip, limit)
+            return list_response(
+                [
+                    RosterEntryDTO.model_construct(
+                        attendance_id=r.attendance_id,
+                        event_id=r.event_id,
+                        participant_id=r.participant_id,
+                        registration_date=r.registration_date,
+                        participant_name=r.participant_name,
+                        participant_email=r.participant_email,
+                        participant_phone=r.participant_phone
+                    )
+                    for r in roster
+                ],
+                self.media_type
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    
+    def export_event_roster(self, event_id: int, export_format: str) -> StreamingResponse:
+        """Stream an event's roster as CSV or NDJSON"""
+        try:
+            roster = self.attendance_service.stream_event_roster(event_id)
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        if export_format == "csv":
+            content, media_type = _csv_chunks(roster), "text/csv"
+        else:
+            content, media_type = _ndjson_chunks(roster), "application/x-ndjson"
+        
+        return StreamingResponse(
+            content,
+            media_type=media_type,
+            headers={
+                "Content-Disposition": f'attachment; filename="event-{event_id}-roster.{export_format}"'
+            }
+        )
+    
+    def get_participant_schedule(
+        self,
+        participant_id: int,
+        skip: int,
+        limit: int
+    ) -> Response:
+        """Get a page of a participant's events with event details"""
+        try:
+            schedule = self.attendance_service.get_participant_schedule(participant_id, skip, limit)
+            return list_response(
+                [
+                    ScheduleEntryDTO.model_construct(
+                        attendance_id=s.attendance_id,
+                        event_id=s.event_id,
+                        participant_id=s.participant_id,
+                        registration_date=s.registration_date,
+                        event_name=s.event_name,
+                        event_date=s.event_date,
+                        event_location=s.event_location
+                    )
+                    for s in schedule
+                ],
+                self.media_type
+            )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     
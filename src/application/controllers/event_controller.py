@@ -1,11 +1,22 @@
-from typing import List
-from fastapi import HTTPException
+from typing import List, Optional, Union
+from fastapi import HTTPException, Response
 from src.domain.services.event_service import EventService
 from src.domain.entities.event import Event
+from src.application.responses import (
+    JSON_MEDIA_TYPE,
+    batch_response,
+    item_response,
+    list_response,
+    parse_fields,
+    parse_ids,
+    row_response,
+    rows_response
+)
 from src.application.dtos.event_dto import (
     EventCreateDTO,
     EventUpdateDTO,
     EventResponseDTO,
+    EventSummaryDTO,
     EventStatisticsDTO
 )
 
@@ -13,8 +24,9 @@ from src.application.dtos.event_dto import (
 class EventController:
     """Controller for handling event-related HTTP requests"""
     
-    def __init__(self, event_service: EventService):
+    def __init__(self, event_service: EventService, media_type: str = JSON_MEDIA_TYPE):
         self.event_service = event_service
+        self.media_type = media_type
     
     def create_event(self, event_dto: EventCreateDTO) -> EventResponseDTO:
         """Create a new event"""
@@ -47,48 +59,100 @@ class EventController:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     
-    def get_event(self, event_id: int) -> EventResponseDTO:
-        """Get an event by ID"""
+    def get_event(self, event_id: int, fields: Optional[str] = None) -> Union[EventResponseDTO, Response]:
+        """Get an event by ID, optionally only the requested fields"""
+        field_names = parse_fields(fields, EventResponseDTO)
         try:
             event = self.event_service.get_event_by_id(event_id)
             if not event:
                 raise HTTPException(status_code=404, detail=f"Event with id {event_id} not found")
             
-            return EventResponseDTO(
-                id=event.id,
-                name=event.name,
-                description=event.description,
-                date=event.date,
-                location=event.location,
-                capacity=event.capacity,
-                created_at=event.created_at,
-                updated_at=event.updated_at
+            if field_names:
+                return row_response({name: getattr(event, name) for name in field_names}, self.media_type)
+            
+            return item_response(
+                EventResponseDTO(
+                    id=event.id,
+                    name=event.name,
+                    description=event.description,
+                    date=event.date,
+                    location=event.location,
+                    capacity=event.capacity,
+                    created_at=event.created_at,
+                    updated_at=event.updated_at
+                ),
+                self.media_type
             )
         except HTTPException:
             raise
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     
-    def get_all_events(self) -> List[EventResponseDTO]:
-        """Get all events"""
+    def get_all_events(
+        self,
+        detail: bool = False,
+        fields: Optional[str] = None,
+        ids: Optional[str] = None
+    ) -> Response:
+        """Get all events (or those with the given IDs), as summaries unless full details or specific fields are requested"""
+        field_names = parse_fields(fields, EventResponseDTO)
+        event_ids = parse_ids(ids)
         try:
-            events = self.event_service.get_all_events()
-            return [
-                EventResponseDTO(
-                    id=e.id,
-                    name=e.name,
-                    description=e.description,
-                    date=e.date,
-                    location=e.location,
-                    capacity=e.capacity,
-                    created_at=e.created_at,
-                    updated_at=e.updated_at
+            if event_ids:
+                return self._get_events_by_ids(event_ids, field_names or list(EventResponseDTO.model_fields))
+            
+            if field_names:
+                return rows_response(self.event_service.get_all_event_fields(field_names), self.media_type)
+            
+            if not detail:
+                summaries = self.event_service.get_all_event_summaries()
+                return list_response(
+                    [
+                        EventSummaryDTO.model_construct(
+                            id=e.id,
+                            name=e.name,
+                            date=e.date,
+                            location=e.location,
+                            capacity=e.capacity
+                        )
+                        for e in summaries
+                    ],
+                    self.media_type
                 )
-                for e in events
-            ]
+            
+            events = self.event_service.get_all_events()
+            return list_response(
+                [
+                    EventResponseDTO.model_construct(
+                        id=e.id,
+                        name=e.name,
+                        description=e.description,
+                        date=e.date,
+                        location=e.location,
+                        capacity=e.capacity,
+                        created_at=e.created_at,
+                        updated_at=e.updated_at
+                    )
+                    for e in events
+                ],
+                self.media_type
+            )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     
+    def _get_events_by_ids(self, event_ids: List[int], field_names: List[str]) -> Response:
+        """Get events by ID in request order, reporting the IDs not found"""
+        events = self.event_service.get_events_by_ids(event_ids)
+        return batch_response(
+            [
+                {name: getattr(events[event_id], name) for name in field_names}
+                for event_id in event_ids
+                if event_id in events
+            ],
+            [event_id for event_id in event_ids if event_id not in events],
+            self.media_type
+        )
+    
     def update_event(self, event_id: int, event_dto: EventUpdateDTO) -> EventResponseDTO:
         """Update an existing event"""
         try:
@@ -131,11 +195,11 @@ class EventController:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     
-    def get_event_statistics(self, event_id: int) -> EventStatisticsDTO:
+    def get_event_statistics(self, event_id: int) -> Union[EventStatisticsDTO, Response]:
         """Get event statistics"""
         try:
             stats = self.event_service.get_event_statistics(event_id)
-            return EventStatisticsDTO(**stats)
+            return item_response(EventStatisticsDTO(**stats), self.media_type)
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
         except Exception as e:
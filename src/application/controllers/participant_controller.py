@@ -1,7 +1,17 @@
-from typing import List
-from fastapi import HTTPException
+from typing import List, Optional, Union
+from fastapi import HTTPException, Response
 from src.domain.services.participant_service import ParticipantService
 from src.domain.entities.participant import Participant
+from src.application.responses import (
+    JSON_MEDIA_TYPE,
+    batch_response,
+    item_response,
+    list_response,
+    parse_fields,
+    parse_ids,
+    row_response,
+    rows_response
+)
 from src.application.dtos.participant_dto import (
     ParticipantCreateDTO,
     ParticipantUpdateDTO,
@@ -12,8 +22,9 @@ from src.application.dtos.participant_dto import (
 class ParticipantController:
     """Controller for handling participant-related HTTP requests"""
     
-    def __init__(self, participant_service: ParticipantService):
+    def __init__(self, participant_service: ParticipantService, media_type: str = JSON_MEDIA_TYPE):
         self.participant_service = participant_service
+        self.media_type = media_type
     
     def create_participant(self, participant_dto: ParticipantCreateDTO) -> ParticipantResponseDTO:
         """Create a new participant"""
@@ -39,8 +50,13 @@ class ParticipantController:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     
-    def get_participant(self, participant_id: int) -> ParticipantResponseDTO:
-        """Get a participant by ID"""
+    def get_participant(
+        self,
+        participant_id: int,
+        fields: Optional[str] = None
+    ) -> Union[ParticipantResponseDTO, Response]:
+        """Get a participant by ID, optionally only the requested fields"""
+        field_names = parse_fields(fields, ParticipantResponseDTO)
         try:
             participant = self.participant_service.get_participant_by_id(participant_id)
             if not participant:
@@ -49,37 +65,76 @@ class ParticipantController:
                     detail=f"Participant with id {participant_id} not found"
                 )
             
-            return ParticipantResponseDTO(
-                id=participant.id,
-                name=participant.name,
-                email=participant.email,
-                phone=participant.phone,
-                created_at=participant.created_at,
-                updated_at=participant.updated_at
+            if field_names:
+                return row_response(
+                    {name: getattr(participant, name) for name in field_names},
+                    self.media_type
+                )
+            
+            return item_response(
+                ParticipantResponseDTO(
+                    id=participant.id,
+                    name=participant.name,
+                    email=participant.email,
+                    phone=participant.phone,
+                    created_at=participant.created_at,
+                    updated_at=participant.updated_at
+                ),
+                self.media_type
             )
         except HTTPException:
             raise
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     
-    def get_all_participants(self) -> List[ParticipantResponseDTO]:
-        """Get all participants"""
+    def get_all_participants(self, fields: Optional[str] = None, ids: Optional[str] = None) -> Response:
+        """Get all participants (or those with the given IDs), optionally only the requested fields"""
+        field_names = parse_fields(fields, ParticipantResponseDTO)
+        participant_ids = parse_ids(ids)
         try:
-            participants = self.participant_service.get_all_participants()
-            return [
-                ParticipantResponseDTO(
-                    id=p.id,
-                    name=p.name,
-                    email=p.email,
-                    phone=p.phone,
-                    created_at=p.created_at,
-                    updated_at=p.updated_at
+            if participant_ids:
+                return self._get_participants_by_ids(
+                    participant_ids,
+                    field_names or list(ParticipantResponseDTO.model_fields)
+                )
+            
+            if field_names:
+                return rows_response(
+                    self.participant_service.get_all_participant_fields(field_names),
+                    self.media_type
                 )
-                for p in participants
-            ]
+            
+            participants = self.participant_service.get_all_participants()
+            return list_response(
+                [
+                    ParticipantResponseDTO.model_construct(
+                        id=p.id,
+                        name=p.name,
+                        email=p.email,
+                        phone=p.phone,
+                        created_at=p.created_at,
+                        updated_at=p.updated_at
+                    )
+                    for p in participants
+                ],
+                self.media_type
+            )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     
+    def _get_participants_by_ids(self, participant_ids: List[int], field_names: List[str]) -> Response:
+        """Get participants by ID in request order, reporting the IDs not found"""
+        participants = self.participant_service.get_participants_by_ids(participant_ids)
+        return batch_response(
+            [
+                {name: getattr(participants[pid], name) for name in field_names}
+                for pid in participant_ids
+                if pid in participants
+            ],
+            [pid for pid in participant_ids if pid not in participants],
+            self.media_type
+        )
+    
     def update_participant(
         self,
         participant_id: int,
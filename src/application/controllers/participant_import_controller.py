@@ -0,0 +1,56 @@
+import os
+import tempfile
+import uuid
+from typing import Callable, ContextManager
+from fastapi import BackgroundTasks, HTTPException, Request
+from src.domain.services.participant_import_service import ParticipantImportService
+from src.application.dtos.participant_dto import ParticipantImportStatusDTO
+
+
+async def spool_request_body(request: Request) -> str:
+    """Write the request body to a temporary file chunk by chunk and return its path"""
+    fd, path = tempfile.mkstemp(prefix="participants-import-", suffix=".csv")
+    try:
+        with os.fdopen(fd, "wb") as spool:
+            async for chunk in request.stream():
+                spool.write(chunk)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
+class ParticipantImportController:
+    """Controller for handling participant CSV imports"""
+    
+    def __init__(
+        self,
+        import_service: ParticipantImportService,
+        open_background_service: Callable[[], ContextManager[ParticipantImportService]]
+    ):
+        self.import_service = import_service
+        # The request's session is closed once the response is sent; background runs open their own
+        self.open_background_service = open_background_service
+    
+    def start_import(self, path: str, background_tasks: BackgroundTasks) -> ParticipantImportStatusDTO:
+        """Register an import and process the spooled file after the response is sent"""
+        import_id = uuid.uuid4().hex
+        status = self.import_service.create_import(import_id)
+        background_tasks.add_task(self._run_import, import_id, path)
+        return ParticipantImportStatusDTO(**status)
+    
+    def get_import_status(self, import_id: str) -> ParticipantImportStatusDTO:
+        """Get the progress and error report of an import"""
+        status = self.import_service.get_import_status(import_id)
+        if not status:
+            raise HTTPException(status_code=404, detail=f"Import {import_id} not found")
+        return ParticipantImportStatusDTO(**status)
+    
+    def _run_import(self, import_id: str, path: str):
+        """Stream the spooled file through the import pipeline, then remove it"""
+        try:
+            with self.open_background_service() as import_service, \
+                    open(path, newline="", encoding="utf-8-sig") as lines:
+                import_service.run_import(import_id, lines)
+        finally:
+            os.remove(path)
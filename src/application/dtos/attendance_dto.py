@@ -17,4 +17,32 @@ class AttendanceResponseDTO(BaseModel):
     created_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class RosterEntryDTO(BaseModel):
+    """DTO for an event attendee with participant details"""
+    attendance_id: int
+    event_id: int
+    participant_id: int
+    registration_date: datetime
+    participant_name: str
+    participant_email: str
+    participant_phone: str
+    
+    class Config:
+        from_attributes = True
+
+
+class ScheduleEntryDTO(BaseModel):
+    """DTO for a participant registration with event details"""
+    attendance_id: int
+    event_id: int
+    participant_id: int
+    registration_date: datetime
+    event_name: str
+    event_date: datetime
+    event_location: str
+    
+    class Config:
+        from_attributes = True
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional, Union
 
 
 class EventCreateDTO(BaseModel):
@@ -36,6 +36,25 @@ class EventResponseDTO(BaseModel):
         from_attributes = True
 
 
+class EventSummaryDTO(BaseModel):
+    """DTO for event summary in list responses"""
+    id: int
+    name: str
+    date: datetime
+    location: str
+    capacity: int
+    
+    class Config:
+        from_attributes = True
+
+
+class EventBatchDTO(BaseModel):
+    """DTO for events fetched by ID, in request order, plus the IDs not found"""
+    # Only the requested columns with ?fields=
+    items: List[Union[EventResponseDTO, Dict[str, Any]]]
+    missing: List[int]
+
+
 class EventStatisticsDTO(BaseModel):
     """DTO for event statistics"""
     event_id: int
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
 
 
 class ParticipantCreateDTO(BaseModel):
@@ -26,4 +27,29 @@ class ParticipantResponseDTO(BaseModel):
     updated_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class ParticipantBatchDTO(BaseModel):
+    """DTO for participants fetched by ID, in request order, plus the IDs not found"""
+    # Only the requested columns with ?fields=
+    items: List[Union[ParticipantResponseDTO, Dict[str, Any]]]
+    missing: List[int]
+
+
+class ImportErrorDTO(BaseModel):
+    """DTO for a row rejected during an import"""
+    line: Optional[int]
+    error: str
+
+
+class ParticipantImportStatusDTO(BaseModel):
+    """DTO for participant import progress and error report"""
+    import_id: str
+    status: str
+    rows_processed: int
+    inserted: int
+    duplicates: int
+    invalid: int
+    rows_per_second: float
+    errors: List[ImportErrorDTO]
@@ -0,0 +1,95 @@
+import hashlib
+import time
+from typing import Callable, Optional
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from src.infrastructure.cache.cache_client import cache_client
+from src.infrastructure.config.settings import settings
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotency-Replayed"
+POLL_INTERVAL_SECONDS = 0.05
+
+
+def run_idempotent(
+    scope: str,
+    idempotency_key: Optional[str],
+    payload: BaseModel,
+    handler: Callable[[], BaseModel],
+    status_code: int
+):
+    """Run a POST handler at most once per Idempotency-Key and replay its stored response.
+    
+    The first request claims the key atomically; concurrent duplicates wait for
+    its outcome instead of re-running validation. 2xx and 4xx outcomes are
+    replayed for settings.idempotency_ttl_seconds, 5xx outcomes release the key.
+    """
+    if not idempotency_key:
+        return handler()
+    
+    cache_key = f"idempotency:{scope}:{idempotency_key}"
+    fingerprint = hashlib.sha256(payload.model_dump_json().encode()).hexdigest()
+    
+    claimed = cache_client.add(
+        cache_key,
+        {"state": "in_progress", "fingerprint": fingerprint},
+        expiration=settings.idempotency_lock_seconds
+    )
+    if not claimed:
+        return _replay(cache_key, fingerprint)
+    
+    try:
+        result = handler()
+    except HTTPException as e:
+        if e.status_code >= 500:
+            cache_client.delete(cache_key)
+            raise
+        _store(cache_key, fingerprint, e.status_code, {"detail": e.detail})
+        raise
+    except Exception:
+        cache_client.delete(cache_key)
+        raise
+    
+    body = jsonable_encoder(result)
+    _store(cache_key, fingerprint, status_code, body)
+    return JSONResponse(body, status_code=status_code)
+
+
+def _store(cache_key: str, fingerprint: str, status_code: int, body):
+    cache_client.set(
+        cache_key,
+        {"state": "completed", "fingerprint": fingerprint, "status_code": status_code, "body": body},
+        expiration=settings.idempotency_ttl_seconds
+    )
+
+
+def _replay(cache_key: str, fingerprint: str) -> JSONResponse:
+    """Return the stored response, waiting for an in-flight original if needed"""
+    deadline = time.monotonic() + settings.idempotency_wait_seconds
+    while True:
+        stored = cache_client.get(cache_key)
+        if stored and stored["fingerprint"] != fingerprint:
+            raise HTTPException(
+                status_code=422,
+                detail=f"{IDEMPOTENCY_HEADER} was already used with a different request body"
+            )
+        if stored and stored["state"] == "completed":
+            return JSONResponse(
+                stored["body"],
+                status_code=stored["status_code"],
+                headers={REPLAYED_HEADER: "true"}
+            )
+        if not stored:
+            # Original failed with a 5xx and released the key
+            raise HTTPException(
+                status_code=409,
+                detail=f"The original request with this {IDEMPOTENCY_HEADER} failed, retry it"
+            )
+        if time.monotonic() >= deadline:
+            raise HTTPException(
+                status_code=409,
+                detail=f"A request with this {IDEMPOTENCY_HEADER} is still in progress, retry later"
+            )
+        time.sleep(POLL_INTERVAL_SECONDS)
@@ -0,0 +1,178 @@
+from datetime import date, datetime
+from typing import Any, Iterable, List, Optional, Type
+import msgpack
+import orjson
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel
+from src.infrastructure.telemetry.request_timings import timed_render
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+# Bulk lists as {"field": [values, ...]} instead of one map per row
+COLUMNAR_MEDIA_TYPE = "application/vnd.eventia.columnar+msgpack"
+
+SUPPORTED_MEDIA_TYPES = (JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, COLUMNAR_MEDIA_TYPE)
+
+# Upper bound for ?ids= multi-gets (one cache MGET and one IN query)
+MAX_BATCH_IDS = 100
+
+# Extra OpenAPI content types for routes that negotiate binary formats
+BINARY_RESPONSES = {
+    200: {
+        "content": {
+            MSGPACK_MEDIA_TYPE: {},
+            COLUMNAR_MEDIA_TYPE: {}
+        }
+    }
+}
+
+
+def negotiate_media_type(accept: Optional[str]) -> str:
+    """Pick the supported media type the Accept header prefers (JSON by default)"""
+    if not accept:
+        return JSON_MEDIA_TYPE
+
+    best, best_quality = JSON_MEDIA_TYPE, 0.0
+    for part in accept.split(","):
+        media_type, _, params = part.strip().partition(";")
+        media_type = media_type.strip().lower()
+        if media_type not in SUPPORTED_MEDIA_TYPES:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        # Ties keep the client's first choice
+        if quality > best_quality:
+            best, best_quality = media_type, quality
+    return best
+
+
+def get_response_media_type(request: Request) -> str:
+    """Dependency resolving the negotiated response media type"""
+    return negotiate_media_type(request.headers.get("accept"))
+
+
+def _encode_default(value: Any) -> Any:
+    # Same shape as the JSON responses: ISO 8601 strings
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__} to MessagePack")
+
+
+class MsgPackResponse(Response):
+    """Response rendered as MessagePack"""
+    media_type = MSGPACK_MEDIA_TYPE
+
+    @timed_render
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=_encode_default, use_bin_type=True)
+
+
+class TimedJSONResponse(JSONResponse):
+    """Default JSON response, counted as serialization time in Server-Timing"""
+    render = timed_render(JSONResponse.render)
+
+
+class TimedORJSONResponse(ORJSONResponse):
+    """orjson response, counted as serialization time in Server-Timing"""
+    render = timed_render(ORJSONResponse.render)
+
+
+def _columns(rows: List[dict]) -> dict:
+    if not rows:
+        return {}
+    columns = {name: [row[name] for row in rows] for name in rows[0]}
+    for name, values in columns.items():
+        sample = next((value for value in values if value is not None), None)
+        if isinstance(sample, (datetime, date)):
+            # orjson formats a whole column of datetimes far faster than per-value isoformat()
+            columns[name] = orjson.loads(orjson.dumps(values))
+    return columns
+
+
+def _rows(columns: dict) -> List[dict]:
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
+def list_response(
+    dtos: Iterable[BaseModel],
+    media_type: str = JSON_MEDIA_TYPE
+) -> Response:
+    """Render trusted DTOs with orjson or MessagePack.
+
+    Returning a Response skips FastAPI's response_model re-validation and
+    jsonable_encoder pass; the route's response_model still drives OpenAPI.
+    DTOs built with model_construct hold exactly their flat fields in __dict__.
+    """
+    return rows_response([dto.__dict__ for dto in dtos], media_type)
+
+
+def rows_response(rows: List[dict], media_type: str = JSON_MEDIA_TYPE) -> Response:
+    """Render plain rows (e.g. a sparse fieldset) in the negotiated format"""
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return MsgPackResponse(_rows(_columns(rows)))
+    if media_type == COLUMNAR_MEDIA_TYPE:
+        return MsgPackResponse(_columns(rows), media_type=COLUMNAR_MEDIA_TYPE)
+    return TimedORJSONResponse(rows)
+
+
+def row_response(row: dict, media_type: str = JSON_MEDIA_TYPE) -> Response:
+    """Render a single plain row in the negotiated format"""
+    if media_type == JSON_MEDIA_TYPE:
+        return TimedORJSONResponse(row)
+    return MsgPackResponse(row)
+
+
+def batch_response(
+    items: List[dict],
+    missing: List[int],
+    media_type: str = JSON_MEDIA_TYPE
+) -> Response:
+    """Render a multi-get result: found items in request order and the missing IDs"""
+    return row_response({"items": items, "missing": missing}, media_type)
+
+
+def item_response(dto: BaseModel, media_type: str = JSON_MEDIA_TYPE) -> Any:
+    """Render a single DTO in the negotiated format (JSON goes through response_model)"""
+    if media_type == JSON_MEDIA_TYPE:
+        return dto
+    return MsgPackResponse(dto.model_dump(), media_type=MSGPACK_MEDIA_TYPE)
+
+
+def parse_ids(ids: Optional[str]) -> Optional[List[int]]:
+    """Parse a comma-separated ?ids= list, dropping duplicates but keeping request order"""
+    if ids is None:
+        return None
+    try:
+        parsed = list(dict.fromkeys(int(value) for value in ids.split(",") if value.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+    if not parsed:
+        raise HTTPException(status_code=400, detail="ids must name at least one ID")
+    if len(parsed) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_IDS} ids per request")
+    return parsed
+
+
+def parse_fields(fields: Optional[str], dto_cls: Type[BaseModel]) -> Optional[List[str]]:
+    """Validate a comma-separated ?fields= list against a DTO.
+
+    Returns the fields in the DTO's declaration order so equal field sets
+    share one cache key, or None when no sparse fieldset was requested.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        raise HTTPException(status_code=400, detail="fields must name at least one field")
+    unknown = requested - set(dto_cls.model_fields)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return [name for name in dto_cls.model_fields if name in requested]
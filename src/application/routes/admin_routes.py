@@ -0,0 +1,81 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from src.application.admin import require_admin
+from src.infrastructure.cache.cache_client import cache_client
+from src.infrastructure.config.settings import settings
+from src.infrastructure.telemetry.memory import cache_usage, census, memory_tracker, rss_bytes
+from src.infrastructure.telemetry.profiler import profile_for, profile_store
+from src.infrastructure.telemetry.slow_queries import slow_query_log
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/slow-queries")
+def get_slow_queries(limit: int = Query(50, ge=1, le=500)):
+    """Slow statements aggregated by fingerprint, most total time first"""
+    return {
+        "enabled": settings.slow_query_log_enabled,
+        "threshold_ms": slow_query_log.threshold_seconds * 1000,
+        "queries": slow_query_log.report(limit)
+    }
+
+
+@router.delete("/slow-queries", status_code=204)
+def reset_slow_queries():
+    """Forget the recorded slow statements"""
+    slow_query_log.reset()
+
+
+@router.post("/profile", response_class=PlainTextResponse)
+def profile_worker(seconds: float = Query(10.0, gt=0, le=settings.profile_max_seconds)):
+    """Sample every thread of this worker for a while; returns collapsed stacks for a flame graph"""
+    collapsed, samples = profile_for(seconds, settings.profile_interval_ms / 1000)
+    return PlainTextResponse(collapsed, headers={"X-Profile-Samples": str(samples)})
+
+
+@router.get("/profiles")
+def list_request_profiles():
+    """IDs of the stored single-request profiles (X-Profile: 1) with their distinct stack counts"""
+    return profile_store.ids()
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def get_request_profile(profile_id: str):
+    """Collapsed stacks of one profiled request"""
+    collapsed = profile_store.get(profile_id)
+    if collapsed is None:
+        raise HTTPException(status_code=404, detail=f"Profile {profile_id} not found")
+    return PlainTextResponse(collapsed)
+
+
+@router.get("/memory")
+def get_memory():
+    """RSS, live entities/ORM models/DTOs and the in-process cache's size"""
+    return {
+        "rss_bytes": rss_bytes(),
+        "tracing": memory_tracker.tracing,
+        "census": census(),
+        "memory_cache": cache_usage(cache_client.memory_cache)
+    }
+
+
+@router.post("/memory/snapshot", status_code=204)
+def start_memory_tracing():
+    """Start tracemalloc (if needed) and take the baseline snapshot later diffs compare to"""
+    memory_tracker.start()
+
+
+@router.get("/memory/diff")
+def get_memory_diff(limit: int = Query(20, ge=1, le=200)):
+    """Allocations the application code gained since the baseline snapshot, largest first"""
+    diff = memory_tracker.diff(limit)
+    if diff is None:
+        raise HTTPException(status_code=409, detail="No baseline snapshot; POST /admin/memory/snapshot first")
+    retained_bytes, top = diff
+    return {"retained_bytes": retained_bytes, "top": top}
+
+
+@router.delete("/memory/snapshot", status_code=204)
+def stop_memory_tracing():
+    """Stop tracemalloc and drop the baseline snapshot"""
+    memory_tracker.stop()
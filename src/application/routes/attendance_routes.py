@@ -1,41 +1,55 @@
-from fastapi import APIRouter, Depends
-from typing import List
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, Query
+from typing import List, Optional
 from src.application.controllers.attendance_controller import AttendanceController
+from src.application.idempotency import run_idempotent
 from src.domain.services.attendance_service import AttendanceService
 from src.infrastructure.database.repositories.attendance_repository_impl import AttendanceRepositoryImpl
 from src.infrastructure.database.repositories.event_repository_impl import EventRepositoryImpl
 from src.infrastructure.database.repositories.participant_repository_impl import ParticipantRepositoryImpl
-from src.infrastructure.database.connection import get_db
+from src.application.responses import BINARY_RESPONSES, get_response_media_type
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork, get_unit_of_work
 from src.application.dtos.attendance_dto import (
     AttendanceCreateDTO,
-    AttendanceResponseDTO
+    AttendanceResponseDTO,
+    RosterEntryDTO,
+    ScheduleEntryDTO
 )
 
 router = APIRouter(prefix="/attendances", tags=["Attendances"])
 
 
-def get_attendance_controller(db: Session = Depends(get_db)) -> AttendanceController:
+def get_attendance_controller(
+    unit_of_work: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    media_type: str = Depends(get_response_media_type)
+) -> AttendanceController:
     """Dependency injection for attendance controller"""
-    attendance_repository = AttendanceRepositoryImpl(db)
-    event_repository = EventRepositoryImpl(db)
-    participant_repository = ParticipantRepositoryImpl(db)
+    attendance_repository = AttendanceRepositoryImpl(unit_of_work.session)
+    event_repository = EventRepositoryImpl(unit_of_work.session)
+    participant_repository = ParticipantRepositoryImpl(unit_of_work.session)
     
     attendance_service = AttendanceService(
         attendance_repository,
         event_repository,
-        participant_repository
+        participant_repository,
+        unit_of_work
     )
-    return AttendanceController(attendance_service)
+    return AttendanceController(attendance_service, media_type)
 
 
 @router.post("/", response_model=AttendanceResponseDTO, status_code=201)
 def register_attendance(
     attendance_dto: AttendanceCreateDTO,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     controller: AttendanceController = Depends(get_attendance_controller)
 ):
-    """Register a participant to an event"""
-    return controller.register_attendance(attendance_dto)
+    """Register a participant to an event (retries with the same Idempotency-Key are replayed)"""
+    return run_idempotent(
+        "attendances",
+        idempotency_key,
+        attendance_dto,
+        lambda: controller.register_attendance(attendance_dto),
+        status_code=201
+    )
 
 
 @router.get("/{attendance_id}", response_model=AttendanceResponseDTO)
@@ -47,22 +61,56 @@ def get_attendance(
     return controller.get_attendance(attendance_id)
 
 
-@router.get("/event/{event_id}", response_model=List[AttendanceResponseDTO])
+@router.get("/event/{event_id}", response_model=List[AttendanceResponseDTO], responses=BINARY_RESPONSES)
 def get_attendances_by_event(
     event_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,participant_id"),
     controller: AttendanceController = Depends(get_attendance_controller)
 ):
     """Get all attendances for a specific event"""
-    return controller.get_attendances_by_event(event_id)
+    return controller.get_attendances_by_event(event_id, fields)
 
 
-@router.get("/participant/{participant_id}", response_model=List[AttendanceResponseDTO])
+@router.get("/participant/{participant_id}", response_model=List[AttendanceResponseDTO], responses=BINARY_RESPONSES)
 def get_attendances_by_participant(
     participant_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,event_id"),
     controller: AttendanceController = Depends(get_attendance_controller)
 ):
     """Get all attendances for a specific participant"""
-    return controller.get_attendances_by_participant(participant_id)
+    return controller.get_attendances_by_participant(participant_id, fields)
+
+
+@router.get("/event/{event_id}/roster", response_model=List[RosterEntryDTO], responses=BINARY_RESPONSES)
+def get_event_roster(
+    event_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    controller: AttendanceController = Depends(get_attendance_controller)
+):
+    """Get a page of an event's attendees with participant details"""
+    return controller.get_event_roster(event_id, skip, limit)
+
+
+@router.get("/event/{event_id}/export")
+def export_event_roster(
+    event_id: int,
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    controller: AttendanceController = Depends(get_attendance_controller)
+):
+    """Stream an event's roster as CSV or NDJSON"""
+    return controller.export_event_roster(event_id, format)
+
+
+@router.get("/participant/{participant_id}/schedule", response_model=List[ScheduleEntryDTO], responses=BINARY_RESPONSES)
+def get_participant_schedule(
+    participant_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    controller: AttendanceController = Depends(get_attendance_controller)
+):
+    """Get a page of a participant's events with event details"""
+    return controller.get_participant_schedule(participant_id, skip, limit)
 
 
 @router.delete("/{attendance_id}")
@@ -1,25 +1,30 @@
-from fastapi import APIRouter, Depends
-from typing import List
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query
+from typing import Any, Dict, List, Optional, Union
 from src.application.controllers.event_controller import EventController
 from src.domain.services.event_service import EventService
 from src.infrastructure.database.repositories.event_repository_impl import EventRepositoryImpl
-from src.infrastructure.database.connection import get_db
+from src.application.responses import BINARY_RESPONSES, get_response_media_type
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork, get_unit_of_work
 from src.application.dtos.event_dto import (
     EventCreateDTO,
     EventUpdateDTO,
     EventResponseDTO,
+    EventSummaryDTO,
+    EventBatchDTO,
     EventStatisticsDTO
 )
 
 router = APIRouter(prefix="/events", tags=["Events"])
 
 
-def get_event_controller(db: Session = Depends(get_db)) -> EventController:
+def get_event_controller(
+    unit_of_work: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    media_type: str = Depends(get_response_media_type)
+) -> EventController:
     """Dependency injection for event controller"""
-    event_repository = EventRepositoryImpl(db)
-    event_service = EventService(event_repository)
-    return EventController(event_service)
+    event_repository = EventRepositoryImpl(unit_of_work.session)
+    event_service = EventService(event_repository, unit_of_work)
+    return EventController(event_service, media_type)
 
 
 @router.post("/", response_model=EventResponseDTO, status_code=201)
@@ -31,21 +36,29 @@ def create_event(
     return controller.create_event(event_dto)
 
 
-@router.get("/{event_id}", response_model=EventResponseDTO)
+@router.get("/{event_id}", response_model=EventResponseDTO, responses=BINARY_RESPONSES)
 def get_event(
     event_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,date"),
     controller: EventController = Depends(get_event_controller)
 ):
     """Get an event by ID"""
-    return controller.get_event(event_id)
+    return controller.get_event(event_id, fields)
 
 
-@router.get("/", response_model=List[EventResponseDTO])
+@router.get(
+    "/",
+    response_model=Union[List[EventResponseDTO], List[EventSummaryDTO], EventBatchDTO, List[Dict[str, Any]]],
+    responses=BINARY_RESPONSES
+)
 def get_all_events(
+    detail: bool = False,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,date"),
+    ids: Optional[str] = Query(None, description="Comma-separated event IDs to fetch in one call, e.g. 3,1,7"),
     controller: EventController = Depends(get_event_controller)
 ):
-    """Get all events"""
-    return controller.get_all_events()
+    """Get all events (summaries by default, full details with ?detail=true, chosen columns with ?fields=, specific events with ?ids=)"""
+    return controller.get_all_events(detail, fields, ids)
 
 
 @router.put("/{event_id}", response_model=EventResponseDTO)
@@ -67,7 +80,7 @@ def delete_event(
     return controller.delete_event(event_id)
 
 
-@router.get("/{event_id}/statistics", response_model=EventStatisticsDTO)
+@router.get("/{event_id}/statistics", response_model=EventStatisticsDTO, responses=BINARY_RESPONSES)
 def get_event_statistics(
     event_id: int,
     controller: EventController = Depends(get_event_controller)
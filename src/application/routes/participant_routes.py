@@ -1,50 +1,124 @@
-from fastapi import APIRouter, Depends
-from typing import List
-from sqlalchemy.orm import Session
+from contextlib import contextmanager
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Query, Request
+from starlette.concurrency import run_in_threadpool
+from typing import Any, Dict, Iterator, List, Optional, Union
 from src.application.controllers.participant_controller import ParticipantController
+from src.application.controllers.participant_import_controller import (
+    ParticipantImportController,
+    spool_request_body
+)
+from src.application.idempotency import run_idempotent
 from src.domain.services.participant_service import ParticipantService
+from src.domain.services.participant_import_service import ParticipantImportService
+from src.infrastructure.database.connection import SessionLocal
 from src.infrastructure.database.repositories.participant_repository_impl import ParticipantRepositoryImpl
-from src.infrastructure.database.connection import get_db
+from src.application.responses import BINARY_RESPONSES, get_response_media_type
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork, get_unit_of_work
 from src.application.dtos.participant_dto import (
     ParticipantCreateDTO,
     ParticipantUpdateDTO,
-    ParticipantResponseDTO
+    ParticipantResponseDTO,
+    ParticipantBatchDTO,
+    ParticipantImportStatusDTO
 )
 
 router = APIRouter(prefix="/participants", tags=["Participants"])
 
 
-def get_participant_controller(db: Session = Depends(get_db)) -> ParticipantController:
+def get_participant_controller(
+    unit_of_work: SqlAlchemyUnitOfWork = Depends(get_unit_of_work),
+    media_type: str = Depends(get_response_media_type)
+) -> ParticipantController:
     """Dependency injection for participant controller"""
-    participant_repository = ParticipantRepositoryImpl(db)
-    participant_service = ParticipantService(participant_repository)
-    return ParticipantController(participant_service)
+    participant_repository = ParticipantRepositoryImpl(unit_of_work.session)
+    participant_service = ParticipantService(participant_repository, unit_of_work)
+    return ParticipantController(participant_service, media_type)
+
+
+@contextmanager
+def open_import_service(bind) -> Iterator[ParticipantImportService]:
+    """Import service on its own session, for background work that outlives the request's session"""
+    session = SessionLocal(bind=bind)
+    try:
+        yield ParticipantImportService(ParticipantRepositoryImpl(session), SqlAlchemyUnitOfWork(session))
+    finally:
+        session.close()
+
+
+def get_participant_import_controller(
+    unit_of_work: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)
+) -> ParticipantImportController:
+    """Dependency injection for participant import controller"""
+    participant_repository = ParticipantRepositoryImpl(unit_of_work.session)
+    import_service = ParticipantImportService(participant_repository, unit_of_work)
+    bind = unit_of_work.session.get_bind()
+    return ParticipantImportController(import_service, lambda: open_import_service(bind))
 
 
 @router.post("/", response_model=ParticipantResponseDTO, status_code=201)
 def create_participant(
     participant_dto: ParticipantCreateDTO,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     controller: ParticipantController = Depends(get_participant_controller)
 ):
-    """Create a new participant"""
-    return controller.create_participant(participant_dto)
+    """Create a new participant (retries with the same Idempotency-Key are replayed)"""
+    return run_idempotent(
+        "participants",
+        idempotency_key,
+        participant_dto,
+        lambda: controller.create_participant(participant_dto),
+        status_code=201
+    )
 
 
-@router.get("/{participant_id}", response_model=ParticipantResponseDTO)
+@router.post(
+    "/import",
+    response_model=ParticipantImportStatusDTO,
+    status_code=202,
+    openapi_extra={"requestBody": {"content": {"text/csv": {"schema": {"type": "string"}}}, "required": True}}
+)
+async def import_participants(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    controller: ParticipantImportController = Depends(get_participant_import_controller)
+):
+    """Import participants from a CSV body (name,email,phone) in the background"""
+    path = await spool_request_body(request)
+    # Cache writes block, so keep them off the event loop
+    return await run_in_threadpool(controller.start_import, path, background_tasks)
+
+
+@router.get("/import/{import_id}", response_model=ParticipantImportStatusDTO)
+def get_import_status(
+    import_id: str,
+    controller: ParticipantImportController = Depends(get_participant_import_controller)
+):
+    """Get the progress and error report of a participant import"""
+    return controller.get_import_status(import_id)
+
+
+@router.get("/{participant_id}", response_model=ParticipantResponseDTO, responses=BINARY_RESPONSES)
 def get_participant(
     participant_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,email"),
     controller: ParticipantController = Depends(get_participant_controller)
 ):
     """Get a participant by ID"""
-    return controller.get_participant(participant_id)
+    return controller.get_participant(participant_id, fields)
 
 
-@router.get("/", response_model=List[ParticipantResponseDTO])
+@router.get(
+    "/",
+    response_model=Union[List[ParticipantResponseDTO], ParticipantBatchDTO, List[Dict[str, Any]]],
+    responses=BINARY_RESPONSES
+)
 def get_all_participants(
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,email"),
+    ids: Optional[str] = Query(None, description="Comma-separated participant IDs to fetch in one call, e.g. 3,1,7"),
     controller: ParticipantController = Depends(get_participant_controller)
 ):
-    """Get all participants"""
-    return controller.get_all_participants()
+    """Get all participants (or specific participants with ?ids=)"""
+    return controller.get_all_participants(fields, ids)
 
 
 @router.put("/{participant_id}", response_model=ParticipantResponseDTO)
@@ -5,6 +5,8 @@ from typing import Optional
 class Attendance:
     """Domain entity representing an attendance registration"""
     
+    __slots__ = ("id", "event_id", "participant_id", "registration_date", "created_at")
+    
     def __init__(
         self,
         event_id: int,
@@ -13,11 +15,34 @@ class Attendance:
         registration_date: Optional[datetime] = None,
         created_at: Optional[datetime] = None
     ):
+        now = datetime.utcnow() if registration_date is None or created_at is None else None
         self.id = attendance_id
         self.event_id = event_id
         self.participant_id = participant_id
-        self.registration_date = registration_date or datetime.utcnow()
-        self.created_at = created_at or datetime.utcnow()
+        self.registration_date = registration_date or now
+        self.created_at = created_at or now
+    
+    @classmethod
+    def rehydrate(
+        cls,
+        attendance_id: int,
+        event_id: int,
+        participant_id: int,
+        registration_date: Optional[datetime] = None,
+        created_at: Optional[datetime] = None
+    ) -> "Attendance":
+        """Build an attendance from trusted stored data (DB row or cache) without the constructor"""
+        attendance = object.__new__(cls)
+        attendance.id = attendance_id
+        attendance.event_id = event_id
+        attendance.participant_id = participant_id
+        if registration_date is None or created_at is None:
+            now = datetime.utcnow()
+            registration_date = registration_date or now
+            created_at = created_at or now
+        attendance.registration_date = registration_date
+        attendance.created_at = created_at
+        return attendance
     
     def __repr__(self):
-        return f"<Attendance(id={self.id}, event_id={self.event_id}, participant_id={self.participant_id})>"
\ No newline at end of file
+        return f"<Attendance(id={self.id}, event_id={self.event_id}, participant_id={self.participant_id})>"
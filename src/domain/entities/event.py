@@ -5,6 +5,8 @@ from typing import Optional
 class Event:
     """Domain entity representing an event"""
     
+    __slots__ = ("id", "name", "description", "date", "location", "capacity", "created_at", "updated_at")
+    
     def __init__(
         self,
         name: str,
@@ -16,14 +18,43 @@ class Event:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
     ):
+        now = datetime.utcnow() if created_at is None or updated_at is None else None
         self.id = event_id
         self.name = name
         self.description = description
         self.date = date
         self.location = location
         self.capacity = capacity
-        self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
+    
+    @classmethod
+    def rehydrate(
+        cls,
+        event_id: int,
+        name: str,
+        description: str,
+        date: datetime,
+        location: str,
+        capacity: int,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None
+    ) -> "Event":
+        """Build an event from trusted stored data (DB row or cache) without the constructor"""
+        event = object.__new__(cls)
+        event.id = event_id
+        event.name = name
+        event.description = description
+        event.date = date
+        event.location = location
+        event.capacity = capacity
+        if created_at is None or updated_at is None:
+            now = datetime.utcnow()
+            created_at = created_at or now
+            updated_at = updated_at or now
+        event.created_at = created_at
+        event.updated_at = updated_at
+        return event
     
     def has_capacity(self, current_attendees: int) -> bool:
         """Check if event has available capacity"""
@@ -34,4 +65,4 @@ class Event:
         return self.date > datetime.utcnow()
     
     def __repr__(self):
-        return f"<Event(id={self.id}, name='{self.name}', date={self.date})>"
\ No newline at end of file
+        return f"<Event(id={self.id}, name='{self.name}', date={self.date})>"
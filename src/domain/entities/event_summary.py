@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Optional
+
+
+class EventSummary:
+    """Slim read-only projection of an event used by list views"""
+    
+    __slots__ = ("id", "name", "date", "location", "capacity")
+    
+    def __init__(
+        self,
+        name: str,
+        date: datetime,
+        location: str,
+        capacity: int,
+        event_id: Optional[int] = None
+    ):
+        self.id = event_id
+        self.name = name
+        self.date = date
+        self.location = location
+        self.capacity = capacity
+    
+    def __repr__(self):
+        return f"<EventSummary(id={self.id}, name='{self.name}', date={self.date})>"
@@ -2,10 +2,14 @@ from datetime import datetime
 from typing import Optional
 import re
 
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 class Participant:
     """Domain entity representing a participant"""
     
+    __slots__ = ("id", "name", "email", "phone", "created_at", "updated_at")
+    
     def __init__(
         self,
         name: str,
@@ -15,15 +19,40 @@ class Participant:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
     ):
+        now = datetime.utcnow() if created_at is None or updated_at is None else None
         self.id = participant_id
         self.name = name
         self.email = email
         self.phone = phone
-        self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
         
         self._validate()
     
+    @classmethod
+    def rehydrate(
+        cls,
+        participant_id: int,
+        name: str,
+        email: str,
+        phone: str,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None
+    ) -> "Participant":
+        """Build a participant from trusted stored data (DB row or cache) without re-validating"""
+        participant = object.__new__(cls)
+        participant.id = participant_id
+        participant.name = name
+        participant.email = email
+        participant.phone = phone
+        if created_at is None or updated_at is None:
+            now = datetime.utcnow()
+            created_at = created_at or now
+            updated_at = updated_at or now
+        participant.created_at = created_at
+        participant.updated_at = updated_at
+        return participant
+    
     def _validate(self):
         """Validate participant data"""
         if not self.name or len(self.name.strip()) == 0:
@@ -38,8 +67,7 @@ class Participant:
     @staticmethod
     def _is_valid_email(email: str) -> bool:
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return EMAIL_PATTERN.match(email) is not None
     
     def __repr__(self):
-        return f"<Participant(id={self.id}, name='{self.name}', email='{self.email}')>"
\ No newline at end of file
+        return f"<Participant(id={self.id}, name='{self.name}', email='{self.email}')>"
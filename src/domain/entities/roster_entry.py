@@ -0,0 +1,36 @@
+from datetime import datetime
+
+
+class RosterEntry:
+    """Read model of an event attendance joined with its participant"""
+    
+    __slots__ = (
+        "attendance_id",
+        "event_id",
+        "participant_id",
+        "registration_date",
+        "participant_name",
+        "participant_email",
+        "participant_phone"
+    )
+    
+    def __init__(
+        self,
+        attendance_id: int,
+        event_id: int,
+        participant_id: int,
+        registration_date: datetime,
+        participant_name: str,
+        participant_email: str,
+        participant_phone: str
+    ):
+        self.attendance_id = attendance_id
+        self.event_id = event_id
+        self.participant_id = participant_id
+        self.registration_date = registration_date
+        self.participant_name = participant_name
+        self.participant_email = participant_email
+        self.participant_phone = participant_phone
+    
+    def __repr__(self):
+        return f"<RosterEntry(event_id={self.event_id}, participant_id={self.participant_id})>"
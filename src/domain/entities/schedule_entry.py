@@ -0,0 +1,36 @@
+from datetime import datetime
+
+
+class ScheduleEntry:
+    """Read model of a participant attendance joined with its event"""
+    
+    __slots__ = (
+        "attendance_id",
+        "event_id",
+        "participant_id",
+        "registration_date",
+        "event_name",
+        "event_date",
+        "event_location"
+    )
+    
+    def __init__(
+        self,
+        attendance_id: int,
+        event_id: int,
+        participant_id: int,
+        registration_date: datetime,
+        event_name: str,
+        event_date: datetime,
+        event_location: str
+    ):
+        self.attendance_id = attendance_id
+        self.event_id = event_id
+        self.participant_id = participant_id
+        self.registration_date = registration_date
+        self.event_name = event_name
+        self.event_date = event_date
+        self.event_location = event_location
+    
+    def __repr__(self):
+        return f"<ScheduleEntry(participant_id={self.participant_id}, event_id={self.event_id})>"
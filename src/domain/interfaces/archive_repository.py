@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+
+class ArchiveRepository(ABC):
+    """Interface for moving finished events into archive storage"""
+    
+    @abstractmethod
+    def get_archivable_event_ids(self, cutoff: datetime, limit: int) -> List[int]:
+        """Get IDs of live events that took place before the cutoff"""
+        pass
+    
+    @abstractmethod
+    def archive_attendances(self, event_ids: List[int], limit: int) -> int:
+        """Move up to limit attendances of the given events and return how many moved"""
+        pass
+    
+    @abstractmethod
+    def archive_events(self, event_ids: List[int]) -> int:
+        """Move the given events and return how many moved"""
+        pass
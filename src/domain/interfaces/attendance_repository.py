@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from src.domain.entities.attendance import Attendance
+from src.domain.entities.roster_entry import RosterEntry
+from src.domain.entities.schedule_entry import ScheduleEntry
 
 
 class AttendanceRepository(ABC):
@@ -35,6 +37,31 @@ class AttendanceRepository(ABC):
         """Get all attendances for a participant"""
         pass
     
+    @abstractmethod
+    def get_by_event_fields(self, event_id: int, fields: List[str]) -> List[dict]:
+        """Get only the given columns of an event's attendances"""
+        pass
+    
+    @abstractmethod
+    def get_by_participant_fields(self, participant_id: int, fields: List[str]) -> List[dict]:
+        """Get only the given columns of a participant's attendances"""
+        pass
+    
+    @abstractmethod
+    def get_roster(self, event_id: int, skip: int, limit: int) -> List[RosterEntry]:
+        """Get a page of an event's attendances with participant details"""
+        pass
+    
+    @abstractmethod
+    def iter_roster(self, event_id: int, batch_size: int = 1000) -> Iterator[RosterEntry]:
+        """Stream an event's attendances with participant details"""
+        pass
+    
+    @abstractmethod
+    def get_schedule(self, participant_id: int, skip: int, limit: int) -> List[ScheduleEntry]:
+        """Get a page of a participant's attendances with event details"""
+        pass
+    
     @abstractmethod
     def delete(self, attendance_id: int) -> bool:
         """Delete an attendance registration"""
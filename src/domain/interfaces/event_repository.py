@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.domain.entities.event import Event
+from src.domain.entities.event_summary import EventSummary
 
 
 class EventRepository(ABC):
@@ -16,11 +17,26 @@ class EventRepository(ABC):
         """Get event by ID"""
         pass
     
+    @abstractmethod
+    def get_by_ids(self, event_ids: List[int]) -> List[Event]:
+        """Get the existing events among the given IDs (in no particular order)"""
+        pass
+    
     @abstractmethod
     def get_all(self) -> List[Event]:
         """Get all events"""
         pass
     
+    @abstractmethod
+    def get_all_fields(self, fields: List[str]) -> List[dict]:
+        """Get only the given columns of all events"""
+        pass
+    
+    @abstractmethod
+    def get_all_summaries(self) -> List[EventSummary]:
+        """Get a summary of all events without their descriptions"""
+        pass
+    
     @abstractmethod
     def update(self, event: Event) -> Event:
         """Update an existing event"""
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set
 from src.domain.entities.participant import Participant
 
 
@@ -11,21 +11,41 @@ class ParticipantRepository(ABC):
         """Create a new participant"""
         pass
     
+    @abstractmethod
+    def bulk_create(self, participants: List[Participant]) -> int:
+        """Insert many participants at once and return how many were inserted"""
+        pass
+    
     @abstractmethod
     def get_by_id(self, participant_id: int) -> Optional[Participant]:
         """Get participant by ID"""
         pass
     
+    @abstractmethod
+    def get_by_ids(self, participant_ids: List[int]) -> List[Participant]:
+        """Get the existing participants among the given IDs (in no particular order)"""
+        pass
+    
     @abstractmethod
     def get_by_email(self, email: str) -> Optional[Participant]:
         """Get participant by email"""
         pass
     
+    @abstractmethod
+    def get_existing_emails(self, emails: List[str]) -> Set[str]:
+        """Get which of the given emails are already registered"""
+        pass
+    
     @abstractmethod
     def get_all(self) -> List[Participant]:
         """Get all participants"""
         pass
     
+    @abstractmethod
+    def get_all_fields(self, fields: List[str]) -> List[dict]:
+        """Get only the given columns of all participants"""
+        pass
+    
     @abstractmethod
     def update(self, participant: Participant) -> Participant:
         """Update an existing participant"""
@@ -34,4 +54,9 @@ class ParticipantRepository(ABC):
     @abstractmethod
     def delete(self, participant_id: int) -> bool:
         """Delete a participant"""
+        pass
+    
+    @abstractmethod
+    def get_attended_event_ids(self, participant_id: int) -> List[int]:
+        """Get the IDs of the events a participant is registered to"""
         pass
\ No newline at end of file
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+
+
+class UnitOfWork(ABC):
+    """Interface for a request-scoped unit of work"""
+    
+    @abstractmethod
+    def commit(self) -> None:
+        """Commit all pending changes and run deferred cache invalidations"""
+        pass
+    
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard pending changes and deferred cache invalidations"""
+        pass
+    
+    @abstractmethod
+    def invalidate_on_commit(self, *cache_keys: str) -> None:
+        """Schedule cache keys to be deleted after a successful commit"""
+        pass
+    
+    @abstractmethod
+    def invalidate_groups_on_commit(self, *groups: str) -> None:
+        """Schedule every cache key tracked in the given groups to be deleted after a successful commit"""
+        pass
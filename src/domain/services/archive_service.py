@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+from src.domain.interfaces.archive_repository import ArchiveRepository
+from src.domain.interfaces.unit_of_work import UnitOfWork
+
+
+class ArchiveService:
+    """Service moving finished events and their attendances to archive tables"""
+    
+    def __init__(self, archive_repository: ArchiveRepository, unit_of_work: UnitOfWork):
+        self.archive_repository = archive_repository
+        self.unit_of_work = unit_of_work
+    
+    def archive_past_events(self, older_than_days: int, batch_size: int = 500) -> dict:
+        """Archive events that ended before the cutoff, one short transaction per batch"""
+        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+        totals = {"events": 0, "attendances": 0, "batches": 0}
+        
+        while True:
+            event_ids = self.archive_repository.get_archivable_event_ids(cutoff, batch_size)
+            if not event_ids:
+                break
+            
+            # Attendances first (they reference events), batch_size rows per commit
+            while True:
+                moved = self.archive_repository.archive_attendances(event_ids, batch_size)
+                if not moved:
+                    break
+                self.unit_of_work.commit()
+                totals["attendances"] += moved
+                totals["batches"] += 1
+            
+            totals["events"] += self.archive_repository.archive_events(event_ids)
+            totals["batches"] += 1
+            
+            # Archived events drop out of the live listings; their own entries are refetched from the archive
+            self.unit_of_work.invalidate_on_commit("events:all", "events:summary:all", *[
+                key
+                for event_id in event_ids
+                for key in (f"event:{event_id}", f"event:stats:{event_id}", f"attendances:event:{event_id}")
+            ])
+            self.unit_of_work.invalidate_groups_on_commit("events:fields", *[
+                group
+                for event_id in event_ids
+                for group in (f"attendances:event:{event_id}", f"event:{event_id}:schedules")
+            ])
+            self.unit_of_work.commit()
+        
+        return totals
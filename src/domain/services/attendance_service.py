@@ -1,9 +1,15 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from src.domain.entities.attendance import Attendance
+from src.domain.entities.roster_entry import RosterEntry
+from src.domain.entities.schedule_entry import ScheduleEntry
 from src.domain.interfaces.attendance_repository import AttendanceRepository
 from src.domain.interfaces.event_repository import EventRepository
 from src.domain.interfaces.participant_repository import ParticipantRepository
+from src.domain.interfaces.unit_of_work import UnitOfWork
 from src.infrastructure.cache.cache_client import cache_client
+from src.infrastructure.cache.codec import decode_datetime, decode_row, encode_row
+
+ATTENDANCE_DATETIME_FIELDS = ("registration_date", "created_at")
 
 
 class AttendanceService:
@@ -13,11 +19,13 @@ class AttendanceService:
         self,
         attendance_repository: AttendanceRepository,
         event_repository: EventRepository,
-        participant_repository: ParticipantRepository
+        participant_repository: ParticipantRepository,
+        unit_of_work: UnitOfWork
     ):
         self.attendance_repository = attendance_repository
         self.event_repository = event_repository
         self.participant_repository = participant_repository
+        self.unit_of_work = unit_of_work
     
     def register_attendance(self, attendance: Attendance) -> Attendance:
         """Register a participant to an event with business rules validation"""
@@ -54,9 +62,8 @@ class AttendanceService:
         created_attendance = self.attendance_repository.create(attendance)
         
         # Invalidate relevant caches
-        cache_client.delete(f"event:stats:{attendance.event_id}")
-        cache_client.delete(f"attendances:event:{attendance.event_id}")
-        cache_client.delete(f"attendances:participant:{attendance.participant_id}")
+        self._invalidate_attendance_lists(attendance)
+        self.unit_of_work.commit()
         
         return created_attendance
     
@@ -72,10 +79,12 @@ class AttendanceService:
         
         if cached_data:
             return [
-                Attendance(
-                    attendance_id=a["id"],
-                    event_id=a["event_id"],
-                    participant_id=a["participant_id"]
+                Attendance.rehydrate(
+                    a["id"],
+                    a["event_id"],
+                    a["participant_id"],
+                    decode_datetime(a.get("registration_date")),
+                    decode_datetime(a.get("created_at"))
                 )
                 for a in cached_data
             ]
@@ -89,7 +98,9 @@ class AttendanceService:
                 {
                     "id": a.id,
                     "event_id": a.event_id,
-                    "participant_id": a.participant_id
+                    "participant_id": a.participant_id,
+                    "registration_date": a.registration_date.isoformat(),
+                    "created_at": a.created_at.isoformat()
                 }
                 for a in attendances
             ]
@@ -105,10 +116,12 @@ class AttendanceService:
         
         if cached_data:
             return [
-                Attendance(
-                    attendance_id=a["id"],
-                    event_id=a["event_id"],
-                    participant_id=a["participant_id"]
+                Attendance.rehydrate(
+                    a["id"],
+                    a["event_id"],
+                    a["participant_id"],
+                    decode_datetime(a.get("registration_date")),
+                    decode_datetime(a.get("created_at"))
                 )
                 for a in cached_data
             ]
@@ -122,7 +135,9 @@ class AttendanceService:
                 {
                     "id": a.id,
                     "event_id": a.event_id,
-                    "participant_id": a.participant_id
+                    "participant_id": a.participant_id,
+                    "registration_date": a.registration_date.isoformat(),
+                    "created_at": a.created_at.isoformat()
                 }
                 for a in attendances
             ]
@@ -130,6 +145,140 @@ class AttendanceService:
         
         return attendances
     
+    def get_attendance_fields_by_event(self, event_id: int, fields: List[str]) -> List[dict]:
+        """Get only the given fields of an event's attendances with caching"""
+        # Try cache first (one entry per field set)
+        cache_key = f"attendances:event:{event_id}:fields:{','.join(fields)}"
+        cached_data = cache_client.get(cache_key)
+        
+        if cached_data:
+            return [decode_row(a, ATTENDANCE_DATETIME_FIELDS) for a in cached_data]
+        
+        # Get only the requested columns from database
+        rows = self.attendance_repository.get_by_event_fields(event_id, fields)
+        
+        # Cache results for 2 minutes
+        if rows:
+            cache_client.set_tracked(
+                cache_key, [encode_row(a) for a in rows], [f"attendances:event:{event_id}"], expiration=120
+            )
+        
+        return rows
+    
+    def get_attendance_fields_by_participant(self, participant_id: int, fields: List[str]) -> List[dict]:
+        """Get only the given fields of a participant's attendances with caching"""
+        # Try cache first (one entry per field set)
+        cache_key = f"attendances:participant:{participant_id}:fields:{','.join(fields)}"
+        cached_data = cache_client.get(cache_key)
+        
+        if cached_data:
+            return [decode_row(a, ATTENDANCE_DATETIME_FIELDS) for a in cached_data]
+        
+        # Get only the requested columns from database
+        rows = self.attendance_repository.get_by_participant_fields(participant_id, fields)
+        
+        # Cache results for 2 minutes
+        if rows:
+            cache_client.set_tracked(
+                cache_key, [encode_row(a) for a in rows], [f"attendances:participant:{participant_id}"], expiration=120
+            )
+        
+        return rows
+    
+    def get_event_roster(self, event_id: int, skip: int = 0, limit: int = 100) -> List[RosterEntry]:
+        """Get a page of an event's attendees with participant details, with caching"""
+        # Try cache first
+        cache_key = f"attendances:roster:{event_id}:{skip}:{limit}"
+        cached_data = cache_client.get(cache_key)
+        
+        if cached_data:
+            return [
+                RosterEntry(**{**r, "registration_date": decode_datetime(r["registration_date"])})
+                for r in cached_data
+            ]
+        
+        # Single JOIN query instead of one participant lookup per attendance
+        roster = self.attendance_repository.get_roster(event_id, skip, limit)
+        
+        # Cache results for 2 minutes
+        if roster:
+            cache_data = [
+                {
+                    "attendance_id": r.attendance_id,
+                    "event_id": r.event_id,
+                    "participant_id": r.participant_id,
+                    "registration_date": r.registration_date.isoformat(),
+                    "participant_name": r.participant_name,
+                    "participant_email": r.participant_email,
+                    "participant_phone": r.participant_phone
+                }
+                for r in roster
+            ]
+            # Tracked under the event and under every participant shown, so either one's writes drop the page
+            cache_client.set_tracked(
+                cache_key,
+                cache_data,
+                [f"attendances:event:{event_id}"] + [f"participant:{r.participant_id}:rosters" for r in roster],
+                expiration=120
+            )
+        
+        return roster
+    
+    def stream_event_roster(self, event_id: int) -> Iterator[RosterEntry]:
+        """Stream an event's full roster (archived events included) without loading it into memory"""
+        # Checked up front: once streaming starts the status code is already sent
+        if not self.event_repository.get_by_id(event_id):
+            raise ValueError(f"Event with id {event_id} not found")
+        return self.attendance_repository.iter_roster(event_id)
+    
+    def get_participant_schedule(
+        self,
+        participant_id: int,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[ScheduleEntry]:
+        """Get a page of a participant's events with event details, with caching"""
+        # Try cache first
+        cache_key = f"attendances:schedule:{participant_id}:{skip}:{limit}"
+        cached_data = cache_client.get(cache_key)
+        
+        if cached_data:
+            return [
+                ScheduleEntry(**{
+                    **s,
+                    "registration_date": decode_datetime(s["registration_date"]),
+                    "event_date": decode_datetime(s["event_date"])
+                })
+                for s in cached_data
+            ]
+        
+        # Single JOIN query instead of one event lookup per attendance
+        schedule = self.attendance_repository.get_schedule(participant_id, skip, limit)
+        
+        # Cache results for 2 minutes
+        if schedule:
+            cache_data = [
+                {
+                    "attendance_id": s.attendance_id,
+                    "event_id": s.event_id,
+                    "participant_id": s.participant_id,
+                    "registration_date": s.registration_date.isoformat(),
+                    "event_name": s.event_name,
+                    "event_date": s.event_date.isoformat(),
+                    "event_location": s.event_location
+                }
+                for s in schedule
+            ]
+            # Tracked under the participant and under every event shown, so either one's writes drop the page
+            cache_client.set_tracked(
+                cache_key,
+                cache_data,
+                [f"attendances:participant:{participant_id}"] + [f"event:{s.event_id}:schedules" for s in schedule],
+                expiration=120
+            )
+        
+        return schedule
+    
     def cancel_attendance(self, attendance_id: int) -> bool:
         """Cancel an attendance registration"""
         # Get attendance to invalidate related caches
@@ -143,8 +292,20 @@ class AttendanceService:
         
         if result:
             # Invalidate caches
-            cache_client.delete(f"event:stats:{attendance.event_id}")
-            cache_client.delete(f"attendances:event:{attendance.event_id}")
-            cache_client.delete(f"attendances:participant:{attendance.participant_id}")
+            self._invalidate_attendance_lists(attendance)
+            self.unit_of_work.commit()
         
-        return result
\ No newline at end of file
+        return result
+    
+    def _invalidate_attendance_lists(self, attendance: Attendance):
+        """Schedule the cached lists, pages and stats an attendance appears in for deletion"""
+        self.unit_of_work.invalidate_on_commit(
+            f"event:stats:{attendance.event_id}",
+            f"attendances:event:{attendance.event_id}",
+            f"attendances:participant:{attendance.participant_id}"
+        )
+        # Field lists, roster pages and schedule pages of this event and participant
+        self.unit_of_work.invalidate_groups_on_commit(
+            f"attendances:event:{attendance.event_id}",
+            f"attendances:participant:{attendance.participant_id}"
+        )
\ No newline at end of file
@@ -1,14 +1,22 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from src.domain.entities.event import Event
+from src.domain.entities.event_summary import EventSummary
 from src.domain.interfaces.event_repository import EventRepository
+from src.domain.interfaces.unit_of_work import UnitOfWork
 from src.infrastructure.cache.cache_client import cache_client
+from src.infrastructure.cache.codec import decode_datetime, decode_row, encode_row
+
+EVENT_DATETIME_FIELDS = ("date", "created_at", "updated_at")
+# Field sets including these columns are nearly full rows: they share the full list cache
+EVENT_HEAVY_FIELDS = {"description"}
 
 
 class EventService:
     """Service containing business logic for events"""
     
-    def __init__(self, event_repository: EventRepository):
+    def __init__(self, event_repository: EventRepository, unit_of_work: UnitOfWork):
         self.event_repository = event_repository
+        self.unit_of_work = unit_of_work
     
     def create_event(self, event: Event) -> Event:
         """Create a new event with validation"""
@@ -19,8 +27,10 @@ class EventService:
         # Create event
         created_event = self.event_repository.create(event)
         
-        # Invalidate cache for events list
-        cache_client.delete("events:all")
+        # Invalidate cache for events list once the event is committed
+        self.unit_of_work.invalidate_on_commit("events:all", "events:summary:all")
+        self.unit_of_work.invalidate_groups_on_commit("events:fields")
+        self.unit_of_work.commit()
         
         return created_event
     
@@ -32,32 +42,41 @@ class EventService:
         
         if cached_data:
             # Reconstruct Event from cached data
-            return Event(
-                event_id=cached_data["id"],
-                name=cached_data["name"],
-                description=cached_data["description"],
-                date=cached_data["date"],
-                location=cached_data["location"],
-                capacity=cached_data["capacity"]
-            )
+            return self._from_cache(cached_data)
         
         # If not in cache, get from database
         event = self.event_repository.get_by_id(event_id)
         
         if event:
             # Store in cache for 5 minutes
-            cache_data = {
-                "id": event.id,
-                "name": event.name,
-                "description": event.description,
-                "date": event.date.isoformat(),
-                "location": event.location,
-                "capacity": event.capacity
-            }
-            cache_client.set(cache_key, cache_data, expiration=300)
+            cache_client.set(cache_key, self._to_cache(event), expiration=300)
         
         return event
     
+    def get_events_by_ids(self, event_ids: List[int]) -> Dict[int, Event]:
+        """Get several events by ID: one cache MGET, one query for the misses"""
+        # Try cache first, all keys in one round trip
+        cached_data = cache_client.get_many([f"event:{event_id}" for event_id in event_ids])
+        events = {
+            data["id"]: self._from_cache(data)
+            for data in cached_data
+            if data
+        }
+        
+        # Load every miss with a single IN query
+        misses = [event_id for event_id in event_ids if event_id not in events]
+        if misses:
+            loaded = self.event_repository.get_by_ids(misses)
+            
+            # Backfill the cache in one pipeline
+            cache_client.set_many(
+                {f"event:{e.id}": self._to_cache(e) for e in loaded},
+                expiration=300
+            )
+            events.update((e.id, e) for e in loaded)
+        
+        return events
+    
     def get_all_events(self) -> List[Event]:
         """Get all events with caching"""
         # Try cache first
@@ -66,13 +85,15 @@ class EventService:
         
         if cached_data:
             return [
-                Event(
-                    event_id=e["id"],
-                    name=e["name"],
-                    description=e["description"],
-                    date=e["date"],
-                    location=e["location"],
-                    capacity=e["capacity"]
+                Event.rehydrate(
+                    e["id"],
+                    e["name"],
+                    e["description"],
+                    decode_datetime(e["date"]),
+                    e["location"],
+                    e["capacity"],
+                    decode_datetime(e.get("created_at")),
+                    decode_datetime(e.get("updated_at"))
                 )
                 for e in cached_data
             ]
@@ -89,7 +110,9 @@ class EventService:
                     "description": e.description,
                     "date": e.date.isoformat(),
                     "location": e.location,
-                    "capacity": e.capacity
+                    "capacity": e.capacity,
+                    "created_at": e.created_at.isoformat(),
+                    "updated_at": e.updated_at.isoformat()
                 }
                 for e in events
             ]
@@ -97,6 +120,65 @@ class EventService:
         
         return events
     
+    def get_all_event_fields(self, fields: List[str]) -> List[dict]:
+        """Get only the given fields of all events with caching"""
+        if EVENT_HEAVY_FIELDS.intersection(fields):
+            # Caching another near-full copy per field set would not pay off
+            return [{name: getattr(e, name) for name in fields} for e in self.get_all_events()]
+        
+        # Try cache first (one entry per field set)
+        cache_key = f"events:fields:{','.join(fields)}"
+        cached_data = cache_client.get(cache_key)
+        
+        if cached_data:
+            return [decode_row(e, EVENT_DATETIME_FIELDS) for e in cached_data]
+        
+        # Get only the requested columns from database
+        rows = self.event_repository.get_all_fields(fields)
+        
+        # Cache the results
+        if rows:
+            cache_client.set_tracked(cache_key, [encode_row(e) for e in rows], ["events:fields"], expiration=300)
+        
+        return rows
+    
+    def get_all_event_summaries(self) -> List[EventSummary]:
+        """Get a summary of all events with caching"""
+        # Try cache first
+        cache_key = "events:summary:all"
+        cached_data = cache_client.get(cache_key)
+        
+        if cached_data:
+            return [
+                EventSummary(
+                    event_id=e["id"],
+                    name=e["name"],
+                    date=decode_datetime(e["date"]),
+                    location=e["location"],
+                    capacity=e["capacity"]
+                )
+                for e in cached_data
+            ]
+        
+        # Get from database (description column is not loaded)
+        summaries = self.event_repository.get_all_summaries()
+        
+        # Cache the results
+        if summaries:
+            cache_data = [
+                {
+                    "id": e.id,
+                    "name": e.name,
+                    "date": e.date.isoformat(),
+                    "location": e.location,
+                    "capacity": e.capacity
+                }
+                for e in summaries
+            ]
+            cache_client.set(cache_key, cache_data, expiration=300)
+        
+        return summaries
+    
     def update_event(self, event: Event) -> Event:
         """Update an event with validation"""
         # Validate event exists
@@ -108,9 +190,15 @@ class EventService:
         updated_event = self.event_repository.update(event)
         
         # Invalidate cache
-        cache_client.delete(f"event:{event.id}")
-        cache_client.delete("events:all")
-        cache_client.delete(f"event:stats:{event.id}")
+        self.unit_of_work.invalidate_on_commit(
+            f"event:{event.id}",
+            "events:all",
+            "events:summary:all",
+            f"event:stats:{event.id}"
+        )
+        # Schedule pages show the event's name, date and location
+        self.unit_of_work.invalidate_groups_on_commit("events:fields", f"event:{event.id}:schedules")
+        self.unit_of_work.commit()
         
         return updated_event
     
@@ -120,9 +208,18 @@ class EventService:
         
         if result:
             # Invalidate cache
-            cache_client.delete(f"event:{event_id}")
-            cache_client.delete("events:all")
-            cache_client.delete(f"event:stats:{event_id}")
+            self.unit_of_work.invalidate_on_commit(
+                f"event:{event_id}",
+                "events:all",
+                "events:summary:all",
+                f"event:stats:{event_id}"
+            )
+            self.unit_of_work.invalidate_groups_on_commit(
+                "events:fields",
+                f"attendances:event:{event_id}",
+                f"event:{event_id}:schedules"
+            )
+            self.unit_of_work.commit()
         
         return result
     
@@ -156,4 +253,32 @@ class EventService:
         # Cache for 2 minutes (stats change frequently)
         cache_client.set(cache_key, stats, expiration=120)
         
-        return stats
\ No newline at end of file
+        return stats
+    
+    @staticmethod
+    def _to_cache(event: Event) -> dict:
+        """Cache payload of a single event"""
+        return {
+            "id": event.id,
+            "name": event.name,
+            "description": event.description,
+            "date": event.date.isoformat(),
+            "location": event.location,
+            "capacity": event.capacity,
+            "created_at": event.created_at.isoformat(),
+            "updated_at": event.updated_at.isoformat()
+        }
+    
+    @staticmethod
+    def _from_cache(data: dict) -> Event:
+        """Rebuild an event from its cache payload"""
+        return Event.rehydrate(
+            data["id"],
+            data["name"],
+            data["description"],
+            decode_datetime(data["date"]),
+            data["location"],
+            data["capacity"],
+            decode_datetime(data.get("created_at")),
+            decode_datetime(data.get("updated_at"))
+        )
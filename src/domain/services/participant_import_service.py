@@ -0,0 +1,139 @@
+import csv
+import time
+from typing import Iterable, List, Optional, Set
+from src.domain.entities.participant import Participant
+from src.domain.interfaces.participant_repository import ParticipantRepository
+from src.domain.interfaces.unit_of_work import UnitOfWork
+from src.infrastructure.cache.cache_client import cache_client
+
+IMPORT_FIELDS = ("name", "email", "phone")
+# Column sizes of the participants table; longer values are reported per row
+# instead of failing the whole chunk's insert
+IMPORT_MAX_LENGTHS = {"name": 200, "email": 200, "phone": 20}
+
+
+class ParticipantImportService:
+    """Service importing participants from CSV files in bounded chunks"""
+    
+    def __init__(
+        self,
+        participant_repository: ParticipantRepository,
+        unit_of_work: UnitOfWork,
+        chunk_size: int = 1000,
+        max_reported_errors: int = 100
+    ):
+        self.participant_repository = participant_repository
+        self.unit_of_work = unit_of_work
+        self.chunk_size = chunk_size
+        self.max_reported_errors = max_reported_errors
+    
+    def create_import(self, import_id: str) -> dict:
+        """Register a new pending import and return its status"""
+        status = {
+            "import_id": import_id,
+            "status": "pending",
+            "rows_processed": 0,
+            "inserted": 0,
+            "duplicates": 0,
+            "invalid": 0,
+            "rows_per_second": 0.0,
+            "errors": []
+        }
+        self._save_status(status)
+        return status
+    
+    def get_import_status(self, import_id: str) -> Optional[dict]:
+        """Get the progress and error report of an import"""
+        return cache_client.get(self._cache_key(import_id))
+    
+    def run_import(self, import_id: str, lines: Iterable[str]) -> dict:
+        """Validate, deduplicate and insert participants chunk by chunk"""
+        status = self.get_import_status(import_id) or self.create_import(import_id)
+        status["status"] = "running"
+        self._save_status(status)
+        
+        started = time.perf_counter()
+        seen_emails: Set[str] = set()
+        chunk: List[Participant] = []
+        
+        try:
+            reader = csv.DictReader(lines)
+            missing = [f for f in IMPORT_FIELDS if f not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(f"Missing CSV columns: {', '.join(missing)}")
+            
+            # Line 1 is the header
+            for line_number, row in enumerate(reader, start=2):
+                status["rows_processed"] += 1
+                try:
+                    participant = self._parse_row(row)
+                except ValueError as e:
+                    status["invalid"] += 1
+                    self._report_error(status, line_number, str(e))
+                    continue
+                
+                if participant.email in seen_emails:
+                    status["duplicates"] += 1
+                    self._report_error(status, line_number, f"Duplicate email {participant.email} in file")
+                    continue
+                seen_emails.add(participant.email)
+                chunk.append(participant)
+                
+                if len(chunk) >= self.chunk_size:
+                    self._flush_chunk(chunk, status, started)
+                    chunk = []
+            
+            self._flush_chunk(chunk, status, started)
+            status["status"] = "completed"
+        except Exception as e:
+            self.unit_of_work.rollback()
+            status["status"] = "failed"
+            self._report_error(status, None, str(e))
+        
+        self._update_rate(status, started)
+        self._save_status(status)
+        return status
+    
+    def _flush_chunk(self, chunk: List[Participant], status: dict, started: float):
+        """Drop emails already stored, insert the rest and publish progress"""
+        if chunk:
+            existing = self.participant_repository.get_existing_emails([p.email for p in chunk])
+            new_participants = [p for p in chunk if p.email not in existing]
+            status["duplicates"] += len(chunk) - len(new_participants)
+            
+            if new_participants:
+                self.participant_repository.bulk_create(new_participants)
+                self.unit_of_work.invalidate_on_commit("participants:all")
+                self.unit_of_work.invalidate_groups_on_commit("participants:fields")
+                self.unit_of_work.commit()
+                status["inserted"] += len(new_participants)
+        
+        self._update_rate(status, started)
+        self._save_status(status)
+    
+    @staticmethod
+    def _parse_row(row: dict) -> Participant:
+        """Build a participant from a CSV row, enforcing the column sizes"""
+        values = {field: (row[field] or "").strip() for field in IMPORT_FIELDS}
+        for field, max_length in IMPORT_MAX_LENGTHS.items():
+            if len(values[field]) > max_length:
+                raise ValueError(f"{field.capitalize()} is longer than {max_length} characters")
+        return Participant(**values)
+    
+    def _report_error(self, status: dict, line_number: Optional[int], message: str):
+        """Record a row error, keeping the report bounded"""
+        if len(status["errors"]) < self.max_reported_errors:
+            status["errors"].append({"line": line_number, "error": message})
+    
+    @staticmethod
+    def _update_rate(status: dict, started: float):
+        elapsed = time.perf_counter() - started
+        status["rows_per_second"] = round(status["rows_processed"] / elapsed, 1) if elapsed > 0 else 0.0
+    
+    def _save_status(self, status: dict):
+        # Keep import reports around for an hour
+        cache_client.set(self._cache_key(status["import_id"]), status, expiration=3600)
+    
+    @staticmethod
+    def _cache_key(import_id: str) -> str:
+        return f"participants:import:{import_id}"
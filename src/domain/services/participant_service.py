@@ -1,14 +1,19 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from src.domain.entities.participant import Participant
 from src.domain.interfaces.participant_repository import ParticipantRepository
+from src.domain.interfaces.unit_of_work import UnitOfWork
 from src.infrastructure.cache.cache_client import cache_client
+from src.infrastructure.cache.codec import decode_datetime, decode_row, encode_row
+
+PARTICIPANT_DATETIME_FIELDS = ("created_at", "updated_at")
 
 
 class ParticipantService:
     """Service containing business logic for participants"""
     
-    def __init__(self, participant_repository: ParticipantRepository):
+    def __init__(self, participant_repository: ParticipantRepository, unit_of_work: UnitOfWork):
         self.participant_repository = participant_repository
+        self.unit_of_work = unit_of_work
     
     def create_participant(self, participant: Participant) -> Participant:
         """Create a new participant with validation"""
@@ -21,7 +26,9 @@ class ParticipantService:
         created_participant = self.participant_repository.create(participant)
         
         # Invalidate cache
-        cache_client.delete("participants:all")
+        self.unit_of_work.invalidate_on_commit("participants:all")
+        self.unit_of_work.invalidate_groups_on_commit("participants:fields")
+        self.unit_of_work.commit()
         
         return created_participant
     
@@ -32,28 +39,41 @@ class ParticipantService:
         cached_data = cache_client.get(cache_key)
         
         if cached_data:
-            return Participant(
-                participant_id=cached_data["id"],
-                name=cached_data["name"],
-                email=cached_data["email"],
-                phone=cached_data["phone"]
-            )
+            return self._from_cache(cached_data)
         
         # Get from database
         participant = self.participant_repository.get_by_id(participant_id)
         
         if participant:
             # Cache for 5 minutes
-            cache_data = {
-                "id": participant.id,
-                "name": participant.name,
-                "email": participant.email,
-                "phone": participant.phone
-            }
-            cache_client.set(cache_key, cache_data, expiration=300)
+            cache_client.set(cache_key, self._to_cache(participant), expiration=300)
         
         return participant
     
+    def get_participants_by_ids(self, participant_ids: List[int]) -> Dict[int, Participant]:
+        """Get several participants by ID: one cache MGET, one query for the misses"""
+        # Try cache first, all keys in one round trip
+        cached_data = cache_client.get_many([f"participant:{pid}" for pid in participant_ids])
+        participants = {
+            data["id"]: self._from_cache(data)
+            for data in cached_data
+            if data
+        }
+        
+        # Load every miss with a single IN query
+        misses = [pid for pid in participant_ids if pid not in participants]
+        if misses:
+            loaded = self.participant_repository.get_by_ids(misses)
+            
+            # Backfill the cache in one pipeline
+            cache_client.set_many(
+                {f"participant:{p.id}": self._to_cache(p) for p in loaded},
+                expiration=300
+            )
+            participants.update((p.id, p) for p in loaded)
+        
+        return participants
+    
     def get_all_participants(self) -> List[Participant]:
         """Get all participants with caching"""
         # Try cache first
@@ -62,11 +82,13 @@ class ParticipantService:
         
         if cached_data:
             return [
-                Participant(
-                    participant_id=p["id"],
-                    name=p["name"],
-                    email=p["email"],
-                    phone=p["phone"]
+                Participant.rehydrate(
+                    p["id"],
+                    p["name"],
+                    p["email"],
+                    p["phone"],
+                    decode_datetime(p.get("created_at")),
+                    decode_datetime(p.get("updated_at"))
                 )
                 for p in cached_data
             ]
@@ -81,7 +103,9 @@ class ParticipantService:
                     "id": p.id,
                     "name": p.name,
                     "email": p.email,
-                    "phone": p.phone
+                    "phone": p.phone,
+                    "created_at": p.created_at.isoformat(),
+                    "updated_at": p.updated_at.isoformat()
                 }
                 for p in participants
             ]
@@ -89,6 +113,24 @@ class ParticipantService:
         
         return participants
     
+    def get_all_participant_fields(self, fields: List[str]) -> List[dict]:
+        """Get only the given fields of all participants with caching"""
+        # Try cache first (one entry per field set)
+        cache_key = f"participants:fields:{','.join(fields)}"
+        cached_data = cache_client.get(cache_key)
+        
+        if cached_data:
+            return [decode_row(p, PARTICIPANT_DATETIME_FIELDS) for p in cached_data]
+        
+        # Get only the requested columns from database
+        rows = self.participant_repository.get_all_fields(fields)
+        
+        # Cache results
+        if rows:
+            cache_client.set_tracked(cache_key, [encode_row(p) for p in rows], ["participants:fields"], expiration=300)
+        
+        return rows
+    
     def update_participant(self, participant: Participant) -> Participant:
         """Update a participant with validation"""
         # Validate participant exists
@@ -104,19 +146,52 @@ class ParticipantService:
         # Update participant
         updated_participant = self.participant_repository.update(participant)
         
-        # Invalidate cache
-        cache_client.delete(f"participant:{participant.id}")
-        cache_client.delete("participants:all")
+        # Invalidate cache, including roster pages that show this participant
+        self.unit_of_work.invalidate_on_commit(f"participant:{participant.id}", "participants:all")
+        self.unit_of_work.invalidate_groups_on_commit("participants:fields", f"participant:{participant.id}:rosters")
+        self.unit_of_work.commit()
         
         return updated_participant
     
     def delete_participant(self, participant_id: int) -> bool:
         """Delete a participant"""
+        # Sparse attendance lists of these events lose rows when the attendances are cascaded away
+        event_ids = self.participant_repository.get_attended_event_ids(participant_id)
         result = self.participant_repository.delete(participant_id)
         
         if result:
             # Invalidate cache
-            cache_client.delete(f"participant:{participant_id}")
-            cache_client.delete("participants:all")
+            self.unit_of_work.invalidate_on_commit(f"participant:{participant_id}", "participants:all")
+            self.unit_of_work.invalidate_groups_on_commit(
+                "participants:fields",
+                f"participant:{participant_id}:rosters",
+                f"attendances:participant:{participant_id}",
+                *[f"attendances:event:{event_id}" for event_id in event_ids]
+            )
+            self.unit_of_work.commit()
         
-        return result
\ No newline at end of file
+        return result
+    
+    @staticmethod
+    def _to_cache(participant: Participant) -> dict:
+        """Cache payload of a single participant"""
+        return {
+            "id": participant.id,
+            "name": participant.name,
+            "email": participant.email,
+            "phone": participant.phone,
+            "created_at": participant.created_at.isoformat(),
+            "updated_at": participant.updated_at.isoformat()
+        }
+    
+    @staticmethod
+    def _from_cache(data: dict) -> Participant:
+        """Rebuild a participant from its cache payload"""
+        return Participant.rehydrate(
+            data["id"],
+            data["name"],
+            data["email"],
+            data["phone"],
+            decode_datetime(data.get("created_at")),
+            decode_datetime(data.get("updated_at"))
+        )
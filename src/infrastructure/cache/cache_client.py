@@ -1,14 +1,23 @@
 import redis
 import json
-from typing import Optional, Any, Dict
+import threading
+from fnmatch import fnmatchcase
+from typing import Optional, Any, Dict, Iterable, List, Set, Tuple
 from datetime import datetime, timedelta
 from src.infrastructure.config.settings import settings
+from src.infrastructure.telemetry.metrics import cache_redis_connected, count_cache_lookups
+from src.infrastructure.telemetry.request_timings import track_cache_call
+
+# Prefix of the sets holding the keys cached under a group (see CacheClient.set_tracked)
+KEYSET_PREFIX = "keyset:"
 
 
 class InMemoryCache:
     """Fallback cache using Python dictionary"""
     def __init__(self):
         self._cache: Dict[str, tuple[Any, datetime]] = {}
+        self._lock = threading.Lock()
+        self._purge_at_size = 1024
     
     def get(self, key: str) -> Optional[Any]:
         if key in self._cache:
@@ -23,34 +32,108 @@ class InMemoryCache:
         expiry_time = datetime.utcnow() + timedelta(seconds=expiration)
         self._cache[key] = (value, expiry_time)
     
+    def add(self, key: str, value: Any, expiration: int = 300) -> bool:
+        with self._lock:
+            if self.get(key) is not None:
+                return False
+            self.set(key, value, expiration)
+            return True
+    
+    def incr(self, key: str, expiration: int = 300) -> int:
+        with self._lock:
+            value = self.get(key)
+            if value is None:
+                self._purge_expired()
+                self.set(key, 1, expiration)
+                return 1
+            # Keep the expiry of the first increment, like a fixed window
+            self._cache[key] = (value + 1, self._cache[key][1])
+            return value + 1
+    
+    def _purge_expired(self):
+        # Counters are written per client and window but rarely read back once
+        # expired, so sweep them whenever the cache doubled since the last sweep
+        if len(self._cache) < self._purge_at_size:
+            return
+        now = datetime.utcnow()
+        for key in [key for key, (_, expiry) in self._cache.items() if expiry <= now]:
+            del self._cache[key]
+        self._purge_at_size = max(1024, 2 * len(self._cache))
+    
     def delete(self, key: str):
         if key in self._cache:
             del self._cache[key]
+    
+    def add_to_set(self, key: str, member: str, expiration: int = 300):
+        with self._lock:
+            members = self.get(key) or set()
+            members.add(member)
+            self.set(key, members, expiration)
+    
+    def pop_set(self, key: str) -> Set[str]:
+        with self._lock:
+            members = self.get(key) or set()
+            self.delete(key)
+            return members
+    
+    def items(self) -> List[Tuple[str, tuple]]:
+        """Copy of the (key, (value, expiry)) entries, expired ones included"""
+        with self._lock:
+            return list(self._cache.items())
+    
+    def clear_pattern(self, pattern: str) -> int:
+        keys = [key for key in self._cache if fnmatchcase(key, pattern)]
+        for key in keys:
+            del self._cache[key]
+        return len(keys)
+
+
+def _hits_and_misses(values: List[Optional[Any]]) -> Tuple[int, int]:
+    hits = sum(value is not None for value in values)
+    return hits, len(values) - hits
 
 
 class CacheClient:
     """Redis cache client with in-memory fallback"""
     
     def __init__(self):
-        self.use_redis = False
         self.memory_cache = InMemoryCache()
-        
-        try:
-            self.redis_client = redis.Redis(
-                host=settings.redis_host,
-                port=settings.redis_port,
-                db=settings.redis_db,
-                decode_responses=True,
-                socket_connect_timeout=2
-            )
-            # Test connection
-            self.redis_client.ping()
-            self.use_redis = True
-            print("✓ Redis cache connected successfully!")
-        except Exception as e:
-            print(f"⚠ Redis not available. Using in-memory cache. Error: {e}")
-            self.redis_client = None
+        self.redis_client = None
+        self._use_redis = False
+        self._connected = False
+        self._connect_lock = threading.Lock()
     
+    @property
+    def use_redis(self) -> bool:
+        """Whether Redis is in use; connects on first access so imports never block"""
+        if not self._connected:
+            self._connect()
+        return self._use_redis
+    
+    def _connect(self):
+        with self._connect_lock:
+            if self._connected:
+                return
+            try:
+                client = redis.Redis(
+                    host=settings.redis_host,
+                    port=settings.redis_port,
+                    db=settings.redis_db,
+                    decode_responses=True,
+                    socket_connect_timeout=2
+                )
+                # Test connection
+                client.ping()
+                self.redis_client = client
+                self._use_redis = True
+                print("✓ Redis cache connected successfully!")
+            except Exception as e:
+                print(f"⚠ Redis not available. Using in-memory cache. Error: {e}")
+            cache_redis_connected.set(1 if self._use_redis else 0)
+            self._connected = True
+    
+    @track_cache_call(count_hits=lambda value: value is not None)
+    @count_cache_lookups(lambda value: (1, 0) if value is not None else (0, 1))
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
         if self.use_redis:
@@ -63,6 +146,25 @@ class CacheClient:
         
         return self.memory_cache.get(key)
     
+    @track_cache_call(count_hits=lambda values: sum(value is not None for value in values))
+    @count_cache_lookups(_hits_and_misses)
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values in one round trip (None for each miss)"""
+        if not keys:
+            return []
+        if self.use_redis:
+            try:
+                values = self.redis_client.mget(keys)
+                return [
+                    json.loads(value) if value else self.memory_cache.get(key)
+                    for key, value in zip(keys, values)
+                ]
+            except Exception as e:
+                print(f"Redis mget error: {e}, falling back to memory cache")
+        
+        return [self.memory_cache.get(key) for key in keys]
+    
+    @track_cache_call()
     def set(self, key: str, value: Any, expiration: int = 300) -> bool:
         """Set value in cache with expiration"""
         if self.use_redis:
@@ -76,6 +178,54 @@ class CacheClient:
         self.memory_cache.set(key, value, expiration)
         return True
     
+    @track_cache_call()
+    def set_many(self, values: Dict[str, Any], expiration: int = 300) -> bool:
+        """Set several values with expiration in one pipelined round trip"""
+        if not values:
+            return True
+        if self.use_redis:
+            try:
+                pipeline = self.redis_client.pipeline(transaction=False)
+                for key, value in values.items():
+                    pipeline.setex(key, expiration, json.dumps(value))
+                pipeline.execute()
+                return True
+            except Exception as e:
+                print(f"Redis pipeline error: {e}, using memory cache")
+        
+        for key, value in values.items():
+            self.memory_cache.set(key, value, expiration)
+        return True
+    
+    @track_cache_call()
+    def add(self, key: str, value: Any, expiration: int = 300) -> bool:
+        """Set value only if the key does not exist yet (atomic); return whether it was set"""
+        if self.use_redis:
+            try:
+                serialized = json.dumps(value)
+                return bool(self.redis_client.set(key, serialized, ex=expiration, nx=True))
+            except Exception as e:
+                print(f"Redis add error: {e}, using memory cache")
+        
+        return self.memory_cache.add(key, value, expiration)
+    
+    @track_cache_call()
+    def incr_window(self, key: str, previous_key: str, expiration: int) -> Tuple[int, int]:
+        """Increment a window counter and read the previous window's count in one round trip"""
+        if self.use_redis:
+            try:
+                pipeline = self.redis_client.pipeline(transaction=False)
+                pipeline.incr(key)
+                pipeline.expire(key, expiration)
+                pipeline.get(previous_key)
+                current, _, previous = pipeline.execute()
+                return current, int(previous or 0)
+            except Exception as e:
+                print(f"Redis incr error: {e}, using memory cache")
+        
+        return self.memory_cache.incr(key, expiration), self.memory_cache.get(previous_key) or 0
+    
+    @track_cache_call()
     def delete(self, key: str) -> bool:
         """Delete key from cache"""
         if self.use_redis:
@@ -87,16 +237,69 @@ class CacheClient:
         self.memory_cache.delete(key)
         return True
     
+    @track_cache_call()
+    def set_tracked(self, key: str, value: Any, groups: Iterable[str], expiration: int = 300) -> bool:
+        """Set value with expiration and record its key in each group, in one pipelined round trip"""
+        groups = list(dict.fromkeys(groups))
+        if self.use_redis:
+            try:
+                pipeline = self.redis_client.pipeline(transaction=False)
+                pipeline.setex(key, expiration, json.dumps(value))
+                for group in groups:
+                    # Members share the page TTL, so the newest one bounds the set's lifetime
+                    pipeline.sadd(KEYSET_PREFIX + group, key)
+                    pipeline.expire(KEYSET_PREFIX + group, expiration)
+                pipeline.execute()
+                return True
+            except Exception as e:
+                print(f"Redis pipeline error: {e}, using memory cache")
+        
+        self.memory_cache.set(key, value, expiration)
+        for group in groups:
+            self.memory_cache.add_to_set(KEYSET_PREFIX + group, key, expiration)
+        return True
+    
+    @track_cache_call()
+    def invalidate(self, keys: Iterable[str], groups: Iterable[str] = ()) -> int:
+        """Delete keys and every key tracked in the groups: one DEL, after one SMEMBERS pipeline if groups"""
+        keys = list(keys)
+        set_keys = [KEYSET_PREFIX + group for group in dict.fromkeys(groups)]
+        deleted = 0
+        if self.use_redis:
+            try:
+                doomed = keys + set_keys
+                if set_keys:
+                    pipeline = self.redis_client.pipeline(transaction=False)
+                    for set_key in set_keys:
+                        pipeline.smembers(set_key)
+                    for members in pipeline.execute():
+                        doomed.extend(members)
+                if doomed:
+                    deleted = self.redis_client.delete(*doomed)
+            except Exception:
+                pass
+        
+        doomed = set(keys)
+        for set_key in set_keys:
+            doomed |= self.memory_cache.pop_set(set_key)
+        for key in doomed:
+            self.memory_cache.delete(key)
+        return deleted
+    
+    @track_cache_call()
     def clear_pattern(self, pattern: str) -> int:
         """Delete all keys matching pattern"""
+        deleted = 0
         if self.use_redis:
             try:
-                keys = self.redis_client.keys(pattern)
+                # SCAN instead of KEYS so large keyspaces don't block Redis
+                keys = list(self.redis_client.scan_iter(match=pattern, count=500))
                 if keys:
-                    return self.redis_client.delete(*keys)
+                    deleted = self.redis_client.delete(*keys)
             except Exception:
                 pass
-        return 0
+        
+        return deleted + self.memory_cache.clear_pattern(pattern)
     
     def ping(self) -> bool:
         """Check if Redis is available"""
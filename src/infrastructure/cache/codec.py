@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Iterable, Optional, Union
+
+
+def decode_datetime(value: Union[str, datetime, None]) -> Optional[datetime]:
+    """Turn an ISO-8601 string stored in the cache back into a datetime"""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def encode_row(row: dict) -> dict:
+    """Store a row's datetimes as ISO-8601 strings so it can be cached"""
+    return {
+        name: value.isoformat() if isinstance(value, datetime) else value
+        for name, value in row.items()
+    }
+
+
+def decode_row(row: dict, datetime_fields: Iterable[str]) -> dict:
+    """Turn the given fields of a cached row back into datetimes"""
+    for name in datetime_fields:
+        if name in row:
+            row[name] = decode_datetime(row[name])
+    return row
@@ -0,0 +1,47 @@
+import math
+import time
+from typing import Optional, Tuple
+from src.infrastructure.cache.cache_client import CacheClient, cache_client
+
+
+class SlidingWindowRateLimiter:
+    """Sliding-window request counters kept in the cache (Redis, or in-process when it is down).
+    
+    Each bucket keeps one counter per fixed window; the rate is the current
+    window's count plus the previous window's count weighted by how much of
+    it still overlaps the sliding window. That needs one pipelined round
+    trip per request and two small keys per client. Rejected requests are
+    counted too, so clients retrying before Retry-After stay limited.
+    """
+    
+    def __init__(self, cache: CacheClient = cache_client, prefix: str = "ratelimit"):
+        self.cache = cache
+        self.prefix = prefix
+    
+    def hit(
+        self,
+        bucket: str,
+        limit: int,
+        window_seconds: int,
+        now: Optional[float] = None
+    ) -> Tuple[bool, int]:
+        """Count a request; return whether it is allowed and, if not, seconds until retry"""
+        now = time.time() if now is None else now
+        window = int(now // window_seconds)
+        elapsed = now - window * window_seconds
+        
+        current, previous = self.cache.incr_window(
+            f"{self.prefix}:{bucket}:{window}",
+            f"{self.prefix}:{bucket}:{window - 1}",
+            expiration=2 * window_seconds
+        )
+        rate = current + previous * (1 - elapsed / window_seconds)
+        if rate <= limit:
+            return True, 0
+        
+        # Time until the previous window's weight has decayed enough
+        if current <= limit and previous:
+            retry_after = min((rate - limit) / previous * window_seconds, window_seconds - elapsed)
+        else:
+            retry_after = window_seconds - elapsed
+        return False, max(1, math.ceil(retry_after))
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, Optional
 
 
 class Settings(BaseSettings):
@@ -8,6 +8,9 @@ class Settings(BaseSettings):
     # Database
     database_url: str
     
+    # Schema check on startup: "create", "fingerprint" or "skip" (use python -m src.jobs.migrate)
+    schema_check: str = "fingerprint"
+    
     # Redis
     redis_host: str = "localhost"
     redis_port: int = 6379
@@ -18,9 +21,59 @@ class Settings(BaseSettings):
     api_port: int = 8000
     debug: bool = True
     
+    # Response compression (smaller bodies cost more CPU than they save)
+    gzip_minimum_size: int = 1024
+    gzip_compress_level: int = 6
+    
     # Security
     secret_key: str
     
+    # Rate limiting per client: "<requests>/<seconds>" or "unlimited".
+    # Route keys are "METHOD /path" globs; the first match wins, else the default applies.
+    # Clients are told apart by peer address: behind a proxy or load balancer, run uvicorn
+    # with --proxy-headers --forwarded-allow-ips=<proxy IPs> before enabling it, or every
+    # user shares the proxy's bucket.
+    rate_limit_enabled: bool = False
+    rate_limit_default: str = "600/60"
+    rate_limit_routes: Dict[str, str] = {
+        "GET /health": "unlimited",
+        "GET /metrics": "unlimited",
+        "GET /participants/": "120/60",
+        "POST /participants/import": "10/60"
+    }
+    
+    # Server-Timing breakdown (DB, cache, serialization) on a random share of requests
+    server_timing_enabled: bool = True
+    server_timing_sample_rate: float = 0.05
+    
+    # Prometheus metrics at /metrics; set PROMETHEUS_MULTIPROC_DIR when running several workers
+    metrics_enabled: bool = True
+    
+    # Slow query log (opt-in): statements over the threshold are aggregated by
+    # fingerprint at /admin/slow-queries, a sample of slow SELECTs is explained
+    slow_query_log_enabled: bool = False
+    slow_query_threshold_ms: float = 200.0
+    slow_query_explain_sample_rate: float = 0.1
+    slow_query_max_fingerprints: int = 500
+    
+    # Admin endpoints (/admin/*) require this token in X-Admin-Token; unset disables them
+    admin_token: Optional[str] = None
+    
+    # Sampling profiler: /admin/profile for the whole worker, X-Profile: 1 (plus the
+    # admin token) for single requests when request_profiling_enabled
+    request_profiling_enabled: bool = False
+    profile_interval_ms: float = 5.0
+    profile_max_seconds: float = 60.0
+    
+    # Idempotency keys
+    idempotency_ttl_seconds: int = 86400
+    idempotency_lock_seconds: int = 30
+    idempotency_wait_seconds: int = 10
+    
+    # Archival
+    archive_after_days: int = 365
+    archive_batch_size: int = 500
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -1,7 +1,12 @@
-from sqlalchemy import create_engine
+import hashlib
+from datetime import datetime
+from sqlalchemy import create_engine, Column, DateTime, MetaData, String, Table, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
 from src.infrastructure.config.settings import settings
+from src.infrastructure.telemetry.request_timings import mark_worker_started
 
 # Create database engine
 engine = create_engine(
@@ -16,9 +21,19 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Base class for models
 Base = declarative_base()
 
+# Fingerprint of the last schema applied by init_db (kept out of Base.metadata)
+schema_version = Table(
+    "schema_version",
+    MetaData(),
+    Column("fingerprint", String(64), primary_key=True),
+    Column("applied_at", DateTime, nullable=False)
+)
+
 
 def get_db():
     """Dependency for getting database session"""
+    # First code of the request running in the thread pool
+    mark_worker_started()
     db = SessionLocal()
     try:
         yield db
@@ -26,6 +41,55 @@ def get_db():
         db.close()
 
 
-def init_db():
-    """Initialize database tables"""
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+def schema_fingerprint(bind=engine) -> str:
+    """Hash of the DDL the models would create on this dialect"""
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=bind.dialect)))
+        ddl.extend(
+            str(CreateIndex(index).compile(dialect=bind.dialect))
+            for index in sorted(table.indexes, key=lambda i: i.name or "")
+        )
+    return hashlib.sha256("\n".join(ddl).encode()).hexdigest()
+
+
+def init_db(bind=engine, mode: str = None) -> bool:
+    """Initialize database tables and return whether the schema had to be applied.
+    
+    mode "create" always runs create_all, "fingerprint" only runs it when the
+    stored schema fingerprint differs, "skip" leaves the schema to migrate.
+    Workers booting together after a schema change may all apply it; the
+    first one records the fingerprint and the others accept its record.
+    """
+    mode = mode or settings.schema_check
+    if mode == "skip":
+        return False
+    
+    fingerprint = schema_fingerprint(bind)
+    if mode == "fingerprint":
+        try:
+            with bind.connect() as connection:
+                stored = connection.execute(
+                    select(schema_version.c.fingerprint).where(schema_version.c.fingerprint == fingerprint)
+                ).first()
+            if stored:
+                return False
+        except Exception:
+            # schema_version does not exist yet
+            pass
+    
+    Base.metadata.create_all(bind=bind)
+    schema_version.create(bind=bind, checkfirst=True)
+    try:
+        with bind.begin() as connection:
+            connection.execute(schema_version.delete())
+            connection.execute(schema_version.insert().values(fingerprint=fingerprint, applied_at=datetime.utcnow()))
+    except IntegrityError:
+        # Another worker recorded the fingerprint between our delete and insert
+        with bind.connect() as connection:
+            recorded = connection.execute(
+                select(schema_version.c.fingerprint).where(schema_version.c.fingerprint == fingerprint)
+            ).first()
+        if not recorded:
+            raise
+    return True
@@ -0,0 +1,69 @@
+from typing import Callable, Dict, Generic, Iterable, List, Optional, TypeVar
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+# Key under Session.info holding the request's loaders
+LOADERS_KEY = "entity_loaders"
+
+
+class EntityLoader(Generic[T]):
+    """Request-scoped memo of entities by ID.
+
+    Lookups of the same type are batched into one IN query (load_many) and
+    found entities are remembered until the session's unit of work rolls
+    back. Misses are not remembered, so rows committed meanwhile by others
+    are still found. Repositories prime the memo with what they write.
+    """
+
+    def __init__(self, batch_load: Callable[[List[int]], Iterable[T]], key: Callable[[T], int]):
+        self._batch_load = batch_load
+        self._key = key
+        self._memo: Dict[int, T] = {}
+
+    def load(self, entity_id: int) -> Optional[T]:
+        """Get one entity, querying only if it was not loaded yet"""
+        if entity_id not in self._memo:
+            self._fetch([entity_id])
+        return self._memo.get(entity_id)
+
+    def load_many(self, entity_ids: List[int]) -> Dict[int, T]:
+        """Get the existing entities among the IDs with at most one query for the unseen ones"""
+        unseen = [entity_id for entity_id in dict.fromkeys(entity_ids) if entity_id not in self._memo]
+        if unseen:
+            self._fetch(unseen)
+        return {
+            entity_id: self._memo[entity_id]
+            for entity_id in entity_ids
+            if entity_id in self._memo
+        }
+
+    def prime(self, entity_id: int, entity: T) -> None:
+        """Remember a written entity"""
+        self._memo[entity_id] = entity
+
+    def forget(self, entity_id: int) -> None:
+        """Drop a deleted entity"""
+        self._memo.pop(entity_id, None)
+
+    def _fetch(self, entity_ids: List[int]) -> None:
+        for entity in self._batch_load(entity_ids):
+            self._memo[self._key(entity)] = entity
+
+
+def get_loader(
+    session: Session,
+    name: str,
+    batch_load: Callable[[List[int]], Iterable[T]],
+    key: Callable[[T], int] = lambda entity: entity.id
+) -> EntityLoader[T]:
+    """Get the session's loader for one entity type, creating it on first use"""
+    loaders = session.info.setdefault(LOADERS_KEY, {})
+    if name not in loaders:
+        loaders[name] = EntityLoader(batch_load, key)
+    return loaders[name]
+
+
+def clear_loaders(session: Session) -> None:
+    """Forget everything the session's loaders remembered (e.g. after a rollback)"""
+    session.info.pop(LOADERS_KEY, None)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, DateTime
+from datetime import datetime
+from src.infrastructure.database.connection import Base
+
+
+class ArchivedAttendanceModel(Base):
+    """SQLAlchemy model for attendances of archived events"""
+    
+    __tablename__ = "attendances_archive"
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    event_id = Column(Integer, nullable=False, index=True)
+    participant_id = Column(Integer, nullable=False, index=True)
+    registration_date = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<ArchivedAttendanceModel(id={self.id}, event_id={self.event_id}, participant_id={self.participant_id})>"
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text
+from datetime import datetime
+from src.infrastructure.database.connection import Base
+
+
+class ArchivedEventModel(Base):
+    """SQLAlchemy model for finished events moved out of the events table"""
+    
+    __tablename__ = "events_archive"
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    name = Column(String(200), nullable=False)
+    description = Column(Text, nullable=False)
+    date = Column(DateTime, nullable=False, index=True)
+    location = Column(String(300), nullable=False)
+    capacity = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<ArchivedEventModel(id={self.id}, name='{self.name}')>"
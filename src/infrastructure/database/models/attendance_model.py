@@ -14,9 +14,10 @@ class AttendanceModel(Base):
     registration_date = Column(DateTime, default=datetime.utcnow, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
-    # Ensure a participant can only register once per event
+    # Ensure a participant can only register once per event; never reuse an archived attendance's ID
     __table_args__ = (
         UniqueConstraint('event_id', 'participant_id', name='unique_event_participant'),
+        {"sqlite_autoincrement": True}
     )
     
     def __repr__(self):
@@ -7,6 +7,8 @@ class EventModel(Base):
     """SQLAlchemy model for events table"""
     
     __tablename__ = "events"
+    # Never hand out an archived event's ID again (SQLite would reuse max(id) + 1)
+    __table_args__ = {"sqlite_autoincrement": True}
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), nullable=False, index=True)
@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import List
+from sqlalchemy import DateTime, delete, insert, literal, select
+from sqlalchemy.orm import Session
+from src.domain.interfaces.archive_repository import ArchiveRepository
+from src.infrastructure.database.models.event_model import EventModel
+from src.infrastructure.database.models.attendance_model import AttendanceModel
+from src.infrastructure.database.models.archived_event_model import ArchivedEventModel
+from src.infrastructure.database.models.archived_attendance_model import ArchivedAttendanceModel
+
+EVENT_COLUMNS = ["id", "name", "description", "date", "location", "capacity", "created_at", "updated_at"]
+ATTENDANCE_COLUMNS = ["id", "event_id", "participant_id", "registration_date", "created_at"]
+
+
+class ArchiveRepositoryImpl(ArchiveRepository):
+    """SQLAlchemy implementation of ArchiveRepository using INSERT ... SELECT"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_archivable_event_ids(self, cutoff: datetime, limit: int) -> List[int]:
+        """Get IDs of live events that took place before the cutoff"""
+        events = EventModel.__table__
+        return list(self.db.execute(
+            select(events.c.id)
+            .where(events.c.date < cutoff)
+            .order_by(events.c.id)
+            .limit(limit)
+        ).scalars())
+    
+    def archive_attendances(self, event_ids: List[int], limit: int) -> int:
+        """Move up to limit attendances of the given events and return how many moved"""
+        live = AttendanceModel.__table__
+        archive = ArchivedAttendanceModel.__table__
+        ids = list(self.db.execute(
+            select(live.c.id)
+            .where(live.c.event_id.in_(event_ids))
+            .order_by(live.c.id)
+            .limit(limit)
+        ).scalars())
+        if not ids:
+            return 0
+        
+        self.db.execute(
+            insert(archive).from_select(
+                ATTENDANCE_COLUMNS + ["archived_at"],
+                select(*[live.c[name] for name in ATTENDANCE_COLUMNS], _now()).where(live.c.id.in_(ids))
+            )
+        )
+        self.db.execute(delete(live).where(live.c.id.in_(ids)))
+        return len(ids)
+    
+    def archive_events(self, event_ids: List[int]) -> int:
+        """Move the given events and return how many moved"""
+        if not event_ids:
+            return 0
+        
+        live = EventModel.__table__
+        archive = ArchivedEventModel.__table__
+        self.db.execute(
+            insert(archive).from_select(
+                EVENT_COLUMNS + ["archived_at"],
+                select(*[live.c[name] for name in EVENT_COLUMNS], _now()).where(live.c.id.in_(event_ids))
+            )
+        )
+        result = self.db.execute(delete(live).where(live.c.id.in_(event_ids)))
+        return result.rowcount
+
+
+def _now():
+    """Archive timestamp bound as a typed literal for INSERT ... SELECT"""
+    return literal(datetime.utcnow(), DateTime)
@@ -1,8 +1,18 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
+from sqlalchemy import delete, func, select, union_all
 from sqlalchemy.orm import Session
 from src.domain.interfaces.attendance_repository import AttendanceRepository
 from src.domain.entities.attendance import Attendance
+from src.domain.entities.roster_entry import RosterEntry
+from src.domain.entities.schedule_entry import ScheduleEntry
+from src.infrastructure.database.loader import EntityLoader, get_loader
 from src.infrastructure.database.models.attendance_model import AttendanceModel
+from src.infrastructure.database.models.event_model import EventModel
+from src.infrastructure.database.models.participant_model import ParticipantModel
+from src.infrastructure.database.models.archived_attendance_model import ArchivedAttendanceModel
+from src.infrastructure.database.models.archived_event_model import ArchivedEventModel
+
+ATTENDANCE_COLUMNS = ["id", "event_id", "participant_id", "registration_date", "created_at"]
 
 
 class AttendanceRepositoryImpl(AttendanceRepository):
@@ -19,16 +29,30 @@ class AttendanceRepositoryImpl(AttendanceRepository):
             registration_date=attendance.registration_date
         )
         self.db.add(db_attendance)
-        self.db.commit()
-        self.db.refresh(db_attendance)
-        return self._to_entity(db_attendance)
+        self.db.flush()
+        created = self._to_entity(db_attendance)
+        self._loader().prime(created.id, created)
+        return created
     
     def get_by_id(self, attendance_id: int) -> Optional[Attendance]:
-        """Get attendance by ID"""
-        db_attendance = self.db.query(AttendanceModel).filter(
-            AttendanceModel.id == attendance_id
-        ).first()
-        return self._to_entity(db_attendance) if db_attendance else None
+        """Get attendance by ID (memoized for the rest of the request)"""
+        return self._loader().load(attendance_id)
+    
+    def _fetch_by_ids(self, attendance_ids: List[int]) -> List[Attendance]:
+        """Load attendances with one IN query, falling back to the archive for the rest"""
+        table = AttendanceModel.__table__
+        rows = self.db.execute(
+            select(*[table.c[name] for name in ATTENDANCE_COLUMNS]).where(table.c.id.in_(attendance_ids))
+        ).all()
+        
+        # Attendances of finished events may have been archived
+        missing = set(attendance_ids) - {row.id for row in rows}
+        if missing:
+            archive = ArchivedAttendanceModel.__table__
+            rows += self.db.execute(
+                select(*[archive.c[name] for name in ATTENDANCE_COLUMNS]).where(archive.c.id.in_(missing))
+            ).all()
+        return [self._to_entity(row) for row in rows]
     
     def get_by_event_and_participant(
         self, 
@@ -44,30 +68,114 @@ class AttendanceRepositoryImpl(AttendanceRepository):
     
     def get_by_event(self, event_id: int) -> List[Attendance]:
         """Get all attendances for an event"""
-        db_attendances = self.db.query(AttendanceModel).filter(
-            AttendanceModel.event_id == event_id
-        ).all()
-        return [self._to_entity(a) for a in db_attendances]
+        # Core select: plain rows, no ORM instances or identity map bookkeeping
+        rows = self.db.execute(self._event_attendances(event_id, ATTENDANCE_COLUMNS)).all()
+        return [self._to_entity(row) for row in rows]
     
     def get_by_participant(self, participant_id: int) -> List[Attendance]:
         """Get all attendances for a participant"""
-        db_attendances = self.db.query(AttendanceModel).filter(
-            AttendanceModel.participant_id == participant_id
+        # Core select: plain rows, no ORM instances or identity map bookkeeping
+        table = AttendanceModel.__table__
+        archive = ArchivedAttendanceModel.__table__
+        rows = self.db.execute(union_all(
+            select(*[table.c[name] for name in ATTENDANCE_COLUMNS])
+            .where(table.c.participant_id == participant_id),
+            select(*[archive.c[name] for name in ATTENDANCE_COLUMNS])
+            .where(archive.c.participant_id == participant_id)
+        )).all()
+        return [self._to_entity(row) for row in rows]
+    
+    def get_by_event_fields(self, event_id: int, fields: List[str]) -> List[dict]:
+        """Get only the given columns of an event's attendances"""
+        rows = self.db.execute(self._event_attendances(event_id, fields)).all()
+        return [dict(zip(fields, row)) for row in rows]
+    
+    def get_by_participant_fields(self, participant_id: int, fields: List[str]) -> List[dict]:
+        """Get only the given columns of a participant's attendances"""
+        table = AttendanceModel.__table__
+        archive = ArchivedAttendanceModel.__table__
+        rows = self.db.execute(union_all(
+            select(*[table.c[name] for name in fields])
+            .where(table.c.participant_id == participant_id),
+            select(*[archive.c[name] for name in fields])
+            .where(archive.c.participant_id == participant_id)
+        )).all()
+        return [dict(zip(fields, row)) for row in rows]
+    
+    def get_roster(self, event_id: int, skip: int, limit: int) -> List[RosterEntry]:
+        """Get a page of an event's attendances with participant details"""
+        rows = self.db.execute(
+            self._roster_query(event_id).offset(skip).limit(limit)
         ).all()
-        return [self._to_entity(a) for a in db_attendances]
+        return [self._to_roster_entry(row) for row in rows]
+    
+    def iter_roster(self, event_id: int, batch_size: int = 1000) -> Iterator[RosterEntry]:
+        """Stream an event's attendances with participant details"""
+        # Server-side cursor: rows are fetched batch_size at a time
+        result = self.db.execute(
+            self._roster_query(event_id).execution_options(yield_per=batch_size)
+        )
+        for partition in result.partitions():
+            for row in partition:
+                yield self._to_roster_entry(row)
+    
+    def get_schedule(self, participant_id: int, skip: int, limit: int) -> List[ScheduleEntry]:
+        """Get a page of a participant's attendances with event details"""
+        live, archive = AttendanceModel.__table__, ArchivedAttendanceModel.__table__
+        attendances = union_all(
+            select(*[live.c[name] for name in ATTENDANCE_COLUMNS]).where(live.c.participant_id == participant_id),
+            select(*[archive.c[name] for name in ATTENDANCE_COLUMNS]).where(archive.c.participant_id == participant_id)
+        ).subquery()
+        # Each event is either live or archived; attendances are archived before their event
+        events, archived_events = EventModel.__table__, ArchivedEventModel.__table__
+        event_date = func.coalesce(events.c.date, archived_events.c.date)
+        rows = self.db.execute(
+            select(
+                attendances.c.id,
+                attendances.c.event_id,
+                attendances.c.participant_id,
+                attendances.c.registration_date,
+                func.coalesce(events.c.name, archived_events.c.name).label("name"),
+                event_date.label("date"),
+                func.coalesce(events.c.location, archived_events.c.location).label("location")
+            )
+            .outerjoin(events, events.c.id == attendances.c.event_id)
+            .outerjoin(archived_events, archived_events.c.id == attendances.c.event_id)
+            .order_by(event_date, attendances.c.id)
+            .offset(skip)
+            .limit(limit)
+        ).all()
+        return [
+            ScheduleEntry(
+                attendance_id=row.id,
+                event_id=row.event_id,
+                participant_id=row.participant_id,
+                registration_date=row.registration_date,
+                event_name=row.name,
+                event_date=row.date,
+                event_location=row.location
+            )
+            for row in rows
+        ]
     
     def delete(self, attendance_id: int) -> bool:
         """Delete an attendance registration"""
-        db_attendance = self.db.query(AttendanceModel).filter(
-            AttendanceModel.id == attendance_id
-        ).first()
-        if not db_attendance:
+        table = AttendanceModel.__table__
+        result = self.db.execute(delete(table).where(table.c.id == attendance_id))
+        if result.rowcount == 0:
             return False
         
-        self.db.delete(db_attendance)
-        self.db.commit()
+        self._loader().forget(attendance_id)
         return True
     
+    def _event_attendances(self, event_id: int, columns: List[str]):
+        """UNION ALL of an event's live and archived attendances (rows move between them in batches)"""
+        live, archive = AttendanceModel.__table__, ArchivedAttendanceModel.__table__
+        return union_all(
+            select(*[live.c[name] for name in columns]).where(live.c.event_id == event_id),
+            select(*[archive.c[name] for name in columns]).where(archive.c.event_id == event_id)
+        )
+    
     def count_by_event(self, event_id: int) -> int:
         """Count attendees for an event"""
         return self.db.query(AttendanceModel).filter(
@@ -75,11 +183,45 @@ class AttendanceRepositoryImpl(AttendanceRepository):
         ).count()
     
     def _to_entity(self, model: AttendanceModel) -> Attendance:
-        """Convert database model to domain entity"""
-        return Attendance(
-            attendance_id=model.id,
-            event_id=model.event_id,
-            participant_id=model.participant_id,
-            registration_date=model.registration_date,
-            created_at=model.created_at
-        )
\ No newline at end of file
+        """Convert database model (or Core result row) to domain entity"""
+        return Attendance.rehydrate(
+            model.id,
+            model.event_id,
+            model.participant_id,
+            model.registration_date,
+            model.created_at
+        )
+    
+    def _loader(self) -> EntityLoader[Attendance]:
+        """The request's attendance loader"""
+        return get_loader(self.db, "attendances", self._fetch_by_ids)
+    
+    def _roster_query(self, event_id: int):
+        """Build the attendance/participant JOIN for an event's roster, archived attendances included"""
+        attendances = self._event_attendances(event_id, ATTENDANCE_COLUMNS).subquery()
+        participants = ParticipantModel.__table__
+        return (
+            select(
+                attendances.c.id,
+                attendances.c.event_id,
+                attendances.c.participant_id,
+                attendances.c.registration_date,
+                participants.c.name,
+                participants.c.email,
+                participants.c.phone
+            )
+            .join(participants, participants.c.id == attendances.c.participant_id)
+            .order_by(attendances.c.id)
+        )
+    
+    def _to_roster_entry(self, row) -> RosterEntry:
+        """Convert a roster result row to a read model"""
+        return RosterEntry(
+            attendance_id=row.id,
+            event_id=row.event_id,
+            participant_id=row.participant_id,
+            registration_date=row.registration_date,
+            participant_name=row.name,
+            participant_email=row.email,
+            participant_phone=row.phone
+        )
@@ -1,9 +1,15 @@
+from datetime import datetime
 from typing import List, Optional
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.orm import Session
 from src.domain.interfaces.event_repository import EventRepository
 from src.domain.entities.event import Event
+from src.domain.entities.event_summary import EventSummary
+from src.infrastructure.database.loader import EntityLoader, get_loader
 from src.infrastructure.database.models.event_model import EventModel
 from src.infrastructure.database.models.attendance_model import AttendanceModel
+from src.infrastructure.database.models.archived_event_model import ArchivedEventModel
+from src.infrastructure.database.models.archived_attendance_model import ArchivedAttendanceModel
 
 
 class EventRepositoryImpl(EventRepository):
@@ -22,62 +28,137 @@ class EventRepositoryImpl(EventRepository):
             capacity=event.capacity
         )
         self.db.add(db_event)
-        self.db.commit()
-        self.db.refresh(db_event)
-        return self._to_entity(db_event)
+        self.db.flush()
+        created = self._to_entity(db_event)
+        self._loader().prime(created.id, created)
+        return created
     
     def get_by_id(self, event_id: int) -> Optional[Event]:
-        """Get event by ID"""
-        db_event = self.db.query(EventModel).filter(EventModel.id == event_id).first()
-        return self._to_entity(db_event) if db_event else None
+        """Get event by ID (memoized for the rest of the request)"""
+        return self._loader().load(event_id)
+    
+    def get_by_ids(self, event_ids: List[int]) -> List[Event]:
+        """Get the existing events among the given IDs (in no particular order)"""
+        return list(self._loader().load_many(event_ids).values())
+    
+    def _fetch_by_ids(self, event_ids: List[int]) -> List[Event]:
+        """Load events with one IN query, falling back to the archive for the rest"""
+        table = EventModel.__table__
+        rows = self.db.execute(select(table).where(table.c.id.in_(event_ids))).all()
+        
+        # Finished events may have been moved to the archive
+        missing = set(event_ids) - {row.id for row in rows}
+        if missing:
+            archive = ArchivedEventModel.__table__
+            rows += self.db.execute(
+                select(*[archive.c[column.name] for column in table.columns])
+                .where(archive.c.id.in_(missing))
+            ).all()
+        return [self._to_entity(row) for row in rows]
     
     def get_all(self) -> List[Event]:
         """Get all events"""
-        db_events = self.db.query(EventModel).all()
-        return [self._to_entity(e) for e in db_events]
+        # Core select: plain rows, no ORM instances or identity map bookkeeping
+        rows = self.db.execute(select(EventModel.__table__)).all()
+        return [self._to_entity(row) for row in rows]
+    
+    def get_all_fields(self, fields: List[str]) -> List[dict]:
+        """Get only the given columns of all events"""
+        table = EventModel.__table__
+        rows = self.db.execute(select(*[table.c[name] for name in fields])).all()
+        return [dict(zip(fields, row)) for row in rows]
+    
+    def get_all_summaries(self) -> List[EventSummary]:
+        """Get a summary of all events without their descriptions"""
+        rows = self.db.query(
+            EventModel.id,
+            EventModel.name,
+            EventModel.date,
+            EventModel.location,
+            EventModel.capacity
+        ).all()
+        return [
+            EventSummary(
+                event_id=row.id,
+                name=row.name,
+                date=row.date,
+                location=row.location,
+                capacity=row.capacity
+            )
+            for row in rows
+        ]
     
     def update(self, event: Event) -> Event:
         """Update an existing event"""
-        db_event = self.db.query(EventModel).filter(EventModel.id == event.id).first()
-        if not db_event:
+        # The service usually loaded the event already, so this is served from the loader
+        existing = self.get_by_id(event.id)
+        if not existing:
             raise ValueError(f"Event with id {event.id} not found")
         
-        db_event.name = event.name
-        db_event.description = event.description
-        db_event.date = event.date
-        db_event.location = event.location
-        db_event.capacity = event.capacity
+        updated_at = datetime.utcnow()
+        table = EventModel.__table__
+        result = self.db.execute(
+            update(table)
+            .where(table.c.id == event.id)
+            .values(
+                name=event.name,
+                description=event.description,
+                date=event.date,
+                location=event.location,
+                capacity=event.capacity,
+                updated_at=updated_at
+            )
+        )
+        if result.rowcount == 0:
+            # Archived events are read-only
+            raise ValueError(f"Event with id {event.id} not found")
         
-        self.db.commit()
-        self.db.refresh(db_event)
-        return self._to_entity(db_event)
+        updated = Event.rehydrate(
+            event.id,
+            event.name,
+            event.description,
+            event.date,
+            event.location,
+            event.capacity,
+            existing.created_at,
+            updated_at
+        )
+        self._loader().prime(event.id, updated)
+        return updated
     
     def delete(self, event_id: int) -> bool:
         """Delete an event"""
-        db_event = self.db.query(EventModel).filter(EventModel.id == event_id).first()
-        if not db_event:
+        table = EventModel.__table__
+        result = self.db.execute(delete(table).where(table.c.id == event_id))
+        if result.rowcount == 0:
             return False
         
-        self.db.delete(db_event)
-        self.db.commit()
+        self._loader().forget(event_id)
         return True
     
     def get_attendee_count(self, event_id: int) -> int:
-        """Get current attendee count for an event"""
-        count = self.db.query(AttendanceModel).filter(
-            AttendanceModel.event_id == event_id
-        ).count()
-        return count
+        """Get current attendee count for an event, archived attendances included"""
+        # Both tables in one statement: archiving moves an event's attendances in batches
+        live, archive = AttendanceModel.__table__, ArchivedAttendanceModel.__table__
+        live_count = select(func.count()).select_from(live).where(live.c.event_id == event_id).scalar_subquery()
+        archived_count = (
+            select(func.count()).select_from(archive).where(archive.c.event_id == event_id).scalar_subquery()
+        )
+        return self.db.execute(select(live_count + archived_count)).scalar_one()
     
     def _to_entity(self, model: EventModel) -> Event:
-        """Convert database model to domain entity"""
-        return Event(
-            event_id=model.id,
-            name=model.name,
-            description=model.description,
-            date=model.date,
-            location=model.location,
-            capacity=model.capacity,
-            created_at=model.created_at,
-            updated_at=model.updated_at
-        )
\ No newline at end of file
+        """Convert database model (or Core result row) to domain entity"""
+        return Event.rehydrate(
+            model.id,
+            model.name,
+            model.description,
+            model.date,
+            model.location,
+            model.capacity,
+            model.created_at,
+            model.updated_at
+        )
+    
+    def _loader(self) -> EntityLoader[Event]:
+        """The request's event loader"""
+        return get_loader(self.db, "events", self._fetch_by_ids)
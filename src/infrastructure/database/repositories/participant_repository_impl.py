@@ -1,8 +1,12 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Set
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 from src.domain.interfaces.participant_repository import ParticipantRepository
 from src.domain.entities.participant import Participant
+from src.infrastructure.database.loader import EntityLoader, get_loader
 from src.infrastructure.database.models.participant_model import ParticipantModel
+from src.infrastructure.database.models.attendance_model import AttendanceModel
 
 
 class ParticipantRepositoryImpl(ParticipantRepository):
@@ -19,64 +23,136 @@ class ParticipantRepositoryImpl(ParticipantRepository):
             phone=participant.phone
         )
         self.db.add(db_participant)
-        self.db.commit()
-        self.db.refresh(db_participant)
-        return self._to_entity(db_participant)
+        self.db.flush()
+        created = self._to_entity(db_participant)
+        self._loader().prime(created.id, created)
+        return created
+    
+    def bulk_create(self, participants: List[Participant]) -> int:
+        """Insert many participants at once and return how many were inserted"""
+        if not participants:
+            return 0
+        
+        # Core executemany: no ORM instances, no per-row RETURNING
+        self.db.execute(insert(ParticipantModel.__table__), [
+            {
+                "name": p.name,
+                "email": p.email,
+                "phone": p.phone,
+                "created_at": p.created_at,
+                "updated_at": p.updated_at
+            }
+            for p in participants
+        ])
+        return len(participants)
     
     def get_by_id(self, participant_id: int) -> Optional[Participant]:
-        """Get participant by ID"""
-        db_participant = self.db.query(ParticipantModel).filter(
-            ParticipantModel.id == participant_id
-        ).first()
-        return self._to_entity(db_participant) if db_participant else None
+        """Get participant by ID (memoized for the rest of the request)"""
+        return self._loader().load(participant_id)
+    
+    def get_by_ids(self, participant_ids: List[int]) -> List[Participant]:
+        """Get the existing participants among the given IDs (in no particular order)"""
+        return list(self._loader().load_many(participant_ids).values())
+    
+    def _fetch_by_ids(self, participant_ids: List[int]) -> List[Participant]:
+        """Load participants with one IN query"""
+        table = ParticipantModel.__table__
+        rows = self.db.execute(select(table).where(table.c.id.in_(participant_ids))).all()
+        return [self._to_entity(row) for row in rows]
     
     def get_by_email(self, email: str) -> Optional[Participant]:
         """Get participant by email"""
-        db_participant = self.db.query(ParticipantModel).filter(
-            ParticipantModel.email == email
-        ).first()
-        return self._to_entity(db_participant) if db_participant else None
+        table = ParticipantModel.__table__
+        row = self.db.execute(select(table).where(table.c.email == email)).first()
+        if not row:
+            return None
+        
+        # Later lookups by ID in this request are served from the loader
+        participant = self._to_entity(row)
+        self._loader().prime(participant.id, participant)
+        return participant
+    
+    def get_existing_emails(self, emails: List[str]) -> Set[str]:
+        """Get which of the given emails are already registered"""
+        if not emails:
+            return set()
+        
+        table = ParticipantModel.__table__
+        return set(self.db.execute(
+            select(table.c.email).where(table.c.email.in_(emails))
+        ).scalars())
     
     def get_all(self) -> List[Participant]:
         """Get all participants"""
-        db_participants = self.db.query(ParticipantModel).all()
-        return [self._to_entity(p) for p in db_participants]
+        # Core select: plain rows, no ORM instances or identity map bookkeeping
+        rows = self.db.execute(select(ParticipantModel.__table__)).all()
+        return [self._to_entity(row) for row in rows]
+    
+    def get_all_fields(self, fields: List[str]) -> List[dict]:
+        """Get only the given columns of all participants"""
+        table = ParticipantModel.__table__
+        rows = self.db.execute(select(*[table.c[name] for name in fields])).all()
+        return [dict(zip(fields, row)) for row in rows]
     
     def update(self, participant: Participant) -> Participant:
         """Update an existing participant"""
-        db_participant = self.db.query(ParticipantModel).filter(
-            ParticipantModel.id == participant.id
-        ).first()
-        if not db_participant:
+        # The service usually loaded the participant already, so this is served from the loader
+        existing = self.get_by_id(participant.id)
+        if not existing:
             raise ValueError(f"Participant with id {participant.id} not found")
         
-        db_participant.name = participant.name
-        db_participant.email = participant.email
-        db_participant.phone = participant.phone
+        updated_at = datetime.utcnow()
+        table = ParticipantModel.__table__
+        self.db.execute(
+            update(table)
+            .where(table.c.id == participant.id)
+            .values(
+                name=participant.name,
+                email=participant.email,
+                phone=participant.phone,
+                updated_at=updated_at
+            )
+        )
         
-        self.db.commit()
-        self.db.refresh(db_participant)
-        return self._to_entity(db_participant)
+        updated = Participant.rehydrate(
+            participant.id,
+            participant.name,
+            participant.email,
+            participant.phone,
+            existing.created_at,
+            updated_at
+        )
+        self._loader().prime(participant.id, updated)
+        return updated
     
     def delete(self, participant_id: int) -> bool:
         """Delete a participant"""
-        db_participant = self.db.query(ParticipantModel).filter(
-            ParticipantModel.id == participant_id
-        ).first()
-        if not db_participant:
+        table = ParticipantModel.__table__
+        result = self.db.execute(delete(table).where(table.c.id == participant_id))
+        if result.rowcount == 0:
             return False
         
-        self.db.delete(db_participant)
-        self.db.commit()
+        self._loader().forget(participant_id)
         return True
     
+    def get_attended_event_ids(self, participant_id: int) -> List[int]:
+        """Get the IDs of the events a participant is registered to"""
+        table = AttendanceModel.__table__
+        return list(self.db.execute(
+            select(table.c.event_id).where(table.c.participant_id == participant_id)
+        ).scalars())
+    
     def _to_entity(self, model: ParticipantModel) -> Participant:
-        """Convert database model to domain entity"""
-        return Participant(
-            participant_id=model.id,
-            name=model.name,
-            email=model.email,
-            phone=model.phone,
-            created_at=model.created_at,
-            updated_at=model.updated_at
-        )
\ No newline at end of file
+        """Convert database model (or Core result row) to domain entity"""
+        return Participant.rehydrate(
+            model.id,
+            model.name,
+            model.email,
+            model.phone,
+            model.created_at,
+            model.updated_at
+        )
+    
+    def _loader(self) -> EntityLoader[Participant]:
+        """The request's participant loader"""
+        return get_loader(self.db, "participants", self._fetch_by_ids)
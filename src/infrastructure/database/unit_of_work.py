@@ -0,0 +1,60 @@
+from typing import List
+from fastapi import Depends
+from sqlalchemy.orm import Session
+from src.domain.interfaces.unit_of_work import UnitOfWork
+from src.infrastructure.cache.cache_client import CacheClient, cache_client
+from src.infrastructure.database.connection import get_db
+from src.infrastructure.database.loader import clear_loaders
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+    """Unit of work wrapping the request's SQLAlchemy session.
+    
+    Repositories only flush; the unit of work issues a single commit per
+    logical operation and deletes stale cache keys once that commit succeeded.
+    """
+    
+    def __init__(self, session: Session, cache: CacheClient = cache_client):
+        self.session = session
+        self.cache = cache
+        self._pending_invalidations: List[str] = []
+        self._pending_group_invalidations: List[str] = []
+    
+    def commit(self) -> None:
+        """Commit all pending changes and run deferred cache invalidations"""
+        try:
+            self.session.commit()
+        except Exception:
+            self.rollback()
+            raise
+        
+        keys, self._pending_invalidations = self._pending_invalidations, []
+        groups, self._pending_group_invalidations = self._pending_group_invalidations, []
+        if keys or groups:
+            # Exact keys only: no keyspace scans on the write path
+            self.cache.invalidate(keys, groups)
+    
+    def rollback(self) -> None:
+        """Discard pending changes and deferred cache invalidations"""
+        self._pending_invalidations = []
+        self._pending_group_invalidations = []
+        self.session.rollback()
+        # Entities written in the rolled back transaction must not be served again
+        clear_loaders(self.session)
+    
+    def invalidate_on_commit(self, *cache_keys: str) -> None:
+        """Schedule cache keys to be deleted after a successful commit"""
+        for key in cache_keys:
+            if key not in self._pending_invalidations:
+                self._pending_invalidations.append(key)
+    
+    def invalidate_groups_on_commit(self, *groups: str) -> None:
+        """Schedule every cache key tracked in the given groups to be deleted after a successful commit"""
+        for group in groups:
+            if group not in self._pending_group_invalidations:
+                self._pending_group_invalidations.append(group)
+
+
+def get_unit_of_work(db: Session = Depends(get_db)) -> SqlAlchemyUnitOfWork:
+    """Dependency for getting a request-scoped unit of work"""
+    return SqlAlchemyUnitOfWork(db)
@@ -0,0 +1,142 @@
+import gc
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from src.infrastructure.telemetry.profiler import SOURCE_ROOT
+
+# Frames kept per allocation so allocations made inside libraries are still
+# attributed to the application code that asked for them
+TRACE_FRAMES = 25
+
+# Modules whose instances the census counts
+CENSUS_MODULES = {
+    "entities": "src.domain.entities.",
+    "orm_models": "src.infrastructure.database.models.",
+    "dtos": "src.application.dtos."
+}
+
+
+def _app_filter() -> tracemalloc.Filter:
+    return tracemalloc.Filter(True, os.path.join(SOURCE_ROOT, "*"), all_frames=True)
+
+
+def _location(stat: tracemalloc.StatisticDiff) -> str:
+    # Innermost application frame, else the innermost frame
+    frames = list(stat.traceback)
+    frame = next((f for f in reversed(frames) if f.filename.startswith(SOURCE_ROOT)), frames[-1])
+    return f"{os.path.relpath(frame.filename, os.path.dirname(SOURCE_ROOT))}:{frame.lineno}"
+
+
+def compare_snapshots(
+    before: tracemalloc.Snapshot,
+    after: tracemalloc.Snapshot,
+    limit: int = 10
+) -> Tuple[int, List[dict]]:
+    """Net bytes the application code gained between two snapshots and the largest growers"""
+    stats = after.filter_traces([_app_filter()]).compare_to(before.filter_traces([_app_filter()]), "traceback")
+    grown: Dict[str, dict] = {}
+    for stat in stats:
+        if stat.size_diff == 0:
+            continue
+        entry = grown.setdefault(_location(stat), {"size_diff": 0, "count_diff": 0})
+        entry["size_diff"] += stat.size_diff
+        entry["count_diff"] += stat.count_diff
+    top = sorted(grown.items(), key=lambda item: item[1]["size_diff"], reverse=True)[:limit]
+    return (
+        sum(stat.size_diff for stat in stats),
+        [{"location": location, **entry} for location, entry in top]
+    )
+
+
+class MemoryTracker:
+    """tracemalloc on demand: start with a baseline snapshot, diff later ones against it.
+
+    Tracing slows allocations down noticeably, so it only runs between
+    start() and stop().
+    """
+
+    def __init__(self):
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self) -> None:
+        """Start tracing (if needed) and take the baseline snapshot"""
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACE_FRAMES)
+            gc.collect()
+            self._baseline = tracemalloc.take_snapshot()
+
+    def diff(self, limit: int = 20) -> Optional[Tuple[int, List[dict]]]:
+        """Growth since the baseline (None when not started)"""
+        with self._lock:
+            if self._baseline is None or not tracemalloc.is_tracing():
+                return None
+            gc.collect()
+            return compare_snapshots(self._baseline, tracemalloc.take_snapshot(), limit)
+
+    def stop(self) -> None:
+        """Stop tracing and drop the baseline"""
+        with self._lock:
+            self._baseline = None
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+
+
+def census() -> Dict[str, Dict[str, int]]:
+    """Live instances of domain entities, ORM models and DTOs by class"""
+    counts = {group: Counter() for group in CENSUS_MODULES}
+    for obj in gc.get_objects():
+        module = type(obj).__module__
+        # Classes of some metaclasses expose __module__ as a descriptor
+        if not isinstance(module, str) or not module.startswith("src."):
+            continue
+        for group, prefix in CENSUS_MODULES.items():
+            if module.startswith(prefix):
+                counts[group][type(obj).__name__] += 1
+                break
+    return {group: dict(counter.most_common()) for group, counter in counts.items()}
+
+
+def deep_size(value: Any, seen: Optional[set] = None) -> int:
+    """Approximate bytes held by a value and the containers and strings inside it"""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_size(key, seen) + deep_size(item, seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in value)
+    return size
+
+
+def cache_usage(memory_cache) -> Dict[str, int]:
+    """Entries and approximate bytes held by an InMemoryCache"""
+    entries = memory_cache.items()
+    seen: set = set()
+    return {
+        "entries": len(entries),
+        "bytes": sum(deep_size(key, seen) + deep_size(entry, seen) for key, entry in entries)
+    }
+
+
+def rss_bytes() -> Optional[int]:
+    """Current resident set size (Linux only)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+# Singleton instance
+memory_tracker = MemoryTracker()
@@ -0,0 +1,83 @@
+import os
+from functools import wraps
+from typing import Any, Callable, Tuple
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+)
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import Engine
+
+# With PROMETHEUS_MULTIPROC_DIR set (several uvicorn workers), every process
+# writes its samples to mmap'd files there and /metrics merges them.
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+# Seconds; most routes answer in milliseconds, bulk imports take seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+http_requests = Counter(
+    "eventia_http_requests_total", "HTTP requests by route and status code", ["method", "route", "status"]
+)
+http_request_duration = Histogram(
+    "eventia_http_request_duration_seconds", "HTTP request latency by route", ["method", "route"],
+    buckets=LATENCY_BUCKETS
+)
+http_requests_in_progress = Gauge(
+    "eventia_http_requests_in_progress", "HTTP requests being handled", multiprocess_mode="livesum"
+)
+db_pool_size = Gauge(
+    "eventia_db_pool_size", "Connections the database pool keeps open", multiprocess_mode="livesum"
+)
+db_pool_checked_out = Gauge(
+    "eventia_db_pool_checked_out", "Database connections currently checked out", multiprocess_mode="livesum"
+)
+cache_lookups = Counter(
+    "eventia_cache_lookups_total", "Cache key lookups by result (hit ratio = hit / all)", ["result"]
+)
+cache_redis_connected = Gauge(
+    "eventia_cache_redis_connected",
+    "1 while the cache uses Redis, 0 once it fell back to the in-process cache",
+    multiprocess_mode="livemin"
+)
+
+_cache_hits = cache_lookups.labels(result="hit")
+_cache_misses = cache_lookups.labels(result="miss")
+
+
+def count_cache_lookups(count: Callable[[Any], Tuple[int, int]]):
+    """Decorate a cache read so its (hits, misses) feed the hit-ratio counters"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            result = method(*args, **kwargs)
+            hits, misses = count(result)
+            if hits:
+                _cache_hits.inc(hits)
+            if misses:
+                _cache_misses.inc(misses)
+            return result
+        return wrapper
+    return decorator
+
+
+def instrument_pool(engine: Engine) -> None:
+    """Track the engine's pool size and checked-out connections"""
+    size = getattr(engine.pool, "size", None)
+    if callable(size):
+        db_pool_size.set(size())
+    sa_event.listen(engine, "checkout", lambda *args: db_pool_checked_out.inc())
+    sa_event.listen(engine, "checkin", lambda *args: db_pool_checked_out.dec())
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Body and content type of the Prometheus text exposition (all workers merged)"""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop a stopped worker's live gauges from the merged view"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(pid)
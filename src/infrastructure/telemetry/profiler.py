@@ -0,0 +1,141 @@
+import os
+import sys
+import threading
+import uuid
+from collections import Counter, OrderedDict
+from types import FrameType
+from typing import Callable, Dict, Optional, Tuple
+
+# Stacks whose innermost frame sits in one of these files are threads waiting for work
+IDLE_FILES = ("threading.py", "selectors.py", "queue.py", os.path.join("concurrent", "futures", "thread.py"))
+
+# Root of the application code, for keeping only the stacks of a profiled request
+SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Collapsed-stack profiles of recent single requests, by profile ID
+MAX_STORED_PROFILES = 20
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _is_idle(frame: FrameType) -> bool:
+    return frame.f_code.co_filename.endswith(IDLE_FILES)
+
+
+def _runs_app_code(frame: FrameType) -> bool:
+    while frame is not None:
+        if frame.f_code.co_filename.startswith(SOURCE_ROOT):
+            return True
+        frame = frame.f_back
+    return False
+
+
+class SamplingProfiler:
+    """Samples the Python stacks of every thread from a background thread.
+
+    Costs nothing until start(): no hooks are installed, only the sampler
+    thread calls sys._current_frames() every interval while it runs.
+    Stacks are folded into the collapsed format ("root;...;leaf count")
+    read by flamegraph.pl, speedscope and inferno.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.01,
+        keep: Optional[Callable[[FrameType], bool]] = None
+    ):
+        self.interval_seconds = interval_seconds
+        self.keep = keep
+        self.samples = 0
+        self._stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._sampler_id: Optional[int] = None
+
+    def start(self) -> "SamplingProfiler":
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> str:
+        """Stop sampling and return the collapsed stacks"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.collapsed()
+
+    def collapsed(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self._stacks.most_common())
+
+    def _run(self):
+        self._sampler_id = threading.get_ident()
+        while not self._stop.wait(self.interval_seconds):
+            self._sample()
+
+    def _sample(self):
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        self.samples += 1
+        for thread_id, frame in sys._current_frames().items():
+            # Threads blocked waiting (including one waiting for this profile) are skipped
+            if thread_id == self._sampler_id or _is_idle(frame):
+                continue
+            if self.keep is not None and not self.keep(frame):
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.append(names.get(thread_id, str(thread_id)))
+            self._stacks[";".join(reversed(labels))] += 1
+
+
+def profile_for(seconds: float, interval_seconds: float = 0.01) -> Tuple[str, int]:
+    """Profile the whole worker for a while; returns the collapsed stacks and the sample count"""
+    profiler = SamplingProfiler(interval_seconds).start()
+    threading.Event().wait(seconds)
+    return profiler.stop(), profiler.samples
+
+
+def request_profiler(interval_seconds: float = 0.005) -> SamplingProfiler:
+    """Profiler for one request: keeps only the stacks running application code.
+
+    Sync routes run in the thread pool, so every thread is sampled; other
+    requests in flight at the same time can show up in the profile too.
+    """
+    return SamplingProfiler(interval_seconds, keep=_runs_app_code)
+
+
+class ProfileStore:
+    """The most recent request profiles, by ID"""
+
+    def __init__(self, max_profiles: int = MAX_STORED_PROFILES):
+        self.max_profiles = max_profiles
+        self._profiles: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, collapsed: str) -> str:
+        profile_id = uuid.uuid4().hex
+        with self._lock:
+            self._profiles[profile_id] = collapsed
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+        return profile_id
+
+    def get(self, profile_id: str) -> Optional[str]:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def ids(self) -> Dict[str, int]:
+        """Stored profile IDs with their number of distinct stacks, oldest first"""
+        with self._lock:
+            return {
+                profile_id: len(collapsed.splitlines()) if collapsed else 0
+                for profile_id, collapsed in self._profiles.items()
+            }
+
+
+# Singleton instance
+profile_store = ProfileStore()
@@ -0,0 +1,106 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Optional
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import Engine
+
+
+class RequestTimings:
+    """Where one sampled request spent its time (seconds) and how many calls it made"""
+    __slots__ = (
+        "started", "queue_seconds", "sql_count", "sql_seconds",
+        "cache_calls", "cache_hits", "cache_seconds", "serialize_seconds"
+    )
+
+    def __init__(self):
+        self.started = perf_counter()
+        self.queue_seconds: Optional[float] = None
+        self.sql_count = 0
+        self.sql_seconds = 0.0
+        self.cache_calls = 0
+        self.cache_hits = 0
+        self.cache_seconds = 0.0
+        self.serialize_seconds = 0.0
+
+    def elapsed(self) -> float:
+        return perf_counter() - self.started
+
+
+# Set only while a sampled request runs. Worker threads get a copy of the
+# context, so they add to the same RequestTimings object.
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+# Connection.info key for the start times of in-flight statements
+_STATEMENT_STARTS = "timing_statement_starts"
+
+
+@contextmanager
+def collect_timings():
+    """Record the timings of everything running in this context"""
+    timings = RequestTimings()
+    token = current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        current_timings.reset(token)
+
+
+def mark_worker_started() -> None:
+    """Note when the request's first worker-thread code ran (thread pool queue wait)"""
+    timings = current_timings.get()
+    if timings is not None and timings.queue_seconds is None:
+        timings.queue_seconds = timings.elapsed()
+
+
+def track_cache_call(count_hits: Optional[Callable[[Any], int]] = None):
+    """Decorate a cache method so sampled requests count its calls, hits and time"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            timings = current_timings.get()
+            if timings is None:
+                return method(*args, **kwargs)
+            start = perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                timings.cache_calls += 1
+                timings.cache_seconds += perf_counter() - start
+            if count_hits is not None:
+                timings.cache_hits += count_hits(result)
+            return result
+        return wrapper
+    return decorator
+
+
+def timed_render(render):
+    """Decorate Response.render so sampled requests count serialization time"""
+    @wraps(render)
+    def wrapper(self, content):
+        timings = current_timings.get()
+        if timings is None:
+            return render(self, content)
+        start = perf_counter()
+        try:
+            return render(self, content)
+        finally:
+            timings.serialize_seconds += perf_counter() - start
+    return wrapper
+
+
+@sa_event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_timings.get() is not None:
+        conn.info.setdefault(_STATEMENT_STARTS, []).append(perf_counter())
+
+
+@sa_event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timings = current_timings.get()
+    starts = conn.info.get(_STATEMENT_STARTS)
+    if timings is None or not starts:
+        return
+    timings.sql_count += 1
+    timings.sql_seconds += perf_counter() - starts.pop()
@@ -0,0 +1,193 @@
+import hashlib
+import random
+import re
+import sys
+import threading
+from datetime import datetime
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import Engine
+from src.infrastructure.config.settings import settings
+
+# Connection.info key for the start times of in-flight statements
+_STATEMENT_STARTS = "slow_query_statement_starts"
+
+# Plan statement per dialect; other dialects are logged without a plan
+EXPLAIN_PREFIXES = {
+    # ANALYZE runs the statement again, so only SELECTs are explained
+    "postgresql": "EXPLAIN (ANALYZE, BUFFERS) ",
+    "sqlite": "EXPLAIN QUERY PLAN "
+}
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+|\$\d+)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """Statement with literals replaced by ? and IN lists collapsed, so variants share a fingerprint"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Parameter shapes without their values (type names only)"""
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            # executemany: the first row stands for all of them
+            return [redact_parameters(parameters[0]), f"... {len(parameters)} rows"]
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def calling_repository_method() -> Optional[str]:
+    """Qualified name of the innermost repository method on the current stack"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if "repositories" in frame.f_code.co_filename:
+            return frame.f_code.co_qualname
+        frame = frame.f_back
+    return None
+
+
+class SlowQueryLog:
+    """Statements slower than a threshold, aggregated by fingerprint.
+
+    Opt-in via install(engine); statements under the threshold only pay for
+    two perf_counter() calls. A sample of slow SELECTs is explained on a
+    separate cursor of the same connection (inside a savepoint on
+    PostgreSQL, so a failing EXPLAIN cannot abort the request's transaction).
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = settings.slow_query_threshold_ms,
+        explain_sample_rate: float = settings.slow_query_explain_sample_rate,
+        max_fingerprints: int = settings.slow_query_max_fingerprints
+    ):
+        self.threshold_seconds = threshold_ms / 1000
+        self.explain_sample_rate = explain_sample_rate
+        self.max_fingerprints = max_fingerprints
+        self._entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def install(self, engine: Engine) -> None:
+        """Start watching the engine's statements"""
+        sa_event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        sa_event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def uninstall(self, engine: Engine) -> None:
+        """Stop watching the engine's statements"""
+        sa_event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        sa_event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_STATEMENT_STARTS, []).append(perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get(_STATEMENT_STARTS)
+        if not starts:
+            return
+        duration = perf_counter() - starts.pop()
+        if duration < self.threshold_seconds:
+            return
+
+        plan = None
+        if random.random() < self.explain_sample_rate and statement.lstrip()[:6].upper() == "SELECT":
+            plan = self._explain(conn, statement, parameters)
+        self.record(statement, parameters, duration, calling_repository_method(), plan)
+
+    def _explain(self, conn, statement: str, parameters: Any) -> Optional[List[str]]:
+        prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+        if prefix is None:
+            return None
+        savepoint = conn.dialect.name == "postgresql"
+        explain_cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            if savepoint:
+                explain_cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                explain_cursor.execute(prefix + statement, parameters)
+                plan = [" ".join(str(column) for column in row) for row in explain_cursor.fetchall()]
+            except Exception as e:
+                if savepoint:
+                    explain_cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                return [f"EXPLAIN failed: {e}"]
+            if savepoint:
+                explain_cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return plan
+        finally:
+            explain_cursor.close()
+
+    def record(
+        self,
+        statement: str,
+        parameters: Any,
+        duration: float,
+        caller: Optional[str] = None,
+        plan: Optional[List[str]] = None
+    ) -> None:
+        """Add one slow execution to its fingerprint's aggregate"""
+        normalized = normalize_sql(statement)
+        fingerprint = hashlib.sha1(normalized.encode()).hexdigest()[:16]
+        duration_ms = duration * 1000
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None:
+                if len(self._entries) >= self.max_fingerprints:
+                    # Make room by dropping the statement that cost the least so far
+                    cheapest = min(self._entries, key=lambda key: self._entries[key]["total_ms"])
+                    del self._entries[cheapest]
+                entry = self._entries[fingerprint] = {
+                    "fingerprint": fingerprint,
+                    "statement": normalized,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "callers": {},
+                    "parameters": None,
+                    "plan": None,
+                    "plan_captured_at": None,
+                    "last_seen_at": None
+                }
+            entry["count"] += 1
+            entry["total_ms"] += duration_ms
+            entry["max_ms"] = max(entry["max_ms"], duration_ms)
+            caller = caller or "unknown"
+            entry["callers"][caller] = entry["callers"].get(caller, 0) + 1
+            entry["parameters"] = redact_parameters(parameters)
+            entry["last_seen_at"] = datetime.utcnow().isoformat()
+            if plan is not None:
+                entry["plan"] = plan
+                entry["plan_captured_at"] = entry["last_seen_at"]
+
+    def report(self, limit: int = 50) -> List[dict]:
+        """Fingerprints by total time spent, most expensive first"""
+        with self._lock:
+            entries = sorted(self._entries.values(), key=lambda entry: entry["total_ms"], reverse=True)[:limit]
+            return [
+                {
+                    **entry,
+                    "callers": dict(entry["callers"]),
+                    "total_ms": round(entry["total_ms"], 2),
+                    "max_ms": round(entry["max_ms"], 2),
+                    "mean_ms": round(entry["total_ms"] / entry["count"], 2)
+                }
+                for entry in entries
+            ]
+
+    def reset(self) -> None:
+        """Forget everything recorded so far"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Singleton instance (installed on the app engine when settings.slow_query_log_enabled)
+slow_query_log = SlowQueryLog()
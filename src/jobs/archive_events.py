@@ -0,0 +1,35 @@
+"""Archive finished events and their attendances.
+
+Meant to run on a schedule (cron, Kubernetes CronJob, ...):
+
+    python -m src.jobs.archive_events --older-than-days 365 --batch-size 500
+"""
+import argparse
+from src.domain.services.archive_service import ArchiveService
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.connection import SessionLocal
+from src.infrastructure.database.repositories.archive_repository_impl import ArchiveRepositoryImpl
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive finished events and their attendances")
+    parser.add_argument("--older-than-days", type=int, default=settings.archive_after_days)
+    parser.add_argument("--batch-size", type=int, default=settings.archive_batch_size)
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    try:
+        service = ArchiveService(ArchiveRepositoryImpl(db), SqlAlchemyUnitOfWork(db))
+        totals = service.archive_past_events(args.older_than_days, args.batch_size)
+    finally:
+        db.close()
+    
+    print(
+        f"✅ Archived {totals['events']} events and {totals['attendances']} attendances "
+        f"in {totals['batches']} batches"
+    )
+
+
+if __name__ == "__main__":
+    main()
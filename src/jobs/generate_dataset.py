@@ -0,0 +1,242 @@
+"""Bulk-load a synthetic dataset for scale testing.
+
+Event popularity follows a Zipf distribution: the k-th most popular event
+gets attendances in proportion to 1 / k**s. The same seed and start date
+always produce the same rows:
+
+    python -m src.jobs.generate_dataset --events 100000 --participants 1000000 --attendances 20000000
+
+Rows are appended after the highest existing IDs, archived ones included. PostgreSQL is loaded with
+COPY, SQLite with batched executemany on the raw connection (synchronous
+writes off for the load), other databases with Core executemany inserts.
+"""
+import argparse
+import csv
+import io
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import Table
+from src.infrastructure.database.connection import engine as app_engine, init_db
+from src.infrastructure.database.models.archived_attendance_model import ArchivedAttendanceModel
+from src.infrastructure.database.models.archived_event_model import ArchivedEventModel
+from src.infrastructure.database.models.attendance_model import AttendanceModel
+from src.infrastructure.database.models.event_model import EventModel
+from src.infrastructure.database.models.participant_model import ParticipantModel
+
+DEFAULT_BATCH_SIZE = 50000
+
+# Same text format SQLAlchemy's SQLite DateTime type writes and parses
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+LOCATIONS = [
+    "Bogotá", "Medellín", "Cali", "Barranquilla", "Cartagena", "Bucaramanga", "Pereira", "Manizales",
+    "Santa Marta", "Cúcuta", "Ibagué", "Villavicencio", "Pasto", "Montería", "Neiva", "Armenia"
+]
+TOPICS = ["Conference", "Workshop", "Meetup", "Concert", "Hackathon", "Seminar", "Festival", "Webinar"]
+
+
+def zipf_counts(total: int, buckets: int, exponent: float, cap: int) -> List[int]:
+    """Split total over buckets by Zipf weight (bucket 0 most popular), none above cap"""
+    if buckets == 0 or total == 0:
+        return [0] * buckets
+    weights = [1.0 / (rank ** exponent) for rank in range(1, buckets + 1)]
+    scale = total / sum(weights)
+    counts = [min(cap, int(weight * scale)) for weight in weights]
+    # Hand the rounding (and capping) leftovers to the most popular buckets with room
+    leftover = min(total, cap * buckets) - sum(counts)
+    rank = 0
+    while leftover > 0:
+        if counts[rank] < cap:
+            counts[rank] += 1
+            leftover -= 1
+        rank = (rank + 1) % buckets
+    return counts
+
+
+def _next_id(connection: Connection, *tables: Table) -> int:
+    """One past the highest ID in any of the tables (a live table and its archive)"""
+    return max(connection.execute(select(func.max(table.c.id))).scalar() or 0 for table in tables) + 1
+
+
+def _writer(connection: Connection) -> Callable[[Table, List[str], List[tuple]], None]:
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        def copy(table: Table, columns: List[str], rows: List[tuple]) -> None:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(rows)
+            buffer.seek(0)
+            with connection.connection.cursor() as cursor:
+                cursor.copy_expert(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+        return copy
+
+    if dialect == "sqlite":
+        def executemany(table: Table, columns: List[str], rows: List[tuple]) -> None:
+            placeholders = ", ".join("?" for _ in columns)
+            cursor = connection.connection.cursor()
+            try:
+                cursor.executemany(f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES ({placeholders})", rows)
+            finally:
+                cursor.close()
+        return executemany
+
+    def insert(table: Table, columns: List[str], rows: List[tuple]) -> None:
+        connection.execute(table.insert(), [dict(zip(columns, row)) for row in rows])
+    return insert
+
+
+def _load(engine: Engine, table: Table, columns: List[str], rows: Iterable[tuple], batch_size: int) -> int:
+    """Write rows in batches, one transaction per batch"""
+    loaded = 0
+    batch: List[tuple] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            loaded += _write_batch(engine, table, columns, batch)
+            batch = []
+    if batch:
+        loaded += _write_batch(engine, table, columns, batch)
+    return loaded
+
+
+def _set_synchronous(connection: Connection, level: int) -> int:
+    """Set SQLite's synchronous level on this connection and return the previous one"""
+    previous = connection.exec_driver_sql("PRAGMA synchronous").scalar()
+    connection.exec_driver_sql(f"PRAGMA synchronous = {int(level)}")
+    connection.commit()
+    return previous
+
+
+def _write_batch(engine: Engine, table: Table, columns: List[str], batch: List[tuple]) -> int:
+    with engine.connect() as connection:
+        # The pooled connection goes back to the caller's engine; restore its level after the commit
+        previous = _set_synchronous(connection, 0) if connection.dialect.name == "sqlite" else None
+        try:
+            with connection.begin():
+                _writer(connection)(table, columns, batch)
+        finally:
+            if previous is not None:
+                _set_synchronous(connection, previous)
+    return len(batch)
+
+
+def _fix_sequences(engine: Engine, tables: Iterable[Table]) -> None:
+    # Explicit IDs bypass the serial sequences on PostgreSQL; move them past the loaded rows, never back
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as connection:
+        for table in tables:
+            sequence = f"pg_get_serial_sequence('{table.name}', 'id')"
+            connection.execute(text(
+                f"SELECT setval({sequence}, GREATEST("
+                f"(SELECT COALESCE(MAX(id), 1) FROM {table.name}), "
+                f"COALESCE(pg_sequence_last_value({sequence}::regclass), 1)))"
+            ))
+
+
+def generate_dataset(
+    engine: Engine,
+    events: int,
+    participants: int,
+    attendances: int,
+    zipf_exponent: float = 1.1,
+    seed: int = 42,
+    start_date: Optional[datetime] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[Callable[[str], None]] = None
+) -> Dict[str, Tuple[int, int]]:
+    """Append a synthetic dataset and return each table's (first ID, rows loaded).
+
+    Events are dated from 180 days before to 365 days after start_date
+    (default: today, midnight UTC). Each event's capacity covers its
+    attendances. Attendances are capped at one per participant and event.
+    """
+    rng = random.Random(seed)
+    start = start_date or datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    stamp = start.strftime(DATETIME_FORMAT)
+    event_table, participant_table = EventModel.__table__, ParticipantModel.__table__
+    attendance_table = AttendanceModel.__table__
+    report = progress or (lambda message: None)
+
+    with engine.connect() as connection:
+        # Archived rows keep their IDs; new rows must not reuse them
+        first_event = _next_id(connection, event_table, ArchivedEventModel.__table__)
+        first_participant = _next_id(connection, participant_table)
+        first_attendance = _next_id(connection, attendance_table, ArchivedAttendanceModel.__table__)
+
+    # Attendances per event by popularity rank; ranks are shuffled over the event IDs
+    counts = zipf_counts(attendances, events, zipf_exponent, cap=participants)
+    ranked_events = list(range(first_event, first_event + events))
+    rng.shuffle(ranked_events)
+    attendance_counts = dict(zip(ranked_events, counts))
+
+    def event_rows() -> Iterator[tuple]:
+        for event_id in range(first_event, first_event + events):
+            date = start + timedelta(days=rng.randint(-180, 365), hours=rng.randint(8, 20))
+            capacity = max(attendance_counts[event_id], rng.choice((20, 50, 100, 250, 500)))
+            yield (
+                event_id, f"{rng.choice(TOPICS)} #{event_id}", f"Synthetic event {event_id}",
+                date.strftime(DATETIME_FORMAT), rng.choice(LOCATIONS), capacity, stamp, stamp
+            )
+
+    def participant_rows() -> Iterator[tuple]:
+        for participant_id in range(first_participant, first_participant + participants):
+            yield (
+                participant_id, f"Participant {participant_id}", f"user{participant_id}@example.com",
+                f"3{rng.randrange(10 ** 9):09d}", stamp, stamp
+            )
+
+    def attendance_rows() -> Iterator[tuple]:
+        attendance_id = first_attendance
+        for event_id in range(first_event, first_event + events):
+            for offset in sorted(rng.sample(range(participants), attendance_counts[event_id])):
+                yield (attendance_id, event_id, first_participant + offset, stamp, stamp)
+                attendance_id += 1
+
+    loaded = {}
+    for table, columns, rows in (
+        (event_table, ["id", "name", "description", "date", "location", "capacity", "created_at", "updated_at"],
+         event_rows()),
+        (participant_table, ["id", "name", "email", "phone", "created_at", "updated_at"], participant_rows()),
+        (attendance_table, ["id", "event_id", "participant_id", "registration_date", "created_at"],
+         attendance_rows())
+    ):
+        began = time.perf_counter()
+        count = _load(engine, table, columns, rows, batch_size)
+        elapsed = time.perf_counter() - began
+        report(f"{table.name}: {count:,} rows in {elapsed:.1f}s ({count / elapsed if elapsed else 0:,.0f} rows/s)")
+        loaded[table.name] = count
+
+    _fix_sequences(engine, (event_table, participant_table, attendance_table))
+    return {
+        "events": (first_event, loaded["events"]),
+        "participants": (first_participant, loaded["participants"]),
+        "attendances": (first_attendance, loaded["attendances"])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-load a synthetic dataset for scale testing")
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--participants", type=int, default=1000000)
+    parser.add_argument("--attendances", type=int, default=20000000)
+    parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent of event popularity")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--start-date", type=datetime.fromisoformat, help="Anchor for event dates (default: today)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    init_db(mode="create")
+    print(f"📦 Generating dataset (seed {args.seed}) into {app_engine.url.render_as_string(hide_password=True)}")
+    generate_dataset(
+        app_engine, args.events, args.participants, args.attendances, args.zipf, args.seed,
+        args.start_date, args.batch_size, progress=lambda message: print(f"  {message}")
+    )
+    print("✅ Dataset loaded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""Apply the database schema and record its fingerprint.
+
+Run once per deploy so workers can start with SCHEMA_CHECK=skip or
+SCHEMA_CHECK=fingerprint without inspecting every table:
+
+    python -m src.jobs.migrate
+"""
+from src.infrastructure.database.connection import init_db
+from src.infrastructure.database.models import (  # noqa: F401 (register models on Base.metadata)
+    event_model,
+    participant_model,
+    attendance_model,
+    archived_event_model,
+    archived_attendance_model
+)
+
+
+def main():
+    init_db(mode="create")
+    print("✅ Database schema applied")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 import pytest
+from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from src.api.main import app
 from src.infrastructure.database.connection import Base, get_db
 
+# retained_memory (allocation budgets) and query_counter (SQL and cache call budgets) fixtures
+pytest_plugins = ["tests.plugins.memory_budget", "tests.plugins.query_budget"]
+
 # Test database URL (usando SQLite en memoria para pruebas)
 TEST_DATABASE_URL = "sqlite:///./test.db"
 
@@ -40,11 +44,12 @@ def client(test_db):
 
 @pytest.fixture
 def sample_event_data():
-    """Sample event data for testing"""
+    """Sample event data for testing (a year ahead, so registrations stay open)"""
+    date = (datetime.utcnow() + timedelta(days=365)).replace(hour=10, minute=0, second=0, microsecond=0)
     return {
         "name": "Test Event",
         "description": "This is a test event",
-        "date": "2025-12-31T10:00:00",
+        "date": date.isoformat(),
         "location": "Test Location",
         "capacity": 50
     }
@@ -1,12 +1,27 @@
 import pytest
+import tracemalloc
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event as sa_event
 from sqlalchemy.orm import sessionmaker
-from src.infrastructure.database.connection import Base
+from src.infrastructure.database.connection import Base, init_db, schema_fingerprint, schema_version
 from src.infrastructure.database.repositories.event_repository_impl import EventRepositoryImpl
 from src.infrastructure.database.repositories.participant_repository_impl import ParticipantRepositoryImpl
+from src.infrastructure.database.repositories.attendance_repository_impl import AttendanceRepositoryImpl
+from src.infrastructure.database.models.event_model import EventModel
+from src.infrastructure.database.models.participant_model import ParticipantModel
+from src.infrastructure.database.models.attendance_model import AttendanceModel
+from src.infrastructure.database.repositories.archive_repository_impl import ArchiveRepositoryImpl
+from src.domain.services.archive_service import ArchiveService
+from src.domain.services.attendance_service import AttendanceService
+from src.domain.services.event_service import EventService
+from src.application.controllers.attendance_controller import _csv_chunks
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+from src.jobs.generate_dataset import generate_dataset, zipf_counts
+from src.infrastructure.cache.cache_client import cache_client
 from src.domain.entities.event import Event
 from src.domain.entities.participant import Participant
+from src.domain.entities.attendance import Attendance
 
 # Test database
 TEST_DB_URL = "sqlite:///./test_integration.db"
@@ -14,6 +29,18 @@ engine = create_engine(TEST_DB_URL, connect_args={"check_same_thread": False})
 TestSessionLocal = sessionmaker(bind=engine)
 
 
+@contextmanager
+def recorded_statements():
+    """Record the SQL statements sent to the test database"""
+    statements = []
+    listen = lambda conn, cursor, statement, *args: statements.append(statement)
+    sa_event.listen(engine, "before_cursor_execute", listen)
+    try:
+        yield statements
+    finally:
+        sa_event.remove(engine, "before_cursor_execute", listen)
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """Create test database session"""
@@ -95,6 +122,64 @@ class TestEventRepository:
         
         assert result is True
         assert repo.get_by_id(created.id) is None
+    
+    def test_get_all_summaries(self, db_session):
+        """Test summaries carry list fields but not the description"""
+        repo = EventRepositoryImpl(db_session)
+        created = repo.create(Event(
+            name="Summary Event",
+            description="A long description",
+            date=datetime.now() + timedelta(days=1),
+            location="Test",
+            capacity=50
+        ))
+        
+        summaries = repo.get_all_summaries()
+        
+        assert len(summaries) == 1
+        assert summaries[0].id == created.id
+        assert summaries[0].capacity == 50
+        assert not hasattr(summaries[0], "description")
+    
+    def test_get_all_fields_selects_only_requested_columns(self, db_session):
+        """Test sparse fieldsets are pushed down into the SELECT"""
+        repo = EventRepositoryImpl(db_session)
+        created = repo.create(Event(
+            name="Sparse Event",
+            description="A long description",
+            date=datetime.now() + timedelta(days=1),
+            location="Test",
+            capacity=50
+        ))
+        with recorded_statements() as statements:
+            rows = repo.get_all_fields(["id", "name", "date"])
+        
+        assert rows == [{"id": created.id, "name": "Sparse Event", "date": created.date}]
+        assert "description" not in statements[-1]
+    
+    def test_get_by_ids_uses_one_query(self, db_session):
+        """Test multi-gets load all live events with a single IN query"""
+        repo = EventRepositoryImpl(db_session)
+        created = [
+            repo.create(Event(
+                name=f"Batch Event {i}",
+                description="Description",
+                date=datetime.now() + timedelta(days=1),
+                location="Test",
+                capacity=50
+            ))
+            for i in range(3)
+        ]
+        db_session.commit()
+        
+        # A fresh request (session) has nothing memoized yet
+        other_session = TestSessionLocal()
+        with recorded_statements() as statements:
+            events = EventRepositoryImpl(other_session).get_by_ids([e.id for e in created])
+        other_session.close()
+        
+        assert sorted(e.id for e in events) == sorted(e.id for e in created)
+        assert len(statements) == 1
 
 
 @pytest.mark.integration
@@ -128,4 +213,379 @@ class TestParticipantRepository:
         retrieved = repo.get_by_email("unique@example.com")
         
         assert retrieved is not None
-        assert retrieved.email == "unique@example.com"
\ No newline at end of file
+        assert retrieved.email == "unique@example.com"
+
+
+@pytest.mark.integration
+class TestAttendanceRepository:
+    """Integration tests for AttendanceRepository"""
+    
+    def test_roster_export_memory_is_flat(self, db_session):
+        """Test streaming a large roster keeps peak memory well below loading it whole"""
+        rows = 20000
+        db_session.bulk_insert_mappings(EventModel, [{
+            "name": "Big Event",
+            "description": "Test",
+            "date": datetime.now() + timedelta(days=1),
+            "location": "Test",
+            "capacity": rows
+        }])
+        db_session.bulk_insert_mappings(ParticipantModel, [
+            {"name": f"Participant {i}", "email": f"p{i}@example.com", "phone": "1234567890"}
+            for i in range(rows)
+        ])
+        db_session.bulk_insert_mappings(AttendanceModel, [
+            {"event_id": 1, "participant_id": i + 1} for i in range(rows)
+        ])
+        db_session.commit()
+        repo = AttendanceRepositoryImpl(db_session)
+        
+        tracemalloc.start()
+        try:
+            exported = sum(1 for _ in _csv_chunks(repo.iter_roster(1)))
+            streaming_peak = tracemalloc.get_traced_memory()[1]
+            
+            tracemalloc.reset_peak()
+            roster = repo.get_roster(1, 0, rows)
+            materialized_peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        
+        assert exported == rows // 1000 + 1
+        assert len(roster) == rows
+        assert streaming_peak < 2 * 1024 * 1024
+        assert streaming_peak * 4 < materialized_peak
+
+
+@pytest.mark.integration
+class TestUnitOfWork:
+    """Integration tests for SqlAlchemyUnitOfWork"""
+    
+    def test_repositories_do_not_commit(self, db_session):
+        """Test that repository writes are only visible after the unit of work commits"""
+        uow = SqlAlchemyUnitOfWork(db_session)
+        repo = EventRepositoryImpl(uow.session)
+        created = repo.create(Event(
+            name="Pending Event",
+            description="Test",
+            date=datetime.now() + timedelta(days=1),
+            location="Test",
+            capacity=50
+        ))
+        
+        other_session = TestSessionLocal()
+        assert EventRepositoryImpl(other_session).get_by_id(created.id) is None
+        
+        uow.commit()
+        assert EventRepositoryImpl(other_session).get_by_id(created.id) is not None
+        other_session.close()
+    
+    def test_invalidations_deferred_until_commit(self, db_session):
+        """Test that cache keys are only deleted after a successful commit"""
+        cache_client.set("uow:test", {"value": 1})
+        uow = SqlAlchemyUnitOfWork(db_session)
+        
+        uow.invalidate_on_commit("uow:test")
+        assert cache_client.get("uow:test") == {"value": 1}
+        
+        uow.commit()
+        assert cache_client.get("uow:test") is None
+    
+    def test_rollback_discards_invalidations(self, db_session):
+        """Test that a rollback drops pending invalidations and changes"""
+        cache_client.set("uow:test", {"value": 1})
+        uow = SqlAlchemyUnitOfWork(db_session)
+        repo = ParticipantRepositoryImpl(uow.session)
+        repo.create(Participant(name="Rolled Back", email="rollback@example.com", phone="123"))
+        
+        uow.invalidate_on_commit("uow:test")
+        uow.rollback()
+        uow.commit()
+        
+        assert cache_client.get("uow:test") == {"value": 1}
+        assert repo.get_by_email("rollback@example.com") is None
+        cache_client.delete("uow:test")
+
+
+@pytest.mark.integration
+class TestEntityLoader:
+    """Integration tests for the request-scoped entity loader"""
+    
+    def _seed(self, db_session):
+        event = EventRepositoryImpl(db_session).create(Event(
+            name="Loader Event",
+            description="Test",
+            date=datetime.now() + timedelta(days=1),
+            location="Test",
+            capacity=50
+        ))
+        participant = ParticipantRepositoryImpl(db_session).create(Participant(
+            name="Loader Participant",
+            email="loader@example.com",
+            phone="1234567890"
+        ))
+        db_session.commit()
+        return event, participant
+    
+    def _attendance_service(self, uow):
+        return AttendanceService(
+            AttendanceRepositoryImpl(uow.session),
+            EventRepositoryImpl(uow.session),
+            ParticipantRepositoryImpl(uow.session),
+            uow
+        )
+    
+    def test_update_event_selects_once(self, db_session):
+        """Test update_event reuses the event its validation loaded (was 2 SELECTs + UPDATE)"""
+        event, _ = self._seed(db_session)
+        uow = SqlAlchemyUnitOfWork(TestSessionLocal())
+        service = EventService(EventRepositoryImpl(uow.session), uow)
+        
+        with recorded_statements() as statements:
+            updated = service.update_event(Event(
+                event_id=event.id,
+                name="Renamed",
+                description="Test",
+                date=event.date,
+                location="Test",
+                capacity=60
+            ))
+        uow.session.close()
+        
+        assert updated.name == "Renamed"
+        assert updated.created_at == event.created_at
+        assert [s.split()[0] for s in statements] == ["SELECT", "UPDATE"]
+    
+    def test_lookups_are_shared_across_repositories(self, db_session):
+        """Test entities loaded by one service are not queried again in the same request"""
+        event, participant = self._seed(db_session)
+        uow = SqlAlchemyUnitOfWork(TestSessionLocal())
+        
+        with recorded_statements() as statements:
+            attendance = self._attendance_service(uow).register_attendance(
+                Attendance(event_id=event.id, participant_id=participant.id)
+            )
+        registered = len(statements)
+        
+        with recorded_statements() as statements:
+            assert EventRepositoryImpl(uow.session).get_by_id(event.id).name == "Loader Event"
+            assert ParticipantRepositoryImpl(uow.session).get_by_id(participant.id) is not None
+            assert self._attendance_service(uow).cancel_attendance(attendance.id) is True
+        uow.session.close()
+        
+        # event, participant, duplicate check, count, insert
+        assert registered == 5
+        # Only the DELETE: the cancelled attendance was memoized when it was created
+        assert [s.split()[0] for s in statements] == ["DELETE"]
+    
+    def test_rollback_forgets_memoized_writes(self, db_session):
+        """Test entities written in a rolled back transaction are not served from the loader"""
+        uow = SqlAlchemyUnitOfWork(db_session)
+        repo = EventRepositoryImpl(uow.session)
+        created = repo.create(Event(
+            name="Rolled Back",
+            description="Test",
+            date=datetime.now() + timedelta(days=1),
+            location="Test",
+            capacity=50
+        ))
+        
+        uow.rollback()
+        
+        assert repo.get_by_id(created.id) is None
+
+
+@pytest.mark.integration
+class TestArchival:
+    """Integration tests for archiving finished events"""
+    
+    def test_archive_past_events_keeps_them_readable(self, db_session):
+        """Test past events and attendances move in batches and stay readable"""
+        now = datetime.utcnow()
+        db_session.bulk_insert_mappings(EventModel, [
+            {"name": "Old", "description": "Test", "date": now - timedelta(days=400), "location": "Test", "capacity": 10},
+            {"name": "Recent", "description": "Test", "date": now - timedelta(days=10), "location": "Test", "capacity": 10}
+        ])
+        db_session.bulk_insert_mappings(ParticipantModel, [
+            {"name": f"P{i}", "email": f"p{i}@example.com", "phone": "123"} for i in range(5)
+        ])
+        db_session.bulk_insert_mappings(AttendanceModel, [
+            {"event_id": 1, "participant_id": i + 1} for i in range(5)
+        ] + [{"event_id": 2, "participant_id": 1}])
+        db_session.commit()
+        cache_client.set("event:stats:1", {"registered_attendees": 5})
+        cache_client.set_tracked("events:fields:id,name", [{"id": 1, "name": "Old"}], ["events:fields"])
+        cache_client.set_tracked("attendances:roster:1:0:100", [], ["attendances:event:1"])
+        
+        uow = SqlAlchemyUnitOfWork(db_session)
+        totals = ArchiveService(ArchiveRepositoryImpl(db_session), uow).archive_past_events(
+            older_than_days=365,
+            batch_size=2
+        )
+        
+        assert totals == {"events": 1, "attendances": 5, "batches": 4}
+        assert db_session.query(EventModel).count() == 1
+        assert db_session.query(AttendanceModel).count() == 1
+        assert cache_client.get("event:stats:1") is None
+        assert cache_client.get("events:fields:id,name") is None
+        assert cache_client.get("attendances:roster:1:0:100") is None
+        
+        event_repo = EventRepositoryImpl(db_session)
+        attendance_repo = AttendanceRepositoryImpl(db_session)
+        assert event_repo.get_by_id(1).name == "Old"
+        assert event_repo.get_attendee_count(1) == 5
+        assert len(attendance_repo.get_by_event(1)) == 5
+        assert {a.event_id for a in attendance_repo.get_by_participant(1)} == {1, 2}
+        assert len(attendance_repo.get_by_event_fields(1, ["participant_id"])) == 5
+        assert [r.participant_name for r in attendance_repo.get_roster(1, 0, 100)] == [f"P{i}" for i in range(5)]
+        assert len(list(attendance_repo.iter_roster(1))) == 5
+        assert [s.event_name for s in attendance_repo.get_schedule(1, 0, 100)] == ["Old", "Recent"]
+    
+    def test_reads_mid_archive_see_every_attendance(self, db_session):
+        """Test reads stay complete while an event's attendances are only partly archived"""
+        now = datetime.utcnow()
+        db_session.bulk_insert_mappings(EventModel, [
+            {"name": "Old", "description": "Test", "date": now - timedelta(days=400), "location": "Test", "capacity": 10}
+        ])
+        db_session.bulk_insert_mappings(ParticipantModel, [
+            {"name": f"P{i}", "email": f"p{i}@example.com", "phone": "123"} for i in range(5)
+        ])
+        db_session.bulk_insert_mappings(AttendanceModel, [{"event_id": 1, "participant_id": i + 1} for i in range(5)])
+        db_session.commit()
+        
+        # One committed batch, as if the job stopped there
+        ArchiveRepositoryImpl(db_session).archive_attendances([1], 2)
+        db_session.commit()
+        
+        attendance_repo = AttendanceRepositoryImpl(db_session)
+        assert db_session.query(AttendanceModel).count() == 3
+        assert EventRepositoryImpl(db_session).get_attendee_count(1) == 5
+        assert len(attendance_repo.get_by_event(1)) == 5
+        assert len(attendance_repo.get_by_event_fields(1, ["id"])) == 5
+        assert len(attendance_repo.get_roster(1, 0, 100)) == 5
+        assert len(attendance_repo.get_schedule(1, 0, 100)) == 1
+    
+    def test_new_rows_never_reuse_archived_ids(self, db_session):
+        """Test events and attendances created after archiving the newest ones get fresh IDs"""
+        now = datetime.utcnow()
+        db_session.bulk_insert_mappings(EventModel, [
+            {"name": "Old", "description": "Test", "date": now - timedelta(days=400), "location": "Test", "capacity": 10}
+        ])
+        db_session.bulk_insert_mappings(ParticipantModel, [{"name": "P", "email": "p@example.com", "phone": "123"}])
+        db_session.bulk_insert_mappings(AttendanceModel, [{"event_id": 1, "participant_id": 1}])
+        db_session.commit()
+        ArchiveService(ArchiveRepositoryImpl(db_session), SqlAlchemyUnitOfWork(db_session)).archive_past_events(365)
+        
+        event_repo = EventRepositoryImpl(db_session)
+        attendance_repo = AttendanceRepositoryImpl(db_session)
+        event = event_repo.create(Event(
+            name="New", description="Test", date=now + timedelta(days=10), location="Test", capacity=10
+        ))
+        attendance = attendance_repo.create(Attendance(event_id=event.id, participant_id=1))
+        db_session.commit()
+        
+        assert event.id == 2
+        assert attendance.id == 2
+        assert event_repo.get_attendee_count(event.id) == 1
+        assert [a.id for a in attendance_repo.get_by_event(event.id)] == [attendance.id]
+        assert [s.event_name for s in attendance_repo.get_schedule(1, 0, 100)] == ["Old", "New"]
+
+
+@pytest.mark.integration
+class TestSchemaInit:
+    """Integration tests for fingerprint-based schema initialization"""
+    
+    def test_fingerprint_skips_create_all_when_unchanged(self):
+        """Test init_db only applies the schema when the stored fingerprint differs"""
+        schema_engine = create_engine("sqlite://")
+        
+        assert init_db(bind=schema_engine, mode="fingerprint") is True
+        assert init_db(bind=schema_engine, mode="fingerprint") is False
+        assert init_db(bind=schema_engine, mode="skip") is False
+        assert schema_fingerprint(schema_engine) == schema_fingerprint(schema_engine)
+    
+    def test_fingerprint_recorded_by_another_worker(self, monkeypatch):
+        """Test init_db accepts the fingerprint a concurrent worker inserted first"""
+        schema_engine = create_engine("sqlite://")
+        init_db(bind=schema_engine, mode="create")
+        # The other worker's row lands between this worker's delete and insert
+        monkeypatch.setattr(schema_version, "delete", lambda: schema_version.select().limit(0))
+        
+        assert init_db(bind=schema_engine, mode="create") is True
+        with schema_engine.connect() as connection:
+            assert connection.execute(schema_version.select()).fetchall()[0].fingerprint == schema_fingerprint(schema_engine)
+
+
+@pytest.mark.integration
+class TestDatasetGenerator:
+    """Integration tests for the synthetic dataset generator"""
+    
+    def _rows(self, bind):
+        with bind.connect() as connection:
+            return [
+                connection.exec_driver_sql(f"SELECT * FROM {table} ORDER BY id").fetchall()
+                for table in ("events", "participants", "attendances")
+            ]
+    
+    def test_generates_zipf_dataset(self, db_session):
+        """Test the generated rows load through the repositories and follow the popularity skew"""
+        loaded = generate_dataset(engine, events=20, participants=200, attendances=1000, start_date=datetime(2030, 1, 1))
+        
+        assert loaded == {"events": (1, 20), "participants": (1, 200), "attendances": (1, 1000)}
+        counts = sorted(
+            (AttendanceRepositoryImpl(db_session).count_by_event(event_id) for event_id in range(1, 21)),
+            reverse=True
+        )
+        assert sum(counts) == 1000
+        assert counts[0] > 5 * counts[-1]
+        for event in EventRepositoryImpl(db_session).get_all():
+            assert isinstance(event.date, datetime)
+            assert event.capacity >= AttendanceRepositoryImpl(db_session).count_by_event(event.id)
+        
+        # A second run appends after the existing IDs
+        assert generate_dataset(engine, events=2, participants=2, attendances=2)["events"] == (21, 2)
+    
+    def test_appends_after_archived_ids(self, db_session):
+        """Test a run after archiving does not reuse the archived event and attendance IDs"""
+        generate_dataset(engine, events=3, participants=10, attendances=3, start_date=datetime.utcnow() - timedelta(days=400))
+        uow = SqlAlchemyUnitOfWork(db_session)
+        ArchiveService(ArchiveRepositoryImpl(db_session), uow).archive_past_events(older_than_days=0)
+        assert db_session.query(EventModel).count() == 0
+        
+        loaded = generate_dataset(engine, events=3, participants=10, attendances=3)
+        
+        assert loaded["events"] == (4, 3)
+        assert loaded["attendances"] == (4, 3)
+    
+    def test_same_seed_same_rows(self):
+        """Test the dataset is reproducible from its seed and start date"""
+        datasets = []
+        for seed in (7, 7, 8):
+            bind = create_engine("sqlite://")
+            Base.metadata.create_all(bind=bind)
+            generate_dataset(bind, events=10, participants=50, attendances=120, seed=seed, start_date=datetime(2030, 1, 1))
+            datasets.append(self._rows(bind))
+        
+        assert datasets[0] == datasets[1]
+        assert datasets[0] != datasets[2]
+    
+    def test_sqlite_synchronous_restored(self):
+        """Test the load leaves the engine's pooled connection at its own synchronous level"""
+        bind = create_engine("sqlite://")
+        Base.metadata.create_all(bind=bind)
+        with bind.connect() as connection:
+            connection.exec_driver_sql("PRAGMA synchronous = FULL")
+        
+        generate_dataset(bind, events=5, participants=20, attendances=30, batch_size=10)
+        
+        with bind.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 2
+    
+    def test_zipf_counts(self):
+        """Test counts add up, respect the cap and decrease with rank"""
+        counts = zipf_counts(1000, 10, 1.0, cap=300)
+        
+        assert sum(counts) == 1000
+        assert max(counts) <= 300
+        assert counts == sorted(counts, reverse=True)
+        assert zipf_counts(100, 3, 1.0, cap=10) == [10, 10, 10]
@@ -0,0 +1,56 @@
+"""Pytest plugin failing tests whose requests leave retained allocations above a budget.
+
+    def test_list_does_not_leak(client, retained_memory):
+        client.get("/events/")  # warm up caches and lazy imports first
+        with retained_memory(budget_bytes=32 * 1024):
+            for _ in range(20):
+                client.get("/events/")
+
+Only allocations made (directly or through libraries) by code under src/
+count, after a gc.collect() on both ends. pytest --memory-budget-scale=2
+loosens every budget, e.g. on interpreters that allocate more.
+"""
+import gc
+import tracemalloc
+from contextlib import contextmanager
+import pytest
+from src.infrastructure.telemetry.memory import TRACE_FRAMES, compare_snapshots
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--memory-budget-scale", type=float, default=1.0,
+        help="Multiply every retained_memory budget by this factor"
+    )
+
+
+@pytest.fixture
+def retained_memory(request):
+    """Context manager failing the test when its block retains more than budget_bytes"""
+    scale = request.config.getoption("--memory-budget-scale")
+
+    @contextmanager
+    def measure(budget_bytes: int):
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start(TRACE_FRAMES)
+        try:
+            gc.collect()
+            before = tracemalloc.take_snapshot()
+            yield
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        retained, top = compare_snapshots(before, after)
+        budget = int(budget_bytes * scale)
+        if retained > budget:
+            growers = "\n".join(
+                f"  {entry['location']}: {entry['size_diff']:+,} B in {entry['count_diff']:+} blocks"
+                for entry in top
+            )
+            pytest.fail(f"Retained {retained:,} bytes, budget is {budget:,}\n{growers}", pytrace=False)
+
+    return measure
@@ -0,0 +1,104 @@
+"""Pytest plugin counting the SQL statements and cache (Redis) calls of single requests.
+
+    def test_event_read_budget(client, query_counter, sample_event_data):
+        event_id = client.post("/events/", json=sample_event_data).json()["id"]
+        client.get(f"/events/{event_id}")  # warm the cache
+        query_counter.assert_within(client.get, f"/events/{event_id}", sql=0, cache=1)
+
+Counting happens inside the rate limiter, so only the route's own work
+counts: its dependencies, handler, response rendering and any background
+tasks. Every CacheClient call counts once: one Redis command or pipeline,
+or two for invalidate() with groups, whether Redis or the in-process
+fallback serves it.
+"""
+from typing import Callable, List, Optional
+import httpx
+import pytest
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import Engine
+from starlette.middleware import Middleware
+from src.api.main import app
+from src.infrastructure.telemetry.request_timings import RequestTimings, collect_timings, current_timings
+
+
+class QueryCount:
+    """SQL statements and cache calls one request made"""
+
+    def __init__(self, timings: RequestTimings, statements: List[str]):
+        self.sql = timings.sql_count
+        self.cache = timings.cache_calls
+        self.statements = statements
+        self.status_code: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return f"QueryCount(sql={self.sql}, cache={self.cache})"
+
+
+class QueryCounter:
+    """Collects the counts of the requests passing through QueryCountingMiddleware"""
+
+    def __init__(self):
+        self.last: Optional[QueryCount] = None
+        self._timings: Optional[RequestTimings] = None
+        self._statements: List[str] = []
+
+    def record_statement(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if self._timings is not None and current_timings.get() is self._timings:
+            self._statements.append(statement)
+
+    def measure(self, send: Callable[..., httpx.Response], url: str, **kwargs) -> QueryCount:
+        """Send one request (e.g. client.get) and return what it cost"""
+        self.last = None
+        response = send(url, **kwargs)
+        assert self.last is not None, f"{url} never reached the application ({response.status_code})"
+        self.last.status_code = response.status_code
+        return self.last
+
+    def assert_within(self, send: Callable[..., httpx.Response], url: str, sql: int, cache: int, **kwargs) -> QueryCount:
+        """Send one request and fail the test if it exceeds either budget"""
+        count = self.measure(send, url, **kwargs)
+        if count.sql > sql or count.cache > cache:
+            statements = "\n".join(f"  {statement}" for statement in count.statements)
+            pytest.fail(
+                f"{url}: {count.sql} SQL statements (budget {sql}), "
+                f"{count.cache} cache calls (budget {cache})\n{statements}",
+                pytrace=False
+            )
+        return count
+
+
+class QueryCountingMiddleware:
+    """Pure ASGI middleware recording each HTTP request's counts on a QueryCounter"""
+
+    def __init__(self, app, counter: QueryCounter):
+        self.app = app
+        self.counter = counter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with collect_timings() as timings:
+            self.counter._timings, self.counter._statements = timings, []
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self.counter._timings = None
+                self.counter.last = QueryCount(timings, self.counter._statements)
+
+
+@pytest.fixture
+def query_counter(client):
+    """QueryCounter fed by a counting middleware installed innermost on the app"""
+    counter = QueryCounter()
+    user_middleware = app.user_middleware
+    # The last user middleware wraps the router directly; rebuild the stack around it
+    app.user_middleware = user_middleware + [Middleware(QueryCountingMiddleware, counter=counter)]
+    app.middleware_stack = None
+    sa_event.listen(Engine, "before_cursor_execute", counter.record_statement)
+    try:
+        yield counter
+    finally:
+        sa_event.remove(Engine, "before_cursor_execute", counter.record_statement)
+        app.user_middleware = user_middleware
+        app.middleware_stack = None
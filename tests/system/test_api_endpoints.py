@@ -1,4 +1,10 @@
+import msgpack
 import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from src.api.main import mount_metrics
+from src.infrastructure.config.settings import settings
 
 
 @pytest.mark.system
@@ -27,6 +33,27 @@ class TestEventEndpoints:
         assert isinstance(data, list)
         assert len(data) >= 1
     
+    def test_get_all_events_summary_and_detail(self, client, sample_event_data):
+        """Test GET /events/ returns summaries unless ?detail=true is given"""
+        client.post("/events/", json=sample_event_data)
+        
+        summary = client.get("/events/").json()[0]
+        assert "description" not in summary
+        assert summary["name"] == sample_event_data["name"]
+        
+        detail = client.get("/events/", params={"detail": True}).json()[0]
+        assert detail["description"] == sample_event_data["description"]
+    
+    def test_list_openapi_schema_unchanged(self, client):
+        """Test list routes still document their DTOs although they render with orjson"""
+        schema = client.get("/openapi.json").json()
+        events = schema["paths"]["/events/"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        participants = schema["paths"]["/participants/"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        
+        # ?ids= multi-gets add a batch object next to the plain lists
+        assert {"$ref": "#/components/schemas/EventResponseDTO"} in [s.get("items") for s in events["anyOf"]]
+        assert {"$ref": "#/components/schemas/ParticipantResponseDTO"} in [s.get("items") for s in participants["anyOf"]]
+    
     def test_get_event_by_id(self, client, sample_event_data):
         """Test GET /events/{id} endpoint"""
         # Create event
@@ -84,6 +111,101 @@ class TestEventEndpoints:
         assert "total_capacity" in data
         assert "registered_attendees" in data
         assert "available_spots" in data
+    
+    def test_get_events_as_msgpack(self, client, sample_event_data):
+        """Test GET /events/ honours Accept: application/msgpack with the JSON field shapes"""
+        client.post("/events/", json=sample_event_data)
+        as_json = client.get("/events/", params={"detail": True}).json()
+        
+        response = client.get(
+            "/events/",
+            params={"detail": True},
+            headers={"Accept": "application/msgpack"}
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/msgpack"
+        assert msgpack.unpackb(response.content) == as_json
+    
+    def test_get_events_as_columnar(self, client, sample_event_data):
+        """Test GET /events/ can return bulk lists column by column"""
+        client.post("/events/", json=sample_event_data)
+        client.post("/events/", json={**sample_event_data, "name": "Second Event"})
+        
+        response = client.get("/events/", headers={"Accept": "application/vnd.eventia.columnar+msgpack"})
+        
+        assert response.status_code == 200
+        columns = msgpack.unpackb(response.content)
+        assert columns["name"] == ["Test Event", "Second Event"]
+        assert len(columns["id"]) == 2
+    
+    def test_get_event_statistics_as_msgpack(self, client, sample_event_data):
+        """Test statistics are negotiated too, JSON stays the default"""
+        event_id = client.post("/events/", json=sample_event_data).json()["id"]
+        as_json = client.get(f"/events/{event_id}/statistics").json()
+        
+        response = client.get(
+            f"/events/{event_id}/statistics",
+            headers={"Accept": "application/json;q=0.5, application/msgpack"}
+        )
+        
+        assert response.headers["content-type"] == "application/msgpack"
+        assert msgpack.unpackb(response.content) == as_json
+    
+    def test_compression_negotiated_by_size(self, client, sample_event_data):
+        """Test only responses above the size threshold are gzipped"""
+        small = client.get("/events/", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in small.headers
+        
+        for i in range(20):
+            client.post("/events/", json={**sample_event_data, "name": f"Event {i}"})
+        large = client.get("/events/", params={"detail": True}, headers={"Accept-Encoding": "gzip"})
+        
+        assert large.headers["content-encoding"] == "gzip"
+        assert len(large.json()) == 20
+    
+    def test_get_events_sparse_fields(self, client, sample_event_data):
+        """Test ?fields= returns only the requested fields, also for a single event"""
+        event_id = client.post("/events/", json=sample_event_data).json()["id"]
+        
+        events = client.get("/events/", params={"fields": "date,id,name"}).json()
+        assert events == [{"id": event_id, "name": "Test Event", "date": sample_event_data["date"]}]
+        
+        # Writes invalidate the per-field-set cache
+        client.post("/events/", json={**sample_event_data, "name": "Second Event"})
+        names = [e["name"] for e in client.get("/events/", params={"fields": "id,name,date"}).json()]
+        assert names == ["Test Event", "Second Event"]
+        
+        single = client.get(f"/events/{event_id}", params={"fields": "id,description"}).json()
+        assert single == {"id": event_id, "description": sample_event_data["description"]}
+    
+    def test_get_events_by_ids(self, client, sample_event_data):
+        """Test ?ids= keeps request order and reports missing IDs"""
+        first = client.post("/events/", json=sample_event_data).json()["id"]
+        second = client.post("/events/", json={**sample_event_data, "name": "Second Event"}).json()["id"]
+        client.get(f"/events/{first}")  # warm the cache for one of them
+        
+        response = client.get("/events/", params={"ids": f"{second},999,{first}"})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [e["id"] for e in data["items"]] == [second, first]
+        assert data["items"][0]["description"] == sample_event_data["description"]
+        assert data["missing"] == [999]
+        
+        sparse = client.get("/events/", params={"ids": str(first), "fields": "id,name"}).json()
+        assert sparse == {"items": [{"id": first, "name": "Test Event"}], "missing": []}
+        assert client.get("/events/", params={"ids": "1,x"}).status_code == 400
+        # The documented schema allows those partial items
+        schema = client.get("/openapi.json").json()["components"]["schemas"]["EventBatchDTO"]
+        assert {"type": "object"} in schema["properties"]["items"]["items"]["anyOf"]
+    
+    def test_get_events_unknown_field(self, client):
+        """Test unknown ?fields= names are rejected"""
+        response = client.get("/events/", params={"fields": "id,secret"})
+        
+        assert response.status_code == 400
+        assert "secret" in response.json()["detail"]
 
 
 @pytest.mark.system
@@ -111,6 +233,29 @@ class TestParticipantEndpoints:
         data = response.json()
         assert isinstance(data, list)
     
+    def test_get_participants_sparse_fields(self, client, sample_participant_data):
+        """Test ?fields= on participant reads"""
+        participant_id = client.post("/participants/", json=sample_participant_data).json()["id"]
+        
+        participants = client.get("/participants/", params={"fields": "id,email"}).json()
+        single = client.get(f"/participants/{participant_id}", params={"fields": "email"}).json()
+        
+        assert participants == [{"id": participant_id, "email": sample_participant_data["email"]}]
+        assert single == {"email": sample_participant_data["email"]}
+    
+    def test_get_participants_by_ids(self, client, sample_participant_data):
+        """Test ?ids= on participants"""
+        first = client.post("/participants/", json=sample_participant_data).json()["id"]
+        second = client.post(
+            "/participants/",
+            json={**sample_participant_data, "email": "second@example.com"}
+        ).json()["id"]
+        
+        data = client.get("/participants/", params={"ids": f"{second},{first},{first},404"}).json()
+        
+        assert [p["email"] for p in data["items"]] == ["second@example.com", sample_participant_data["email"]]
+        assert data["missing"] == [404]
+    
     def test_duplicate_email_validation(self, client, sample_participant_data):
         """Test that duplicate emails are rejected"""
         # Create first participant
@@ -120,6 +265,50 @@ class TestParticipantEndpoints:
         response = client.post("/participants/", json=sample_participant_data)
         
         assert response.status_code == 400
+    
+    def test_create_participant_idempotency_key(self, client, sample_participant_data):
+        """Test retries with the same Idempotency-Key replay the original response"""
+        headers = {"Idempotency-Key": "participant-retry-1"}
+        first = client.post("/participants/", json=sample_participant_data, headers=headers)
+        retry = client.post("/participants/", json=sample_participant_data, headers=headers)
+        
+        assert first.status_code == retry.status_code == 201
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotency-Replayed"] == "true"
+        
+        other = sample_participant_data.copy()
+        other["email"] = "other@example.com"
+        response = client.post("/participants/", json=other, headers=headers)
+        assert response.status_code == 422
+    
+    def test_import_participants_csv(self, client, sample_participant_data):
+        """Test POST /participants/import validates, deduplicates and reports progress"""
+        client.post("/participants/", json=sample_participant_data)
+        assert len(client.get("/participants/", params={"fields": "id,email"}).json()) == 1
+        body = "\n".join([
+            "name,email,phone",
+            "Ana,ana@example.com,111",
+            "Ana Again,ana@example.com,222",
+            "Bad,not-an-email,333",
+            f"Existing,{sample_participant_data['email']},444",
+            "Luis,luis@example.com,555",
+            "Long Phone,long@example.com,123456789012345678901"
+        ])
+        
+        response = client.post("/participants/import", content=body, headers={"Content-Type": "text/csv"})
+        assert response.status_code == 202
+        import_id = response.json()["import_id"]
+        
+        status = client.get(f"/participants/import/{import_id}").json()
+        assert status["status"] == "completed"
+        assert status["rows_processed"] == 6
+        assert status["inserted"] == 2
+        assert status["duplicates"] == 2
+        assert status["invalid"] == 2
+        assert {"line": 4, "error": "Invalid email format"} in status["errors"]
+        assert {"line": 7, "error": "Phone is longer than 20 characters"} in status["errors"]
+        assert len(client.get("/participants/").json()) == 3
+        assert len(client.get("/participants/", params={"fields": "id,email"}).json()) == 3
 
 
 @pytest.mark.system
@@ -168,13 +357,13 @@ class TestAttendanceEndpoints:
         
         assert response.status_code == 400
     
-    def test_capacity_validation(self, client, sample_participant_data):
+    def test_capacity_validation(self, client, sample_event_data, sample_participant_data):
         """Test that event capacity is enforced"""
         # Create event with capacity of 1
         event_data = {
+            **sample_event_data,
             "name": "Small Event",
             "description": "Test",
-            "date": "2025-12-31T10:00:00",
             "location": "Test",
             "capacity": 1
         }
@@ -199,4 +388,172 @@ class TestAttendanceEndpoints:
         response = client.post("/attendances/", json={"event_id": event_id, "participant_id": p2_id})
         
         assert response.status_code == 400
-        assert "capacity" in response.json()["detail"].lower()
\ No newline at end of file
+        assert "capacity" in response.json()["detail"].lower()
+    
+    def test_event_roster_and_participant_schedule(self, client, sample_event_data, sample_participant_data):
+        """Test roster/schedule JOIN endpoints and their invalidation on participant and event updates"""
+        event_id = client.post("/events/", json=sample_event_data).json()["id"]
+        participant_id = client.post("/participants/", json=sample_participant_data).json()["id"]
+        client.post("/attendances/", json={"event_id": event_id, "participant_id": participant_id})
+        
+        roster = client.get(f"/attendances/event/{event_id}/roster").json()
+        assert len(roster) == 1
+        assert roster[0]["participant_email"] == sample_participant_data["email"]
+        
+        schedule = client.get(f"/attendances/participant/{participant_id}/schedule").json()
+        assert schedule[0]["event_name"] == sample_event_data["name"]
+        
+        updated = sample_participant_data.copy()
+        updated["name"] = "Renamed Participant"
+        client.put(f"/participants/{participant_id}", json=updated)
+        
+        roster = client.get(f"/attendances/event/{event_id}/roster").json()
+        assert roster[0]["participant_name"] == "Renamed Participant"
+        assert client.get(f"/attendances/event/{event_id}/roster", params={"skip": 1}).json() == []
+        
+        client.put(f"/events/{event_id}", json={**sample_event_data, "name": "Renamed Event"})
+        
+        schedule = client.get(f"/attendances/participant/{participant_id}/schedule").json()
+        assert schedule[0]["event_name"] == "Renamed Event"
+    
+    def test_get_attendances_sparse_fields(self, client, sample_event_data, sample_participant_data):
+        """Test ?fields= on attendance lists, refreshed after a cancellation"""
+        event_id = client.post("/events/", json=sample_event_data).json()["id"]
+        participant_id = client.post("/participants/", json=sample_participant_data).json()["id"]
+        attendance_id = client.post(
+            "/attendances/",
+            json={"event_id": event_id, "participant_id": participant_id}
+        ).json()["id"]
+        
+        by_event = client.get(f"/attendances/event/{event_id}", params={"fields": "participant_id"}).json()
+        by_participant = client.get(
+            f"/attendances/participant/{participant_id}",
+            params={"fields": "id,event_id"}
+        ).json()
+        
+        assert by_event == [{"participant_id": participant_id}]
+        assert by_participant == [{"id": attendance_id, "event_id": event_id}]
+        
+        client.delete(f"/attendances/{attendance_id}")
+        assert client.get(f"/attendances/event/{event_id}", params={"fields": "participant_id"}).json() == []
+    
+    def test_export_event_roster(self, client, sample_event_data, sample_participant_data):
+        """Test GET /attendances/event/{id}/export streams CSV and NDJSON"""
+        event_id = client.post("/events/", json=sample_event_data).json()["id"]
+        participant_id = client.post("/participants/", json=sample_participant_data).json()["id"]
+        client.post("/attendances/", json={"event_id": event_id, "participant_id": participant_id})
+        
+        response = client.get(f"/attendances/event/{event_id}/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        lines = response.text.strip().splitlines()
+        assert lines[0].startswith("attendance_id,")
+        assert sample_participant_data["email"] in lines[1]
+        
+        response = client.get(f"/attendances/event/{event_id}/export", params={"format": "ndjson"})
+        assert response.json()["participant_id"] == participant_id
+        
+        assert client.get(f"/attendances/event/{event_id}/export", params={"format": "xml"}).status_code == 422
+        assert client.get("/attendances/event/98765/export").status_code == 404
+
+
+@pytest.mark.system
+class TestMetricsEndpoint:
+    """System tests for the Prometheus metrics endpoint"""
+    
+    def _sample(self, name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0.0
+    
+    def test_requests_labelled_by_route_template(self, client):
+        """Test requests are counted per route template and status, not per raw path"""
+        labels = {"method": "GET", "route": "/events/{event_id}", "status": "404"}
+        before = self._sample("eventia_http_requests_total", **labels)
+        
+        client.get("/events/98765")
+        client.get("/events/98766")
+        
+        assert self._sample("eventia_http_requests_total", **labels) == before + 2
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'eventia_http_request_duration_seconds_bucket{le="0.001",method="GET",route="/events/{event_id}"}' in response.text
+        assert "eventia_http_requests_in_progress" in response.text
+        assert "eventia_cache_redis_connected" in response.text
+        assert "/events/98765" not in response.text
+    
+    def test_cache_lookups_counted(self, client, sample_event_data):
+        """Test cache misses and hits feed the hit-ratio counters"""
+        hits = self._sample("eventia_cache_lookups_total", result="hit")
+        misses = self._sample("eventia_cache_lookups_total", result="miss")
+        event_id = client.post("/events/", json=sample_event_data).json()["id"]
+        
+        client.get("/events/98767")
+        client.get(f"/events/{event_id}")
+        client.get(f"/events/{event_id}")
+        
+        assert self._sample("eventia_cache_lookups_total", result="miss") > misses
+        assert self._sample("eventia_cache_lookups_total", result="hit") > hits
+    
+    def test_not_mounted_when_disabled(self):
+        """Test /metrics does not exist while metrics are disabled"""
+        disabled = FastAPI()
+        mount_metrics(disabled, enabled=False)
+        
+        assert TestClient(disabled).get("/metrics").status_code == 404
+
+
+@pytest.mark.system
+class TestAdminEndpoints:
+    """System tests for the admin endpoints"""
+    
+    def test_admin_requires_token(self, client, monkeypatch):
+        """Test admin routes are hidden without a configured token and need the right one"""
+        monkeypatch.setattr(settings, "admin_token", None)
+        assert client.get("/admin/slow-queries").status_code == 404
+        
+        monkeypatch.setattr(settings, "admin_token", "s3cret")
+        assert client.get("/admin/slow-queries").status_code == 403
+        assert client.get("/admin/slow-queries", headers={"X-Admin-Token": "wrong"}).status_code == 403
+        response = client.get("/admin/slow-queries", headers={"X-Admin-Token": "s3cret"})
+        assert response.status_code == 200
+        assert "queries" in response.json()
+    
+    def test_profile_worker(self, client, monkeypatch):
+        """Test POST /admin/profile returns collapsed stacks for the requested duration"""
+        monkeypatch.setattr(settings, "admin_token", "s3cret")
+        
+        response = client.post("/admin/profile", params={"seconds": 0.1}, headers={"X-Admin-Token": "s3cret"})
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert int(response.headers["x-profile-samples"]) > 0
+        assert client.post("/admin/profile", params={"seconds": 3600}, headers={"X-Admin-Token": "s3cret"}).status_code == 422
+    
+    def test_memory_endpoints(self, client, monkeypatch):
+        """Test the memory report, snapshot and diff admin endpoints"""
+        monkeypatch.setattr(settings, "admin_token", "s3cret")
+        headers = {"X-Admin-Token": "s3cret"}
+        
+        report = client.get("/admin/memory", headers=headers).json()
+        assert set(report["census"]) == {"entities", "orm_models", "dtos"}
+        assert report["memory_cache"]["entries"] >= 0
+        
+        assert client.get("/admin/memory/diff", headers=headers).status_code == 409
+        assert client.post("/admin/memory/snapshot", headers=headers).status_code == 204
+        try:
+            diff = client.get("/admin/memory/diff", headers=headers).json()
+            assert "retained_bytes" in diff and "top" in diff
+        finally:
+            assert client.delete("/admin/memory/snapshot", headers=headers).status_code == 204
+    
+    def test_event_reads_stay_within_memory_budget(self, client, sample_event_data, retained_memory):
+        """Test repeated event reads do not retain allocations"""
+        event_id = client.post("/events/", json=sample_event_data).json()["id"]
+        # Warm up caches and lazy imports
+        client.get("/events/", params={"detail": True})
+        client.get(f"/events/{event_id}")
+        
+        with retained_memory(budget_bytes=64 * 1024):
+            for _ in range(20):
+                client.get("/events/", params={"detail": True})
+                client.get(f"/events/{event_id}")
@@ -0,0 +1,173 @@
+from datetime import datetime, timedelta
+import pytest
+from fastapi.routing import APIRoute
+from src.application.routes import attendance_routes, event_routes, participant_routes
+from src.infrastructure.cache.cache_client import cache_client
+
+IMPORT_CSV = "name,email,phone\nImported One,one@example.com,111\nImported Two,two@example.com,222\n"
+
+# Events must be in the future to accept registrations
+EVENT_DATE = (datetime.utcnow() + timedelta(days=365)).replace(microsecond=0).isoformat()
+
+OTHER_EVENT = {
+    "name": "Other Event", "description": "Another event", "date": EVENT_DATE,
+    "location": "Other Location", "capacity": 10
+}
+NEW_PARTICIPANT = {"name": "New Participant", "email": "new@example.com", "phone": "5550000"}
+
+# Most SQL statements and cache calls one request may make, per route and cache state.
+# "warm": the same request ran just before; "cold": every cache entry was dropped first;
+# anything else runs right after seeding. Background tasks (imports) count too.
+QUERY_BUDGETS = [
+    # route, scenario, request(ids) -> (method, url, kwargs), max SQL, max cache calls
+    ("POST /events/", "create", lambda ids: ("post", "/events/", {"json": OTHER_EVENT}), 1, 1),
+    ("GET /events/{event_id}", "warm", lambda ids: ("get", f"/events/{ids['event']}", {}), 0, 1),
+    ("GET /events/{event_id}", "cold", lambda ids: ("get", f"/events/{ids['event']}", {}), 1, 2),
+    ("GET /events/", "warm", lambda ids: ("get", "/events/", {}), 0, 1),
+    ("GET /events/", "cold", lambda ids: ("get", "/events/", {}), 1, 2),
+    ("GET /events/", "warm detail", lambda ids: ("get", "/events/", {"params": {"detail": "true"}}), 0, 1),
+    ("GET /events/", "warm fields", lambda ids: ("get", "/events/", {"params": {"fields": "id,name"}}), 0, 1),
+    ("GET /events/", "warm ids", lambda ids: ("get", "/events/", {"params": {"ids": str(ids["event"])}}), 0, 1),
+    ("GET /events/", "cold ids", lambda ids: ("get", "/events/", {"params": {"ids": str(ids["event"])}}), 1, 2),
+    ("PUT /events/{event_id}", "update", lambda ids: ("put", f"/events/{ids['event']}", {"json": OTHER_EVENT}), 2, 1),
+    ("DELETE /events/{event_id}", "delete", lambda ids: ("delete", f"/events/{ids['empty_event']}", {}), 1, 1),
+    ("GET /events/{event_id}/statistics", "warm", lambda ids: ("get", f"/events/{ids['event']}/statistics", {}), 0, 1),
+    ("GET /events/{event_id}/statistics", "cold", lambda ids: ("get", f"/events/{ids['event']}/statistics", {}), 2, 2),
+
+    ("POST /participants/", "create", lambda ids: ("post", "/participants/", {"json": NEW_PARTICIPANT}), 2, 1),
+    ("POST /participants/", "idempotent", lambda ids: (
+        "post", "/participants/", {"json": NEW_PARTICIPANT, "headers": {"Idempotency-Key": "budget-participant"}}
+    ), 2, 3),
+    ("POST /participants/import", "import", lambda ids: (
+        "post", "/participants/import", {"content": IMPORT_CSV, "headers": {"Content-Type": "text/csv"}}
+    ), 2, 6),
+    ("GET /participants/import/{import_id}", "status", lambda ids: (
+        "get", f"/participants/import/{ids['import']}", {}
+    ), 0, 1),
+    ("GET /participants/{participant_id}", "warm", lambda ids: ("get", f"/participants/{ids['participant']}", {}), 0, 1),
+    ("GET /participants/{participant_id}", "cold", lambda ids: ("get", f"/participants/{ids['participant']}", {}), 1, 2),
+    ("GET /participants/", "warm", lambda ids: ("get", "/participants/", {}), 0, 1),
+    ("GET /participants/", "cold", lambda ids: ("get", "/participants/", {}), 1, 2),
+    ("GET /participants/", "warm ids", lambda ids: (
+        "get", "/participants/", {"params": {"ids": str(ids["participant"])}}
+    ), 0, 1),
+    ("GET /participants/", "cold ids", lambda ids: (
+        "get", "/participants/", {"params": {"ids": str(ids["participant"])}}
+    ), 1, 2),
+    ("PUT /participants/{participant_id}", "update", lambda ids: (
+        "put", f"/participants/{ids['participant']}", {"json": {**NEW_PARTICIPANT, "email": "renamed@example.com"}}
+    ), 3, 1),
+    ("DELETE /participants/{participant_id}", "delete", lambda ids: (
+        "delete", f"/participants/{ids['lone_participant']}", {}
+    ), 2, 1),
+
+    ("POST /attendances/", "register", lambda ids: (
+        "post", "/attendances/", {"json": {"event_id": ids["event"], "participant_id": ids["lone_participant"]}}
+    ), 5, 1),
+    ("POST /attendances/", "idempotent", lambda ids: (
+        "post", "/attendances/", {
+            "json": {"event_id": ids["event"], "participant_id": ids["lone_participant"]},
+            "headers": {"Idempotency-Key": "budget-attendance"}
+        }
+    ), 5, 3),
+    ("GET /attendances/{attendance_id}", "cold", lambda ids: ("get", f"/attendances/{ids['attendance']}", {}), 1, 0),
+    ("GET /attendances/event/{event_id}", "warm", lambda ids: (
+        "get", f"/attendances/event/{ids['event']}", {}
+    ), 0, 1),
+    ("GET /attendances/event/{event_id}", "cold", lambda ids: (
+        "get", f"/attendances/event/{ids['event']}", {}
+    ), 1, 2),
+    ("GET /attendances/participant/{participant_id}", "warm", lambda ids: (
+        "get", f"/attendances/participant/{ids['participant']}", {}
+    ), 0, 1),
+    ("GET /attendances/participant/{participant_id}", "cold", lambda ids: (
+        "get", f"/attendances/participant/{ids['participant']}", {}
+    ), 1, 2),
+    ("GET /attendances/event/{event_id}/roster", "warm", lambda ids: (
+        "get", f"/attendances/event/{ids['event']}/roster", {}
+    ), 0, 1),
+    ("GET /attendances/event/{event_id}/roster", "cold", lambda ids: (
+        "get", f"/attendances/event/{ids['event']}/roster", {}
+    ), 1, 2),
+    ("GET /attendances/event/{event_id}/export", "cold", lambda ids: (
+        "get", f"/attendances/event/{ids['event']}/export", {}
+    ), 2, 0),
+    ("GET /attendances/participant/{participant_id}/schedule", "warm", lambda ids: (
+        "get", f"/attendances/participant/{ids['participant']}/schedule", {}
+    ), 0, 1),
+    ("GET /attendances/participant/{participant_id}/schedule", "cold", lambda ids: (
+        "get", f"/attendances/participant/{ids['participant']}/schedule", {}
+    ), 1, 2),
+    ("DELETE /attendances/{attendance_id}", "cancel", lambda ids: (
+        "delete", f"/attendances/{ids['attendance']}", {}
+    ), 2, 1),
+]
+
+
+def _created(response, status_code: int = 201) -> dict:
+    assert response.status_code == status_code, f"seeding failed: {response.status_code} {response.text}"
+    return response.json()
+
+
+@pytest.fixture
+def seeded_ids(client, sample_event_data, sample_participant_data):
+    """IDs of one event with one attendee, plus an empty event, a lone participant and an import"""
+    # The in-process cache outlives each test's database; start from nothing
+    cache_client.memory_cache.clear_pattern("*")
+    event_id = _created(client.post("/events/", json=sample_event_data))["id"]
+    empty_event_id = _created(client.post("/events/", json={**sample_event_data, "name": "Empty Event"}))["id"]
+    participant_id = _created(client.post("/participants/", json=sample_participant_data))["id"]
+    lone_participant_id = _created(client.post(
+        "/participants/", json={**sample_participant_data, "email": "lone@example.com"}
+    ))["id"]
+    attendance_id = _created(client.post(
+        "/attendances/", json={"event_id": event_id, "participant_id": participant_id}
+    ))["id"]
+    import_id = _created(client.post(
+        "/participants/import", content="name,email,phone\n", headers={"Content-Type": "text/csv"}
+    ), status_code=202)["import_id"]
+    return {
+        "event": event_id, "empty_event": empty_event_id, "participant": participant_id,
+        "lone_participant": lone_participant_id, "attendance": attendance_id, "import": import_id
+    }
+
+
+def _route_keys(router) -> set:
+    return {
+        f"{method} {route.path}"
+        for route in router.routes if isinstance(route, APIRoute)
+        for method in route.methods
+    }
+
+
+@pytest.mark.system
+class TestQueryBudgets:
+    """SQL statement and cache call budgets per route"""
+
+    def test_every_route_has_a_budget(self):
+        """Test every event, participant and attendance route declares at least one budget"""
+        routes = set()
+        for module in (event_routes, participant_routes, attendance_routes):
+            routes |= _route_keys(module.router)
+        budgeted = {route for route, *_ in QUERY_BUDGETS}
+
+        assert routes - budgeted == set()
+        assert budgeted - routes == set()
+
+    @pytest.mark.parametrize(
+        "route,scenario,build_request,sql,cache",
+        QUERY_BUDGETS,
+        ids=[f"{route} [{scenario}]" for route, scenario, *_ in QUERY_BUDGETS]
+    )
+    def test_request_stays_within_budget(self, client, query_counter, seeded_ids, route, scenario, build_request, sql, cache):
+        """Test the request's SQL statements and cache calls stay within the route's budget"""
+        method, url, kwargs = build_request(seeded_ids)
+        send = getattr(client, method)
+        if scenario.startswith("warm"):
+            send(url, **kwargs)
+        elif scenario.startswith("cold"):
+            cache_client.memory_cache.clear_pattern("*")
+
+        count = query_counter.assert_within(send, url, sql=sql, cache=cache, **kwargs)
+
+        assert count.status_code < 400
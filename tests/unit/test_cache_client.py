@@ -0,0 +1,112 @@
+import pytest
+from src.infrastructure.cache.cache_client import CacheClient, InMemoryCache
+
+
+@pytest.mark.unit
+class TestCacheClient:
+    """Unit tests for the cache client"""
+    
+    def test_connects_lazily(self):
+        """Test constructing the client does not touch Redis"""
+        client = CacheClient()
+        assert client._connected is False
+        assert client.redis_client is None
+    
+    def test_in_memory_add_and_clear_pattern(self):
+        """Test the in-memory fallback supports add (set-if-absent) and pattern deletes"""
+        cache = InMemoryCache()
+        assert cache.add("roster:1:0", [1]) is True
+        assert cache.add("roster:1:0", [2]) is False
+        cache.set("roster:1:100", [3])
+        cache.set("roster:2:0", [4])
+        
+        assert cache.clear_pattern("roster:1:*") == 2
+        assert cache.get("roster:1:0") is None
+        assert cache.get("roster:2:0") == [4]
+    
+    def test_invalidate_deletes_tracked_keys_in_memory(self):
+        """Test keys cached under a group are deleted with the group, others are kept"""
+        client = CacheClient()
+        client._connected = True
+        client.set_tracked("roster:1:0:100", [1], ["event:1", "participant:7"])
+        client.set_tracked("roster:2:0:100", [2], ["event:2", "participant:7"])
+        client.set("event:1", {"id": 1})
+        
+        client.invalidate(["event:1"], ["event:1"])
+        
+        assert client.get("roster:1:0:100") is None
+        assert client.get("event:1") is None
+        assert client.get("roster:2:0:100") == [2]
+        
+        client.invalidate([], ["participant:7"])
+        assert client.get("roster:2:0:100") is None
+    
+    def test_invalidate_never_scans_redis(self):
+        """Test a group invalidation is one SMEMBERS pipeline and one DEL"""
+        calls = []
+        sets = {"keyset:event:1": {"roster:1:0:100", "roster:1:100:100"}}
+        
+        class RecordingPipeline:
+            def __init__(self):
+                self.commands = []
+            
+            def smembers(self, key):
+                self.commands.append(key)
+            
+            def execute(self):
+                calls.append(("smembers", len(self.commands)))
+                return [sets.get(key, set()) for key in self.commands]
+        
+        class RecordingRedis:
+            def pipeline(self, transaction=True):
+                return RecordingPipeline()
+            
+            def delete(self, *keys):
+                calls.append(("delete", sorted(keys)))
+                return len(keys)
+            
+            def scan_iter(self, **kwargs):
+                raise AssertionError("invalidation must not scan the keyspace")
+        
+        client = CacheClient()
+        client.redis_client, client._use_redis, client._connected = RecordingRedis(), True, True
+        
+        client.invalidate(["event:stats:1"], ["event:1", "event:2"])
+        
+        assert calls == [
+            ("smembers", 2),
+            ("delete", ["event:stats:1", "keyset:event:1", "keyset:event:2", "roster:1:0:100", "roster:1:100:100"])
+        ]
+    
+    def test_get_many_and_set_many_use_one_round_trip(self):
+        """Test multi-gets use a single MGET and backfills a single pipeline"""
+        calls = []
+        
+        class RecordingPipeline:
+            def __init__(self):
+                self.commands = []
+            
+            def setex(self, key, expiration, value):
+                self.commands.append((key, value))
+            
+            def execute(self):
+                calls.append(("execute", len(self.commands)))
+                store.update(self.commands)
+        
+        class RecordingRedis:
+            def mget(self, keys):
+                calls.append(("mget", len(keys)))
+                return [store.get(key) for key in keys]
+            
+            def pipeline(self, transaction=True):
+                return RecordingPipeline()
+        
+        store = {}
+        client = CacheClient()
+        client.redis_client, client._use_redis, client._connected = RecordingRedis(), True, True
+        
+        client.set_many({"event:1": {"id": 1}, "event:2": {"id": 2}})
+        values = client.get_many(["event:2", "event:3", "event:1"])
+        
+        assert values == [{"id": 2}, None, {"id": 1}]
+        assert calls == [("execute", 2), ("mget", 3)]
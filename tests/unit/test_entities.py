@@ -53,6 +53,16 @@ class TestEventEntity:
             capacity=10
         )
         assert past_event.is_future_event() is False
+    
+    def test_event_rehydrate(self):
+        """Test trusted rehydration matches the regular constructor"""
+        date = datetime.now() + timedelta(days=1)
+        stamp = datetime(2030, 1, 1)
+        event = Event.rehydrate(3, "Stored", "Test", date, "Test", 10, stamp, stamp)
+        assert event.id == 3
+        assert event.created_at == stamp
+        assert event.has_capacity(9) is True
+        assert not hasattr(event, "__dict__")
 
 
 @pytest.mark.unit
@@ -86,6 +96,14 @@ class TestParticipantEntity:
                 email="john@example.com",
                 phone="1234567890"
             )
+    
+    def test_participant_rehydrate_skips_validation(self):
+        """Test trusted rehydration keeps stored values without re-validating"""
+        created_at = datetime(2030, 1, 1)
+        participant = Participant.rehydrate(1, "Stored", "legacy-address", "123", created_at, created_at)
+        assert participant.email == "legacy-address"
+        assert participant.created_at == created_at
+        assert not hasattr(participant, "__dict__")
 
 
 @pytest.mark.unit
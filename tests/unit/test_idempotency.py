@@ -0,0 +1,74 @@
+import pytest
+import threading
+import uuid
+from fastapi import HTTPException
+from src.application.idempotency import run_idempotent
+from src.application.dtos.attendance_dto import AttendanceCreateDTO, AttendanceResponseDTO
+
+
+@pytest.mark.unit
+class TestRunIdempotent:
+    """Unit tests for Idempotency-Key handling"""
+    
+    def _payload(self):
+        return AttendanceCreateDTO(event_id=1, participant_id=1)
+    
+    def test_without_key_runs_handler(self):
+        """Test requests without a key are not deduplicated"""
+        calls = []
+        for _ in range(2):
+            run_idempotent("test", None, self._payload(), lambda: calls.append(1), status_code=201)
+        assert len(calls) == 2
+    
+    def test_concurrent_duplicates_are_coalesced(self):
+        """Test a duplicate arriving while the original runs waits for and replays its response"""
+        key = uuid.uuid4().hex
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        
+        def handler():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return AttendanceResponseDTO(
+                id=7,
+                event_id=1,
+                participant_id=1,
+                registration_date="2030-01-01T00:00:00",
+                created_at="2030-01-01T00:00:00"
+            )
+        
+        responses = []
+        original = threading.Thread(
+            target=lambda: responses.append(run_idempotent("test", key, self._payload(), handler, 201))
+        )
+        original.start()
+        started.wait(timeout=5)
+        duplicate = threading.Thread(
+            target=lambda: responses.append(run_idempotent("test", key, self._payload(), handler, 201))
+        )
+        duplicate.start()
+        release.set()
+        original.join()
+        duplicate.join()
+        
+        assert len(calls) == 1
+        assert [r.status_code for r in responses] == [201, 201]
+        assert responses[0].body == responses[1].body
+    
+    def test_client_errors_are_replayed(self):
+        """Test 4xx outcomes are stored and replayed without re-running the handler"""
+        key = uuid.uuid4().hex
+        calls = []
+        
+        def handler():
+            calls.append(1)
+            raise HTTPException(status_code=400, detail="already registered")
+        
+        with pytest.raises(HTTPException):
+            run_idempotent("test", key, self._payload(), handler, 201)
+        replay = run_idempotent("test", key, self._payload(), handler, 201)
+        
+        assert len(calls) == 1
+        assert replay.status_code == 400
@@ -0,0 +1,77 @@
+import os
+import threading
+import time
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api.profiling import RequestProfilerMiddleware
+from src.infrastructure.config.settings import settings
+from src.infrastructure.telemetry import profiler as profiler_module
+from src.infrastructure.telemetry.profiler import ProfileStore, SamplingProfiler
+
+
+def busy_for(seconds: float) -> int:
+    deadline, total = time.perf_counter() + seconds, 0
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+@pytest.mark.unit
+class TestSamplingProfiler:
+    """Unit tests for the sampling profiler"""
+
+    def test_collapsed_stacks_of_busy_thread(self):
+        """Test a busy thread shows up as root-first stacks with sample counts"""
+        worker = threading.Thread(target=busy_for, args=(0.2,), name="busy-worker")
+        profiler = SamplingProfiler(interval_seconds=0.005).start()
+        worker.start()
+        worker.join()
+        collapsed = profiler.stop()
+
+        busy = [line for line in collapsed.splitlines() if line.startswith("busy-worker;")]
+        assert busy
+        stack, count = busy[0].rsplit(" ", 1)
+        assert "busy_for (test_profiler.py:" in stack.split(";")[-1]
+        assert int(count) >= 1
+        assert profiler.samples >= 10
+
+
+@pytest.mark.unit
+class TestRequestProfilerMiddleware:
+    """Unit tests for single-request profiling"""
+
+    def _client(self, store: ProfileStore) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(RequestProfilerMiddleware, store=store)
+
+        # Sync route: runs in the thread pool
+        @app.get("/slow")
+        def slow():
+            return {"total": busy_for(0.1)}
+
+        return TestClient(app)
+
+    def test_profiles_request_with_admin_token(self, monkeypatch):
+        """Test X-Profile with the admin token stores the request's stacks"""
+        monkeypatch.setattr(settings, "admin_token", "s3cret")
+        # The route under test lives here rather than in src/
+        monkeypatch.setattr(profiler_module, "SOURCE_ROOT", os.path.dirname(__file__))
+        store = ProfileStore()
+
+        response = self._client(store).get("/slow", headers={"X-Profile": "1", "X-Admin-Token": "s3cret"})
+
+        assert response.status_code == 200
+        collapsed = store.get(response.headers["x-profile-id"])
+        assert "busy_for (test_profiler.py:" in collapsed
+
+    def test_ignores_profile_header_without_token(self, monkeypatch):
+        """Test requests without a valid admin token are not profiled"""
+        monkeypatch.setattr(settings, "admin_token", "s3cret")
+        store = ProfileStore()
+
+        response = self._client(store).get("/slow", headers={"X-Profile": "1", "X-Admin-Token": "wrong"})
+
+        assert response.status_code == 200
+        assert "x-profile-id" not in response.headers
+        assert store.ids() == {}
@@ -0,0 +1,90 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api.rate_limit import RateLimitMiddleware
+from src.infrastructure.cache.cache_client import CacheClient
+from src.infrastructure.cache.rate_limiter import SlidingWindowRateLimiter
+
+
+def _memory_limiter() -> SlidingWindowRateLimiter:
+    """Limiter on a cache client that never tries Redis"""
+    cache = CacheClient()
+    cache._connected = True
+    return SlidingWindowRateLimiter(cache)
+
+
+@pytest.mark.unit
+class TestSlidingWindowRateLimiter:
+    """Unit tests for the sliding-window limiter"""
+    
+    def test_limits_within_a_window(self):
+        """Test requests over the limit are rejected until the window ends"""
+        limiter = _memory_limiter()
+        
+        results = [limiter.hit("client", 3, 60, now=600.0 + i) for i in range(4)]
+        
+        assert [allowed for allowed, _ in results] == [True, True, True, False]
+        assert results[-1][1] == 57
+    
+    def test_previous_window_decays(self):
+        """Test the previous window only counts for the part still inside the sliding window"""
+        limiter = _memory_limiter()
+        for _ in range(10):
+            limiter.hit("client", 10, 60, now=600.0)
+        
+        # 3/4 into the next window only a quarter of the previous 10 still counts
+        assert limiter.hit("client", 10, 60, now=705.0)[0] is True
+        # Right after the roll-over almost all of them still count
+        other = _memory_limiter()
+        for _ in range(10):
+            other.hit("client", 10, 60, now=600.0)
+        allowed, retry_after = other.hit("client", 10, 60, now=661.0)
+        assert allowed is False
+        assert 1 <= retry_after <= 59
+
+
+@pytest.mark.unit
+class TestRateLimitMiddleware:
+    """Unit tests for the rate limiting middleware"""
+    
+    def _client(self) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=_memory_limiter(),
+            enabled=True,
+            default="2/60",
+            routes={"GET /health": "unlimited", "GET /items/*": "1/60"}
+        )
+        
+        @app.get("/health")
+        def health():
+            return {"status": "healthy"}
+        
+        @app.get("/items/{item_id}")
+        def item(item_id: int):
+            return {"id": item_id}
+        
+        @app.get("/other")
+        def other():
+            return {}
+        
+        return TestClient(app)
+    
+    def test_rejects_with_retry_after(self):
+        """Test the client over a route's rate gets 429 with Retry-After"""
+        client = self._client()
+        
+        assert client.get("/items/1").status_code == 200
+        rejected = client.get("/items/2")
+        
+        assert rejected.status_code == 429
+        assert int(rejected.headers["Retry-After"]) >= 1
+        # Other routes have their own bucket
+        assert client.get("/other").status_code == 200
+    
+    def test_unlimited_routes_pass(self):
+        """Test routes configured as unlimited are never counted"""
+        client = self._client()
+        
+        assert all(client.get("/health").status_code == 200 for _ in range(5))
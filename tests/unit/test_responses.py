@@ -0,0 +1,53 @@
+import pytest
+from fastapi import HTTPException
+from src.application.dtos.event_dto import EventResponseDTO
+from src.application.responses import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    COLUMNAR_MEDIA_TYPE,
+    negotiate_media_type,
+    parse_fields
+)
+
+
+@pytest.mark.unit
+class TestContentNegotiation:
+    """Unit tests for response media type negotiation"""
+    
+    def test_defaults_to_json(self):
+        """Test missing, wildcard and unsupported Accept headers get JSON"""
+        assert negotiate_media_type(None) == JSON_MEDIA_TYPE
+        assert negotiate_media_type("*/*") == JSON_MEDIA_TYPE
+        assert negotiate_media_type("text/html") == JSON_MEDIA_TYPE
+    
+    def test_picks_highest_quality(self):
+        """Test q-values decide between supported media types"""
+        assert negotiate_media_type("application/msgpack") == MSGPACK_MEDIA_TYPE
+        assert negotiate_media_type("application/msgpack;q=0.4, application/json") == JSON_MEDIA_TYPE
+        assert negotiate_media_type(
+            "application/json;q=0.9, application/vnd.eventia.columnar+msgpack"
+        ) == COLUMNAR_MEDIA_TYPE
+    
+    def test_ties_keep_client_order(self):
+        """Test the first of equally weighted media types wins"""
+        assert negotiate_media_type("application/msgpack, application/json") == MSGPACK_MEDIA_TYPE
+
+
+@pytest.mark.unit
+class TestSparseFieldsets:
+    """Unit tests for ?fields= parsing"""
+    
+    def test_normalizes_to_declaration_order(self):
+        """Test equal field sets map to one ordering (and one cache key)"""
+        assert parse_fields("date, name,id,name", EventResponseDTO) == ["id", "name", "date"]
+        assert parse_fields(None, EventResponseDTO) is None
+    
+    def test_rejects_unknown_and_empty(self):
+        """Test unknown or empty field lists are a client error"""
+        with pytest.raises(HTTPException) as unknown:
+            parse_fields("id,password", EventResponseDTO)
+        with pytest.raises(HTTPException) as empty:
+            parse_fields(" , ", EventResponseDTO)
+        
+        assert unknown.value.status_code == 400
+        assert empty.value.status_code == 400
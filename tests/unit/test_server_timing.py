@@ -0,0 +1,66 @@
+import re
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from src.api.server_timing import ServerTimingMiddleware
+from src.application.responses import TimedJSONResponse
+from src.infrastructure.cache.cache_client import CacheClient
+from src.infrastructure.telemetry.request_timings import mark_worker_started
+
+
+def _client(sample_rate: float) -> TestClient:
+    engine = create_engine("sqlite://")
+    cache = CacheClient()
+    cache._connected = True
+    app = FastAPI(default_response_class=TimedJSONResponse)
+    app.add_middleware(ServerTimingMiddleware, sample_rate=sample_rate, enabled=True)
+
+    def worker():
+        mark_worker_started()
+
+    # Sync endpoint: runs in the thread pool like the real routes
+    @app.get("/items", dependencies=[Depends(worker)])
+    def items():
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1")).all()
+            connection.execute(text("SELECT 2")).all()
+        cache.get("items")
+        cache.set("items", [1, 2])
+        cache.get("items")
+        return [{"id": i} for i in range(100)]
+
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestServerTimingMiddleware:
+    """Unit tests for the Server-Timing middleware"""
+
+    def test_sampled_request_has_breakdown(self):
+        """Test a sampled response reports DB, cache, serialization and queue timings"""
+        response = _client(sample_rate=1.0).get("/items")
+
+        assert response.status_code == 200
+        header = response.headers["server-timing"]
+        assert re.search(r'db;dur=[\d.]+;desc="2 queries"', header)
+        assert re.search(r'cache;dur=[\d.]+;desc="3 calls, 1 hits"', header)
+        assert re.search(r"serialize;dur=[\d.]+", header)
+        assert re.search(r"queue;dur=[\d.]+", header)
+        assert re.search(r"total;dur=[\d.]+", header)
+
+    def test_sampled_request_is_logged(self, caplog):
+        """Test a sampled request is logged as one JSON line"""
+        with caplog.at_level("INFO", logger="eventia.timing"):
+            _client(sample_rate=1.0).get("/items")
+
+        assert len(caplog.records) == 1
+        assert '"path": "/items"' in caplog.records[0].message
+        assert '"db_queries": 2' in caplog.records[0].message
+
+    def test_unsampled_request_has_no_header(self):
+        """Test requests outside the sample are left untouched"""
+        response = _client(sample_rate=0.0).get("/items")
+
+        assert response.status_code == 200
+        assert "server-timing" not in response.headers
@@ -0,0 +1,68 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models.participant_model import ParticipantModel  # noqa: F401 (FK target)
+from src.infrastructure.database.repositories.event_repository_impl import EventRepositoryImpl
+from src.infrastructure.telemetry.slow_queries import SlowQueryLog, normalize_sql, redact_parameters
+
+
+@pytest.mark.unit
+class TestSlowQueryHelpers:
+    """Unit tests for statement fingerprinting and parameter redaction"""
+
+    def test_normalize_sql(self):
+        """Test literals, IN lists and whitespace do not split fingerprints"""
+        assert normalize_sql("SELECT *\n  FROM events WHERE id IN (?, ?, ?) AND name = 'x' LIMIT 10") == \
+            "SELECT * FROM events WHERE id IN (...) AND name = ? LIMIT ?"
+        assert normalize_sql("SELECT * FROM events WHERE id IN (%(id_1_1)s, %(id_1_2)s)") == \
+            "SELECT * FROM events WHERE id IN (...)"
+
+    def test_redact_parameters(self):
+        """Test only parameter types are kept"""
+        assert redact_parameters({"email": "a@b.c", "id": 3}) == {"email": "str", "id": "int"}
+        assert redact_parameters(("secret", 1.5)) == ["str", "float"]
+        assert redact_parameters([("a",), ("b",)]) == [["str"], "... 2 rows"]
+
+
+@pytest.mark.unit
+class TestSlowQueryLog:
+    """Unit tests for the slow query log"""
+
+    def test_records_and_aggregates_slow_statements(self):
+        """Test slow statements are grouped by fingerprint with caller and plan"""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine)
+        log = SlowQueryLog(threshold_ms=0, explain_sample_rate=1.0, max_fingerprints=10)
+        log.install(engine)
+        try:
+            with sessionmaker(bind=engine)() as session:
+                repository = EventRepositoryImpl(session)
+                repository.get_all()
+                repository.get_all()
+        finally:
+            log.uninstall(engine)
+
+        report = log.report()
+        entry = next(e for e in report if e["statement"].startswith("SELECT") and "FROM events" in e["statement"])
+        assert entry["count"] == 2
+        assert entry["callers"] == {"EventRepositoryImpl.get_all": 2}
+        assert entry["plan"] and "SCAN" in " ".join(entry["plan"])
+
+    def test_fast_statements_and_eviction(self):
+        """Test statements under the threshold are ignored and the cheapest fingerprint is evicted"""
+        log = SlowQueryLog(threshold_ms=50, explain_sample_rate=0.0, max_fingerprints=2)
+        log.record("SELECT 1 FROM events", {}, 0.2)
+        log.record("SELECT 1 FROM participants", {}, 0.1)
+        log.record("SELECT 1 FROM attendances", {}, 0.3)
+
+        statements = [entry["statement"] for entry in log.report()]
+        assert statements == ["SELECT ? FROM attendances", "SELECT ? FROM events"]
+
+        engine = create_engine("sqlite://")
+        log.install(engine)
+        with engine.connect() as connection:
+            connection.exec_driver_sql("SELECT 1")
+        log.uninstall(engine)
+        assert len(log.report()) == 2